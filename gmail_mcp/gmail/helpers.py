@@ -4,7 +4,14 @@ Gmail Helper Functions
 This module provides helper functions for processing Gmail API responses.
 """
 
-from typing import Dict, Any
+import binascii
+from typing import Dict, Any, Optional
+
+# Maps the base64url alphabet onto standard base64
+_URLSAFE_TO_STANDARD = bytes.maketrans(b"-_", b"+/")
+
+# Shared fallback for missing nested dicts, so lookups don't allocate a new {}
+_EMPTY: Dict[str, Any] = {}
 
 
 def extract_email_info(msg: Dict[str, Any]) -> Dict[str, Any]:
@@ -62,3 +69,57 @@ def extract_headers(msg: Dict[str, Any]) -> Dict[str, str]:
         Dict mapping lowercase header names to their values.
     """
     return {h["name"].lower(): h["value"] for h in msg.get("payload", {}).get("headers", [])}
+
+
+def b64url_decode(data: str) -> bytes:
+    """
+    Decode base64url data, padded or not.
+
+    Calls binascii directly instead of going through base64.urlsafe_b64decode's
+    wrappers. a2b_base64 ignores padding past the end of the data, so
+    appending "==" handles unpadded input.
+
+    Args:
+        data: The base64url-encoded string, as found in Gmail message bodies.
+
+    Returns:
+        The decoded bytes.
+    """
+    return binascii.a2b_base64(data.encode("ascii").translate(_URLSAFE_TO_STANDARD) + b"==")
+
+
+def find_body_data(payload: Dict[str, Any], plain_only: bool = False) -> Optional[str]:
+    """
+    Find the base64url body data of a message payload.
+
+    Returns the first text/plain part in document order, else the first
+    text/html part, walking nested multiparts depth-first with an explicit
+    stack. A single-part payload returns its own body data.
+
+    Args:
+        payload: The "payload" of a Gmail API message.
+        plain_only: If True, never fall back to a text/html part.
+
+    Returns:
+        The base64url body data, or None if the payload has no text body.
+    """
+    parts = payload.get("parts")
+    if not parts:
+        return (payload.get("body") or _EMPTY).get("data")
+
+    plain_data = html_data = None
+    stack = parts[::-1]
+    while stack:
+        part = stack.pop()
+        subparts = part.get("parts")
+        if subparts:
+            stack.extend(subparts[::-1])
+            continue
+        mime_type = part.get("mimeType")
+        if mime_type == "text/plain":
+            plain_data = (part.get("body") or _EMPTY).get("data")
+            if plain_data:
+                break
+        elif mime_type == "text/html" and not plain_only and not html_data:
+            html_data = (part.get("body") or _EMPTY).get("data")
+    return plain_data or html_data
@@ -1,6 +1,8 @@
 """Type stubs for gmail helpers module."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 def extract_email_info(msg: Dict[str, Any]) -> Dict[str, Any]: ...
 def extract_headers(msg: Dict[str, Any]) -> Dict[str, str]: ...
+def b64url_decode(data: str) -> bytes: ...
+def find_body_data(payload: Dict[str, Any], plain_only: bool = False) -> Optional[str]: ...
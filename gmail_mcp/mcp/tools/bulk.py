@@ -371,6 +371,101 @@ def setup_bulk_tools(mcp: FastMCP) -> None:
             logger.error(f"Failed to cleanup old emails: {e}")
             return {"success": False, "error": f"Failed to cleanup old emails: {e}"}
 
+    @mcp.tool()
+    def mark_many_as_read(email_ids: List[str]) -> Dict[str, Any]:
+        """
+        Mark several emails as read in one request.
+
+        Uses Gmail's batchModify endpoint instead of one modify call per email.
+
+        Args:
+            email_ids (List[str]): The IDs of the emails to mark as read
+
+        Returns:
+            Dict[str, Any]: Results of the bulk operation
+        """
+        credentials = get_credentials()
+
+        if not credentials:
+            return {"success": False, "error": "Not authenticated. Please use the authenticate tool first."}
+
+        if not email_ids:
+            return {"success": True, "message": "No emails given.", "marked": 0, "failed": 0}
+
+        try:
+            service = get_gmail_service(credentials)
+
+            marked, failed = _batch_modify_emails(
+                service,
+                email_ids,
+                remove_labels=["UNREAD"]
+            )
+
+            return {
+                "success": True,
+                "message": f"Marked {marked} emails as read.",
+                "marked": marked,
+                "failed": failed
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to mark emails as read: {e}")
+            return {"success": False, "error": f"Failed to mark emails as read: {e}"}
+
+    @mcp.tool()
+    def set_labels(
+        email_ids: List[str],
+        add: Optional[List[str]] = None,
+        remove: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Add and remove labels on several emails in one request.
+
+        Both label changes are applied by a single batchModify call per
+        1000 emails, e.g. add=["STARRED"], remove=["UNREAD"].
+
+        Args:
+            email_ids (List[str]): The IDs of the emails to modify
+            add (List[str], optional): Label IDs to add
+            remove (List[str], optional): Label IDs to remove
+
+        Returns:
+            Dict[str, Any]: Results of the bulk operation
+        """
+        credentials = get_credentials()
+
+        if not credentials:
+            return {"success": False, "error": "Not authenticated. Please use the authenticate tool first."}
+
+        if not add and not remove:
+            return {"success": False, "error": "Provide at least one label to add or remove."}
+
+        if not email_ids:
+            return {"success": True, "message": "No emails given.", "modified": 0, "failed": 0}
+
+        try:
+            service = get_gmail_service(credentials)
+
+            modified, failed = _batch_modify_emails(
+                service,
+                email_ids,
+                add_labels=add,
+                remove_labels=remove
+            )
+
+            return {
+                "success": True,
+                "message": f"Updated labels on {modified} emails.",
+                "modified": modified,
+                "failed": failed,
+                "added": add or [],
+                "removed": remove or []
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to set labels: {e}")
+            return {"success": False, "error": f"Failed to set labels: {e}"}
+
 
 def _batch_modify_emails(
     service,
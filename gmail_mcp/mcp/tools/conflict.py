@@ -4,21 +4,82 @@ Calendar Conflict Detection Tools Module
 Handles multi-calendar awareness and conflict detection.
 """
 
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta, timezone
+import threading
+from time import monotonic
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import date, datetime, time, timedelta, timezone
 
 import dateutil.parser as parser
 
 from mcp.server.fastmcp import FastMCP
 
 from gmail_mcp.utils.logger import get_logger
-from gmail_mcp.utils.services import get_calendar_service
+from gmail_mcp.utils.services import get_calendar_service, get_credentials_hash
 from gmail_mcp.utils.date_parser import parse_natural_date, parse_working_hours, parse_duration, DATE_PARSING_HINT
 from gmail_mcp.auth.oauth import get_credentials
 from gmail_mcp.calendar.processor import get_user_timezone
 
 logger = get_logger(__name__)
 
+# Maximum calendars the Calendar API accepts in a single freebusy query
+FREEBUSY_MAX_CALENDARS = 50
+
+# How long a freebusy response is reused for an identical query. Busy data
+# changes, so this only covers repeated lookups within a short window.
+FREEBUSY_CACHE_TTL_SECONDS = 300
+
+_freebusy_cache: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
+_freebusy_cache_lock = threading.Lock()
+
+
+def _query_freebusy(service: Any, credentials: Any, body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run a freebusy query, reusing a recent response for an identical query.
+
+    Args:
+        service: Calendar API service
+        credentials: Credentials the service was built with (part of the cache key)
+        body: freebusy query body
+
+    Returns:
+        Dict[str, Any]: freebusy query response
+    """
+    key = (
+        get_credentials_hash(credentials),
+        body["timeMin"],
+        body["timeMax"],
+        body.get("timeZone"),
+        tuple(sorted(item["id"] for item in body["items"])),
+    )
+    now = monotonic()
+
+    with _freebusy_cache_lock:
+        cached = _freebusy_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+    result = service.freebusy().query(body=body).execute()
+
+    with _freebusy_cache_lock:
+        expired = [k for k, (expires_at, _) in _freebusy_cache.items() if expires_at <= now]
+        for k in expired:
+            del _freebusy_cache[k]
+        _freebusy_cache[key] = (now + FREEBUSY_CACHE_TTL_SECONDS, result)
+
+    return result
+
+
+def _format_display_time(dt: datetime) -> str:
+    """Format a time as "HH:MM AM/PM", matching strftime("%I:%M %p") without the locale lookup."""
+    hour = dt.hour
+    return f"{hour % 12 or 12:02d}:{dt.minute:02d} {'AM' if hour < 12 else 'PM'}"
+
+
+def clear_freebusy_cache() -> None:
+    """Clear cached freebusy responses."""
+    with _freebusy_cache_lock:
+        _freebusy_cache.clear()
+
 
 def setup_conflict_tools(mcp: FastMCP) -> None:
     """Set up calendar conflict detection tools on the FastMCP application."""
@@ -638,19 +699,28 @@ def setup_conflict_tools(mcp: FastMCP) -> None:
                 if end_dt.tzinfo is None:
                     end_dt = end_dt.replace(tzinfo=timezone.utc)
 
-            # Build freebusy query
-            freebusy_query = {
-                "timeMin": start_dt.isoformat(),
-                "timeMax": end_dt.isoformat(),
-                "timeZone": user_tz,
-                "items": [{"id": email} for email in attendees]
-            }
-
-            # Execute freebusy query
-            freebusy_result = service.freebusy().query(body=freebusy_query).execute()
+            # Query on whole hours so repeated lookups over the same range
+            # share a cached response; results are trimmed back below
+            query_start = start_dt.replace(minute=0, second=0, microsecond=0)
+            query_end = end_dt.replace(minute=0, second=0, microsecond=0)
+            if query_end < end_dt:
+                query_end += timedelta(hours=1)
+
+            # One freebusy query covers every attendee (up to the API's
+            # per-query calendar limit), so drop duplicates before batching
+            attendees = list(dict.fromkeys(attendees))
+            calendars_info = {}
+            for i in range(0, len(attendees), FREEBUSY_MAX_CALENDARS):
+                freebusy_query = {
+                    "timeMin": query_start.isoformat(),
+                    "timeMax": query_end.isoformat(),
+                    "timeZone": user_tz,
+                    "items": [{"id": email} for email in attendees[i:i + FREEBUSY_MAX_CALENDARS]]
+                }
+                freebusy_result = _query_freebusy(service, credentials, freebusy_query)
+                calendars_info.update(freebusy_result.get("calendars", {}))
 
             # Process results
-            calendars_info = freebusy_result.get("calendars", {})
             individual_availability = {}
             all_busy_times = []
             errors = []
@@ -665,103 +735,132 @@ def setup_conflict_tools(mcp: FastMCP) -> None:
                     })
                     continue
 
-                busy_periods = cal_info.get("busy", [])
-                individual_availability[email] = {
-                    "busy_periods": len(busy_periods),
-                    "busy_times": [
-                        {
-                            "start": period["start"],
-                            "end": period["end"]
-                        }
-                        for period in busy_periods
-                    ]
-                }
-
-                # Collect all busy times for finding common free slots
-                for period in busy_periods:
+                # Trim busy periods back to the requested range, as the
+                # query itself covered the surrounding whole hours
+                busy_times = []
+                for period in cal_info.get("busy", []):
                     busy_start = parser.parse(period["start"])
                     busy_end = parser.parse(period["end"])
-                    all_busy_times.append((busy_start, busy_end))
+                    if busy_end <= start_dt or busy_start >= end_dt:
+                        continue
 
-            # Sort and merge overlapping busy times
+                    busy_times.append({
+                        "start": period["start"] if busy_start >= start_dt else start_dt.isoformat(),
+                        "end": period["end"] if busy_end <= end_dt else end_dt.isoformat()
+                    })
+
+                    # Collect all busy times for finding common free slots
+                    all_busy_times.append((max(busy_start, start_dt), min(busy_end, end_dt)))
+
+                individual_availability[email] = {
+                    "busy_periods": len(busy_times),
+                    "busy_times": busy_times
+                }
+
+            # Sort and merge every attendee's busy times into one union. The
+            # merged intervals are disjoint, so both bound lists end up sorted.
             all_busy_times.sort(key=lambda x: x[0])
-            merged_busy = []
+            busy_starts = []
+            busy_ends = []
             for start, end in all_busy_times:
-                if merged_busy and start <= merged_busy[-1][1]:
-                    merged_busy[-1] = (merged_busy[-1][0], max(merged_busy[-1][1], end))
+                if busy_ends and start <= busy_ends[-1]:
+                    if end > busy_ends[-1]:
+                        busy_ends[-1] = end
                 else:
-                    merged_busy.append((start, end))
+                    busy_starts.append(start)
+                    busy_ends.append(end)
 
             # Find common free slots within working hours
-            common_free_slots = []
-            current_date = start_dt.date()
-            end_date_only = end_dt.date()
+            free_slots = []
+            first_ordinal = start_dt.date().toordinal()
+            last_ordinal = end_dt.date().toordinal()
 
             try:
                 tz = pytz.timezone(user_tz)
             except Exception:
                 tz = timezone.utc
 
-            while current_date <= end_date_only:
+            def localize(naive: datetime) -> datetime:
+                if isinstance(tz, timezone):
+                    return naive.replace(tzinfo=tz)
+                return tz.localize(naive)
+
+            # Build each weekday's working window once, outside the slot search
+            work_start_time = time(hour=work_start_hour)
+            work_end_time = time(hour=work_end_hour)
+            day_windows = []
+            for day_ordinal in range(first_ordinal, last_ordinal + 1):
+                current_date = date.fromordinal(day_ordinal)
+
                 # Skip weekends
                 if current_date.weekday() >= 5:  # Saturday = 5, Sunday = 6
-                    current_date += timedelta(days=1)
                     continue
 
-                # Define working hours for this day
-                day_start = datetime.combine(current_date, datetime.min.time().replace(hour=work_start_hour))
-                day_end = datetime.combine(current_date, datetime.min.time().replace(hour=work_end_hour))
+                day_windows.append((
+                    current_date,
+                    localize(datetime.combine(current_date, work_start_time)),
+                    localize(datetime.combine(current_date, work_end_time)),
+                ))
 
-                if isinstance(tz, timezone):
-                    day_start = day_start.replace(tzinfo=tz)
-                    day_end = day_end.replace(tzinfo=tz)
-                else:
-                    day_start = tz.localize(day_start)
-                    day_end = tz.localize(day_end)
+            actual_duration_s = actual_duration * 60
+
+            # Only the first 15 slots are returned, so stop searching once found
+            max_slots = 15
 
+            # Days are visited in order, so the first busy period that can
+            # overlap the current day only ever moves forward
+            first_busy = 0
+            busy_count = len(busy_ends)
+
+            for current_date, day_start, day_end in day_windows:
                 # Find free slots on this day
                 current_time = day_start
 
-                for busy_start, busy_end in merged_busy:
-                    # Skip if busy period is not on this day
-                    if busy_end.date() < current_date or busy_start.date() > current_date:
-                        continue
+                while first_busy < busy_count and busy_ends[first_busy] <= day_start:
+                    first_busy += 1
+
+                for i in range(first_busy, busy_count):
+                    busy_start = busy_starts[i]
+                    if busy_start >= day_end:
+                        break
+                    busy_end = busy_ends[i]
 
                     # Adjust busy times to this day's working hours
                     effective_busy_start = max(busy_start, day_start)
                     effective_busy_end = min(busy_end, day_end)
 
                     if current_time < effective_busy_start:
-                        gap_duration = (effective_busy_start - current_time).total_seconds() / 60
-                        if gap_duration >= actual_duration:
-                            common_free_slots.append({
-                                "date": str(current_date),
-                                "start": current_time.isoformat(),
-                                "end": effective_busy_start.isoformat(),
-                                "start_display": current_time.strftime("%I:%M %p"),
-                                "end_display": effective_busy_start.strftime("%I:%M %p"),
-                                "duration_minutes": int(gap_duration)
-                            })
+                        gap_s = (effective_busy_start - current_time).total_seconds()
+                        if gap_s >= actual_duration_s:
+                            free_slots.append((current_date, current_time, effective_busy_start, gap_s))
+                            if len(free_slots) >= max_slots:
+                                break
 
                     current_time = max(current_time, effective_busy_end)
 
+                if len(free_slots) >= max_slots:
+                    break
+
                 # Check for gap after last busy time on this day
                 if current_time < day_end:
-                    gap_duration = (day_end - current_time).total_seconds() / 60
-                    if gap_duration >= actual_duration:
-                        common_free_slots.append({
-                            "date": str(current_date),
-                            "start": current_time.isoformat(),
-                            "end": day_end.isoformat(),
-                            "start_display": current_time.strftime("%I:%M %p"),
-                            "end_display": day_end.strftime("%I:%M %p"),
-                            "duration_minutes": int(gap_duration)
-                        })
-
-                current_date += timedelta(days=1)
-
-            # Limit to first 15 slots
-            common_free_slots = common_free_slots[:15]
+                    gap_s = (day_end - current_time).total_seconds()
+                    if gap_s >= actual_duration_s:
+                        free_slots.append((current_date, current_time, day_end, gap_s))
+                        if len(free_slots) >= max_slots:
+                            break
+
+            # Format only the slots that are actually returned
+            common_free_slots = [
+                {
+                    "date": str(slot_date),
+                    "start": slot_start.isoformat(),
+                    "end": slot_end.isoformat(),
+                    "start_display": _format_display_time(slot_start),
+                    "end_display": _format_display_time(slot_end),
+                    "duration_minutes": int(gap_s / 60)
+                }
+                for slot_date, slot_start, slot_end, gap_s in free_slots
+            ]
 
             return {
                 "success": True,
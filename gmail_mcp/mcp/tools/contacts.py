@@ -6,32 +6,511 @@ Includes contact hygiene, CRUD operations, and bulk management.
 """
 
 import csv
+import functools
+import math
 import re
 import os
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.errors import HttpError
 from mcp.server.fastmcp import FastMCP
 
 from gmail_mcp.utils.logger import get_logger
-from gmail_mcp.utils.services import get_people_service, get_gmail_service
+from gmail_mcp.utils.services import get_people_service, get_gmail_service, get_credentials_hash
 from gmail_mcp.utils.config import get_config
 from gmail_mcp.auth.oauth import get_credentials
+from gmail_mcp.gmail.helpers import b64url_decode, find_body_data
 
 logger = get_logger(__name__)
 
 
-def _normalize_phone(phone: str) -> str:
-    """Normalize phone number for comparison by removing non-digits."""
-    return re.sub(r'\D', '', phone)
+# Person fields parsed by _parse_person
+CONTACT_PERSON_FIELDS = (
+    "names", "emailAddresses", "phoneNumbers", "organizations", "addresses", "biographies", "photos"
+)
+
+# personFields / readMask values shared by the People API requests below
+FULL_PERSON_FIELDS = ",".join(CONTACT_PERSON_FIELDS)
+CORE_PERSON_FIELDS = "names,emailAddresses,phoneNumbers,organizations"
+MIN_PERSON_FIELDS = "names,emailAddresses"
+# Email lookups only need the addresses to confirm an exact match
+LOOKUP_READ_MASK = "emailAddresses"
+# searchContacts matches prefixes of names and addresses, so an exact address
+# can rank below other hits (e.g. "al@x.com" under "alice@x.com"); a page of
+# one would miss it. The matching itself stops at the first exact hit.
+LOOKUP_PAGE_SIZE = 5
+
+
+def _connections_response_fields(person_fields: str) -> str:
+    """
+    Build a partial-response mask for people.connections.list.
+
+    Limits each returned person to the requested fields plus identifiers,
+    so the response carries no per-person source metadata we never read.
+    """
+    return f"connections(resourceName,etag,{person_fields}),nextPageToken,totalPeople"
+
+
+def _person_response_fields(person_fields: str) -> str:
+    """Build a partial-response mask for people.get: the requested fields plus identifiers."""
+    return f"resourceName,etag,{person_fields}"
+
+
+def _search_response_fields(person_fields: str) -> str:
+    """Build a partial-response mask for people.searchContacts."""
+    return f"results(person({_person_response_fields(person_fields)}))"
+
+
+# Signature parsing patterns, compiled once at import
+SIGNATURE_PHONE_PATTERNS = [
+    re.compile(r'(?:phone|tel|mobile|cell|fax)?[:\s]*(\+?1?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})', re.IGNORECASE),
+    re.compile(r'(?:phone|tel|mobile|cell|fax)?[:\s]*(\+\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,4})', re.IGNORECASE),
+]
+# "Title, Company", "Title | Company" or "Title at Company" on a line of its
+# own, alternatives in precedence order. Each alternative captures two groups,
+# so (match.lastindex - 1) // 2 is the index of the one that matched.
+# [^\S\n] is whitespace other than a newline, which keeps matches on one line,
+# and the lookarounds pin the match to the line's non-whitespace content.
+SIGNATURE_TITLE_PATTERN = re.compile(
+    r'^[^\S\n]*(?=\S)(?:'
+    r'([A-Z][a-z]+(?:[^\S\n]+[A-Z][a-z]+)*)[^\S\n]*,[^\S\n]*([^,\n]+?)'
+    r'|([^|\n]+?)[^\S\n]*\|[^\S\n]*([^|\n]+?)'
+    r'|([^|\n]+?)[^\S\n]+at[^\S\n]+([^|\n]+?)'
+    r')(?<=\S)[^\S\n]*$',
+    re.MULTILINE
+)
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/([a-zA-Z0-9-]+)', re.IGNORECASE)
+
+# Address in a "Name <email@example.com>" header
+FROM_EMAIL_PATTERN = re.compile(r'<([^>]+)>')
+
+
+def _nested_parts_mask(depth: int) -> str:
+    """Partial-response mask for MIME part types and bodies, nested depth levels deep."""
+    mask = "mimeType,body/data"
+    for _ in range(depth):
+        mask = f"mimeType,body/data,parts({mask})"
+    return mask
+
+
+# Partial response for enrich_contact_from_email: message headers plus part
+# types and bodies, without per-part headers, sizes or message metadata.
+# Five levels of nesting covers mixed > related > alternative > text/plain.
+ENRICH_MESSAGE_FIELDS = f"payload(headers(name,value),{_nested_parts_mask(5)})"
+
+# Runs of characters that separate words when comparing names
+NAME_SEPARATOR_PATTERN = re.compile(r'[\W_]+')
+
+# Gmail batch API allows up to 100 requests per batch
+GMAIL_BATCH_SIZE = 100
+
+# people.getBatchGet accepts at most 200 resource names per request
+MERGE_MAX_CONTACTS = 200
+
+# Concurrent deletes when the batch endpoint is unavailable
+DELETE_MAX_WORKERS = 8
+
+# contactGroups.list returns at most 1000 groups per page
+CONTACT_GROUPS_PAGE_SIZE = 1000
+
+# contactGroups.members.modify accepts at most 1000 resource names per request
+GROUP_MODIFY_CHUNK_SIZE = 1000
+
+# Shared fallback for missing nested dicts, so lookups don't allocate a new {}
+_EMPTY: Dict[str, Any] = {}
+
+# Person fields holding typed values: (API field, list key, value key, top-level key)
+TYPED_VALUE_FIELDS = (
+    ("emailAddresses", "emails", "address", "email"),
+    ("phoneNumbers", "phones", "number", "phone"),
+)
+
+
+def _parse_typed_values(items: List[Dict[str, Any]], value_key: str) -> Tuple[List[Dict[str, Any]], str]:
+    """
+    Parse typed People API values (emails, phones) in a single pass.
+
+    Returns the simplified value list and the primary value, falling back
+    to the first value when none is marked primary.
+    """
+    parsed = []
+    primary_value = None
+    for item in items:
+        value = item.get("value", "")
+        is_primary = (item.get("metadata") or _EMPTY).get("primary", False)
+        parsed.append({
+            value_key: value,
+            "type": item.get("type", "other"),
+            "primary": is_primary
+        })
+        if is_primary and primary_value is None:
+            primary_value = value
+    if primary_value is None:
+        primary_value = parsed[0][value_key]
+    return parsed, primary_value
+
+
+def _summarize_person(person: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Lightweight alternative to _parse_person for scans that only need identity
+    and which fields are filled in.
+
+    Returns resource_name, name (when the person has one), email (primary or
+    first address, when any) and has_email / has_phone / has_organization
+    flags, without building the per-item email, phone or address lists.
+    """
+    summary: Dict[str, Any] = {"resource_name": person.get("resourceName", "")}
+
+    names = person.get("names")
+    if names:
+        summary["name"] = names[0].get("displayName", "")
+
+    emails = person.get("emailAddresses")
+    if emails:
+        summary["email"] = next(
+            (
+                e.get("value", "") for e in emails
+                if (e.get("metadata") or _EMPTY).get("primary", False)
+            ),
+            emails[0].get("value", "")
+        )
+
+    orgs = person.get("organizations")
+    summary["has_email"] = bool(emails)
+    summary["has_phone"] = bool(person.get("phoneNumbers"))
+    summary["has_organization"] = bool(orgs and orgs[0].get("name", ""))
+    return summary
+
+
+# Contacts resolved by email in get_contact, keyed by (credentials hash, lowercased email).
+# Entries expire after CONTACT_CACHE_TTL_SECONDS so edits made outside these
+# tools are picked up without clearing the cache.
+CONTACT_CACHE_MAX_SIZE = 512
+CONTACT_CACHE_TTL_SECONDS = 300
+_contact_cache: "OrderedDict[Tuple[int, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_contact_cache_lock = threading.Lock()
+
+
+def _get_cached_contact(key: Tuple[int, str]) -> Optional[Dict[str, Any]]:
+    """Return a cached contact and mark it most recently used, dropping it once expired."""
+    with _contact_cache_lock:
+        entry = _contact_cache.get(key)
+        if entry is None:
+            return None
+        cached_at, contact = entry
+        if time.monotonic() - cached_at > CONTACT_CACHE_TTL_SECONDS:
+            del _contact_cache[key]
+            return None
+        _contact_cache.move_to_end(key)
+        return contact
+
+
+def _cache_contact(key: Tuple[int, str], contact: Dict[str, Any]) -> None:
+    """Cache a contact, evicting the least recently used entry when full."""
+    with _contact_cache_lock:
+        _contact_cache[key] = (time.monotonic(), contact)
+        _contact_cache.move_to_end(key)
+        if len(_contact_cache) > CONTACT_CACHE_MAX_SIZE:
+            _contact_cache.popitem(last=False)
+
+
+# Parsed connections, keyed by (resourceName, etag, returned fields). The etag
+# changes whenever the contact does, so entries never go stale.
+PARSED_PERSON_CACHE_MAX_SIZE = 4096
+_parsed_person_cache: "OrderedDict[Tuple[str, str, Tuple[str, ...]], Dict[str, Any]]" = OrderedDict()
+_parsed_person_cache_lock = threading.Lock()
+
+
+def _clear_contact_cache() -> int:
+    """Clear the contact and parsed-person caches, returning the number of entries removed."""
+    with _contact_cache_lock:
+        count = len(_contact_cache)
+        _contact_cache.clear()
+    with _parsed_person_cache_lock:
+        count += len(_parsed_person_cache)
+        _parsed_person_cache.clear()
+    return count
+
+
+def _find_person_by_email(results: List[Dict[str, Any]], email: str) -> Optional[Dict[str, Any]]:
+    """Return the first searchContacts result person with an exact (case-insensitive) email match."""
+    email_lower = email.lower()
+    people = (item.get("person", _EMPTY) for item in results)
+    return next(
+        (
+            person for person in people
+            if any(e.get("value", "").lower() == email_lower for e in person.get("emailAddresses", ()))
+        ),
+        None
+    )
+
+
+def _lookup_resource_name(service, credentials, email: str) -> Optional[str]:
+    """
+    Resolve a contact's resource name from one of its email addresses.
+
+    Contacts already resolved by get_contact are served from the contact
+    cache; otherwise searchContacts is queried for an exact match.
+
+    Returns:
+        Optional[str]: The resource name, or None when no contact matches
+    """
+    cached = _get_cached_contact((get_credentials_hash(credentials), email.lower()))
+    if cached is not None:
+        return cached["resource_name"]
+
+    search_result = service.people().searchContacts(
+        query=email,
+        pageSize=LOOKUP_PAGE_SIZE,
+        readMask=LOOKUP_READ_MASK,
+        fields=_search_response_fields(LOOKUP_READ_MASK)
+    ).execute()
+
+    person = _find_person_by_email(search_result.get("results", []), email)
+    return person.get("resourceName") if person else None
+
+
+def _is_etag_conflict(error: HttpError) -> bool:
+    """Whether a People API write failed because the contact changed after its etag was read."""
+    content = error.content
+    if isinstance(content, bytes):
+        content = content.decode("utf-8", errors="ignore")
+    detail = f"{error} {content}"
+    return error.resp.status in (400, 409, 412) and (
+        "FAILED_PRECONDITION" in detail or "failedPrecondition" in detail or "etag" in detail.lower()
+    )
+
+
+def _etag_conflict_response(service, resource_name: str) -> Dict[str, Any]:
+    """
+    Build the error returned for an etag conflict (the HTTP 412 case).
+
+    Includes the contact's current etag, fetched once, so the caller knows
+    the contact changed and can retry against the new version.
+    """
+    current_etag = None
+    try:
+        current = service.people().get(
+            resourceName=resource_name,
+            personFields="metadata",
+            fields="etag"
+        ).execute()
+        current_etag = current.get("etag")
+    except Exception as e:
+        logger.warning(f"Failed to fetch current etag for {resource_name}: {e}")
+
+    return {
+        "success": False,
+        "error": "conflict",
+        "message": f"Contact {resource_name} was changed since it was read. Retry the request.",
+        "resource_name": resource_name,
+        "current_etag": current_etag,
+        "retry": True
+    }
+
+
+class _NonDigitDeletions(dict):
+    """str.translate table that deletes non-digit characters, filled in as characters are seen."""
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        value = codepoint if chr(codepoint).isdecimal() else None
+        self[codepoint] = value
+        return value
+
+
+# Same character class as the regex \d, without the regex engine
+NON_DIGIT_DELETIONS = _NonDigitDeletions()
+
+
+def _delete_contacts_concurrently(service, credentials, resource_names: List[str]) -> set:
+    """
+    Delete contacts with one request per contact, run on a thread pool.
+
+    Used when the batch endpoint rejects a batch. The service's shared http
+    object is not thread-safe, so each request runs on its own connection.
+
+    Returns:
+        set: Resource names that failed to delete
+    """
+    def delete(rn: str) -> None:
+        http = AuthorizedHttp(credentials, http=httplib2.Http())
+        service.people().deleteContact(resourceName=rn).execute(http=http)
+
+    failed = set()
+    with ThreadPoolExecutor(max_workers=min(DELETE_MAX_WORKERS, len(resource_names))) as executor:
+        futures = {executor.submit(delete, rn): rn for rn in resource_names}
+        for future in as_completed(futures):
+            rn = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                failed.add(rn)
+                logger.warning(f"Failed to delete {rn}: {e}")
+    return failed
+
+
+def _modify_group_members(
+    service, group_resource_name: str, body_key: str, resource_names: List[str]
+) -> Tuple[List[str], List[str]]:
+    """
+    Add or remove group members in chunks the modify endpoint accepts.
+
+    A single chunk is sent directly; several are sent as one batch request.
+    When every chunk fails, the first error is raised.
+
+    Args:
+        body_key: "resourceNamesToAdd" or "resourceNamesToRemove"
+
+    Returns:
+        Tuple[List[str], List[str]]: Resource names in chunks that succeeded
+        and in chunks that failed
+    """
+    chunks = [
+        resource_names[i:i + GROUP_MODIFY_CHUNK_SIZE]
+        for i in range(0, len(resource_names), GROUP_MODIFY_CHUNK_SIZE)
+    ]
+
+    def modify_request(chunk: List[str]):
+        return service.contactGroups().members().modify(
+            resourceName=group_resource_name,
+            body={body_key: chunk}
+        )
+
+    if len(chunks) <= 1:
+        modify_request(resource_names).execute()
+        return resource_names, []
+
+    failures: Dict[int, Exception] = {}
+
+    def callback(request_id, response, exception):
+        if exception is not None:
+            failures[int(request_id)] = exception
+
+    batch = service.new_batch_http_request(callback=callback)
+    for idx, chunk in enumerate(chunks):
+        batch.add(modify_request(chunk), request_id=str(idx))
+    batch.execute()
 
+    if len(failures) == len(chunks):
+        raise failures[0]
 
-def _similarity_ratio(s1: str, s2: str) -> float:
-    """Calculate similarity ratio between two strings."""
-    if not s1 or not s2:
-        return 0.0
-    return SequenceMatcher(None, s1.lower(), s2.lower()).ratio()
+    succeeded = []
+    failed = []
+    for idx, chunk in enumerate(chunks):
+        if idx in failures:
+            logger.warning(f"Failed to modify {len(chunk)} members of {group_resource_name}: {failures[idx]}")
+            failed.extend(chunk)
+        else:
+            succeeded.extend(chunk)
+    return succeeded, failed
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_phone(phone: str) -> str:
+    """Normalize phone number for comparison by removing non-digits.
+
+    Cached: the duplicate scan and merges normalize the same numbers repeatedly.
+    """
+    return phone.translate(NON_DIGIT_DELETIONS)
+
+
+def _name_sort_key(name: str) -> str:
+    """
+    Normalize a name for similarity matching, token-set style.
+
+    Lowercases, treats punctuation as word breaks, drops repeated words and
+    sorts the rest, so "Smith, John" and "John Smith" compare as identical.
+    """
+    return " ".join(sorted(set(NAME_SEPARATOR_PATTERN.sub(" ", name.lower()).split())))
+
+
+def _name_blocking_tokens(name: str, rarity: Dict[Tuple[str, int], int], threshold: float) -> List[Tuple[str, int]]:
+    """
+    Pick the characters a name is blocked on when comparing names.
+
+    quick_ratio() is 2 * shared / (la + lb), where shared counts characters
+    common to both names, so reaching the threshold requires sharing at least
+    threshold * length / (2 - threshold) characters with any partner the
+    length bound allows. Any two names that share that many must share one
+    of each other's rarest (length - required + 1) characters, so only those
+    are returned, rarest first. Repeated characters are numbered so that
+    counts match quick_ratio()'s multiset view.
+
+    Args:
+        name: Normalized name key
+        rarity: Number of names containing each (character, occurrence) token
+        threshold: Similarity threshold, greater than 0
+
+    Returns:
+        List[Tuple[str, int]]: Tokens to index and probe the name under
+    """
+    tokens = sorted(
+        ((char, k) for char, count in Counter(name).items() for k in range(count)),
+        key=lambda token: (rarity[token], token)
+    )
+    threshold = min(threshold, 1.0)
+    # The small tolerance keeps float rounding from ever tightening the bound
+    required = max(1, math.ceil(threshold * len(tokens) / (2 - threshold) - 1e-9))
+    return tokens[:len(tokens) - required + 1]
+
+
+def _split_name(name: str) -> Tuple[str, str]:
+    """Split a full name into given and family names, splitting once."""
+    if ' ' not in name:
+        return name, ""
+    parts = name.split()
+    return (parts[0] if parts else ""), " ".join(parts[1:])
+
+
+def _build_person_body(
+    name: Optional[str] = None,
+    email: Optional[str] = None,
+    phone: Optional[str] = None,
+    organization: Optional[str] = None,
+    title: Optional[str] = None,
+    notes: Optional[str] = None
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Build a Person body from the given contact values.
+
+    Returns:
+        Tuple[Dict[str, Any], List[str]]: The body and the person fields it
+        sets, in the order used for updatePersonFields
+    """
+    person: Dict[str, Any] = {}
+    fields: List[str] = []
+
+    if name:
+        given_name, family_name = _split_name(name)
+        person["names"] = [{"givenName": given_name, "familyName": family_name}]
+        fields.append("names")
+    if email:
+        person["emailAddresses"] = [{"value": email}]
+        fields.append("emailAddresses")
+    if phone:
+        person["phoneNumbers"] = [{"value": phone}]
+        fields.append("phoneNumbers")
+    if organization or title:
+        org = {}
+        if organization:
+            org["name"] = organization
+        if title:
+            org["title"] = title
+        person["organizations"] = [org]
+        fields.append("organizations")
+    if notes:
+        person["biographies"] = [{"value": notes, "contentType": "TEXT_PLAIN"}]
+        fields.append("biographies")
+
+    return person, fields
 
 
 def _extract_domain(email: str) -> str:
@@ -41,37 +520,258 @@ def _extract_domain(email: str) -> str:
     return ""
 
 
+def _iter_connection_pages(
+    service,
+    person_fields: str,
+    page_size: int,
+    max_contacts: Optional[int] = None,
+    fields: Optional[str] = None,
+    extra_params: Optional[Dict[str, Any]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield pages of the user's connections, prefetching the next page.
+
+    The request for the next page is issued on a worker thread as soon as the
+    current page arrives, so the network round-trip overlaps with the caller
+    processing the page. Only one request is in flight at a time.
+
+    Args:
+        service: People API service instance
+        person_fields: personFields to request
+        page_size: Maximum connections per page
+        max_contacts: Stop requesting pages once this many connections were fetched
+        fields: Optional partial-response mask
+        extra_params: Additional connections.list parameters (e.g. syncToken)
+
+    Yields:
+        Dict[str, Any]: Raw connections.list responses
+    """
+    def fetch(page_token: Optional[str], remaining: Optional[int]) -> Dict[str, Any]:
+        request_params = {
+            "resourceName": "people/me",
+            "pageSize": page_size if remaining is None else min(page_size, remaining),
+            "personFields": person_fields
+        }
+        if fields:
+            request_params["fields"] = fields
+        if extra_params:
+            request_params.update(extra_params)
+        if page_token:
+            request_params["pageToken"] = page_token
+        return service.people().connections().list(**request_params).execute()
+
+    if max_contacts is not None and max_contacts <= 0:
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        fetched = 0
+        future = executor.submit(fetch, None, max_contacts)
+        while future is not None:
+            result = future.result()
+            fetched += len(result.get("connections", []))
+
+            page_token = result.get("nextPageToken")
+            remaining = None if max_contacts is None else max_contacts - fetched
+            if page_token and (remaining is None or remaining > 0):
+                future = executor.submit(fetch, page_token, remaining)
+            else:
+                future = None
+
+            yield result
+
+
+# Full connection lists for the contact scans, kept current with People API
+# sync tokens. Keyed by personFields; each entry holds the credentials hash,
+# the sync token and the raw connections in the API's last-modified order.
+_connections_sync_cache: Dict[str, Tuple[int, str, "OrderedDict[str, Dict[str, Any]]"]] = {}
+_connections_sync_lock = threading.Lock()
+
+
+def _clear_connections_sync_cache() -> int:
+    """Drop all synced connection lists, returning the number removed."""
+    with _connections_sync_lock:
+        count = len(_connections_sync_cache)
+        _connections_sync_cache.clear()
+    return count
+
+
+def _is_expired_sync_token(error: HttpError) -> bool:
+    """
+    Check whether an error reports an expired sync token.
+
+    The People API rejects tokens older than 7 days with 400
+    FAILED_PRECONDITION and an EXPIRED_SYNC_TOKEN reason; 410 is also
+    treated as expired.
+    """
+    status = error.resp.status
+    if status == 410:
+        return True
+    if status != 400:
+        return False
+    content = error.content
+    if isinstance(content, bytes):
+        content = content.decode("utf-8", errors="replace")
+    return "EXPIRED_SYNC_TOKEN" in f"{content}{error.error_details}"
+
+
+def _sync_connections(service, credentials, person_fields: str) -> List[Dict[str, Any]]:
+    """
+    Return all of the user's connections, fetching only changes after the first call.
+
+    The first call lists every connection with requestSyncToken and keeps the
+    result together with the returned sync token. Later calls pass the token
+    and apply the additions, changes and deletions the API reports. Changed
+    contacts move to the end, matching the API's default last-modified order.
+    An expired sync token falls back to a full listing.
+
+    Args:
+        service: People API service instance
+        credentials: Credentials the service was built with
+        person_fields: personFields to request
+
+    Returns:
+        List[Dict[str, Any]]: Raw person resources
+    """
+    account = get_credentials_hash(credentials)
+    # Deleted contacts come back with metadata.deleted set
+    response_fields = (
+        f"connections(resourceName,etag,metadata/deleted,{person_fields}),"
+        "nextPageToken,nextSyncToken"
+    )
+    with _connections_sync_lock:
+        cached = _connections_sync_cache.get(person_fields)
+    if cached and cached[0] != account:
+        cached = None
+
+    connections: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    sync_token = None
+    if cached:
+        _, sync_token, cached_connections = cached
+        connections.update(cached_connections)
+        try:
+            for result in _iter_connection_pages(
+                service, person_fields, 1000, fields=response_fields,
+                # A sync token is only valid with the parameters that created it
+                extra_params={"syncToken": sync_token, "requestSyncToken": True}
+            ):
+                for person in result.get("connections", []):
+                    resource_name = person.get("resourceName", "")
+                    connections.pop(resource_name, None)
+                    if not (person.get("metadata") or _EMPTY).get("deleted"):
+                        connections[resource_name] = person
+                sync_token = result.get("nextSyncToken", sync_token)
+        except HttpError as e:
+            if not _is_expired_sync_token(e):
+                raise
+            logger.info("Contacts sync token expired, listing all connections")
+            cached = None
+
+    if not cached:
+        connections.clear()
+        sync_token = None
+        for result in _iter_connection_pages(
+            service, person_fields, 1000, fields=response_fields,
+            extra_params={"requestSyncToken": True}
+        ):
+            for person in result.get("connections", []):
+                connections[person.get("resourceName", "")] = person
+            sync_token = result.get("nextSyncToken", sync_token)
+
+    with _connections_sync_lock:
+        if sync_token:
+            _connections_sync_cache[person_fields] = (account, sync_token, connections)
+        else:
+            _connections_sync_cache.pop(person_fields, None)
+    return list(connections.values())
+
+
+class _DisjointSet:
+    """Union-find over positions 0..size-1, with path halving."""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> None:
+        """Merge y's set into x's; x's root stays the root."""
+        root_x, root_y = self.find(x), self.find(y)
+        if root_x != root_y:
+            self.parent[root_y] = root_x
+
+
+def _find_recent_activity(gmail_service, emails: List[str], cutoff_str: str) -> Dict[str, bool]:
+    """
+    Check which addresses have sent or received mail since a cutoff date.
+
+    Searches are sent through Gmail's batch API, GMAIL_BATCH_SIZE per request.
+
+    Args:
+        gmail_service: Gmail API service instance
+        emails: Addresses to check
+        cutoff_str: Gmail search date (YYYY/MM/DD)
+
+    Returns:
+        Dict[str, bool]: Whether each address has recent activity. Addresses
+        whose search failed are left out.
+    """
+    unique_emails = list(dict.fromkeys(emails))
+    activity: Dict[str, bool] = {}
+
+    def callback(request_id, response, exception):
+        # Skip addresses that cause search errors
+        if exception is None:
+            activity[unique_emails[int(request_id)]] = bool(response.get("messages"))
+
+    for start in range(0, len(unique_emails), GMAIL_BATCH_SIZE):
+        batch = gmail_service.new_batch_http_request(callback=callback)
+        for index in range(start, min(start + GMAIL_BATCH_SIZE, len(unique_emails))):
+            email = unique_emails[index]
+            batch.add(
+                gmail_service.users().messages().list(
+                    userId="me",
+                    q=f"(from:{email} OR to:{email}) after:{cutoff_str}",
+                    maxResults=1
+                ),
+                request_id=str(index)
+            )
+        batch.execute()
+
+    return activity
+
+
 def _parse_signature(text: str) -> Dict[str, Any]:
     """Extract contact info from email signature text."""
     result = {}
 
     # Phone patterns
-    phone_patterns = [
-        r'(?:phone|tel|mobile|cell|fax)?[:\s]*(\+?1?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})',
-        r'(?:phone|tel|mobile|cell|fax)?[:\s]*(\+\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,4})',
-    ]
-    for pattern in phone_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in SIGNATURE_PHONE_PATTERNS:
+        match = pattern.search(text)
         if match:
             result['phone'] = match.group(1).strip()
             break
 
-    # Title patterns - "Title at Company" or "Title | Company" or "Title, Company"
-    title_patterns = [
-        r'^([^|\n]+?)\s+at\s+([^|\n]+?)$',
-        r'^([^|\n]+?)\s*\|\s*([^|\n]+?)$',
-        r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*,\s*([^,\n]+?)$',
-    ]
-    for pattern in title_patterns:
-        for line in text.split('\n'):
-            match = re.match(pattern, line.strip())
-            if match:
-                result['title'] = match.group(1).strip()
-                result['company'] = match.group(2).strip()
+    # Title patterns - "Title, Company" beats "Title | Company", which beats
+    # "Title at Company"; among lines of the same form the first one wins
+    best = None
+    best_rank = 3
+    for match in SIGNATURE_TITLE_PATTERN.finditer(text):
+        rank = (match.lastindex - 1) // 2
+        if rank < best_rank:
+            best, best_rank = match, rank
+            if rank == 0:
                 break
+    if best:
+        result['title'] = best.group(best.lastindex - 1).strip()
+        result['company'] = best.group(best.lastindex).strip()
 
     # LinkedIn URL
-    linkedin_match = re.search(r'linkedin\.com/in/([a-zA-Z0-9-]+)', text, re.IGNORECASE)
+    linkedin_match = LINKEDIN_PATTERN.search(text)
     if linkedin_match:
         result['linkedin'] = f"https://linkedin.com/in/{linkedin_match.group(1)}"
 
@@ -81,15 +781,26 @@ def _parse_signature(text: str) -> Dict[str, Any]:
 def setup_contact_tools(mcp: FastMCP) -> None:
     """Set up contact lookup tools on the FastMCP application."""
 
-    def _check_contacts_enabled() -> Optional[Dict[str, Any]]:
-        """Check if contacts API is enabled."""
-        config = get_config()
-        if not config.get("contacts_api_enabled", False):
+    # Enabling the contacts API requires a restart to re-authenticate, so the
+    # flag is read once here rather than on every call
+    contacts_enabled = get_config().get("contacts_api_enabled", False)
+
+    def contacts_tool(func):
+        """
+        Register a People API tool. When the contacts API is disabled, the tool
+        is registered with the same signature but only returns the error.
+        """
+        if contacts_enabled:
+            return mcp.tool()(func)
+
+        @functools.wraps(func)
+        def disabled(*args, **kwargs) -> Dict[str, Any]:
             return {
                 "success": False,
                 "error": "Contacts API not enabled. Set contacts_api_enabled=true in config and re-authenticate."
             }
-        return None
+
+        return mcp.tool()(disabled)
 
     def _parse_person(person: Dict[str, Any]) -> Dict[str, Any]:
         """Parse a Person resource into a simplified contact dict."""
@@ -98,45 +809,29 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             "etag": person.get("etag", ""),
         }
 
+        # Names are present on nearly every contact, so index directly; the
+        # often-missing fields below use .get() without building a default []
+
         # Names
-        names = person.get("names", [])
-        if names:
-            name = names[0]
+        try:
+            name = person["names"][0]
+        except (KeyError, IndexError):
+            pass
+        else:
             result["name"] = name.get("displayName", "")
             result["given_name"] = name.get("givenName", "")
             result["family_name"] = name.get("familyName", "")
 
-        # Email addresses
-        emails = person.get("emailAddresses", [])
-        result["emails"] = [
-            {
-                "address": e.get("value", ""),
-                "type": e.get("type", "other"),
-                "primary": e.get("metadata", {}).get("primary", False)
-            }
-            for e in emails
-        ]
-        if emails:
-            # Set primary email as top-level field
-            primary_emails = [e for e in emails if e.get("metadata", {}).get("primary")]
-            result["email"] = primary_emails[0]["value"] if primary_emails else emails[0].get("value", "")
-
-        # Phone numbers
-        phones = person.get("phoneNumbers", [])
-        result["phones"] = [
-            {
-                "number": p.get("value", ""),
-                "type": p.get("type", "other"),
-                "primary": p.get("metadata", {}).get("primary", False)
-            }
-            for p in phones
-        ]
-        if phones:
-            primary_phones = [p for p in phones if p.get("metadata", {}).get("primary")]
-            result["phone"] = primary_phones[0]["value"] if primary_phones else phones[0].get("value", "")
+        # Email addresses and phone numbers
+        for field, list_key, value_key, scalar_key in TYPED_VALUE_FIELDS:
+            items = person.get(field)
+            if items:
+                result[list_key], result[scalar_key] = _parse_typed_values(items, value_key)
+            else:
+                result[list_key] = []
 
         # Organizations
-        orgs = person.get("organizations", [])
+        orgs = person.get("organizations")
         if orgs:
             org = orgs[0]
             result["organization"] = org.get("name", "")
@@ -144,7 +839,7 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             result["department"] = org.get("department", "")
 
         # Addresses
-        addresses = person.get("addresses", [])
+        addresses = person.get("addresses") or ()
         result["addresses"] = [
             {
                 "formatted": a.get("formattedValue", ""),
@@ -157,18 +852,38 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         ]
 
         # Biographies/Notes
-        bios = person.get("biographies", [])
+        bios = person.get("biographies")
         if bios:
             result["notes"] = bios[0].get("value", "")
 
         # Photo
-        photos = person.get("photos", [])
+        photos = person.get("photos")
         if photos:
             result["photo_url"] = photos[0].get("url", "")
 
         return result
 
-    @mcp.tool()
+    def _parse_listed_person(person: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse a connections.list Person, reusing the result for an unchanged etag."""
+        etag = person.get("etag")
+        if not etag:
+            return _parse_person(person)
+
+        key = (person.get("resourceName", ""), etag, tuple(person))
+        with _parsed_person_cache_lock:
+            parsed = _parsed_person_cache.get(key)
+            if parsed is not None:
+                _parsed_person_cache.move_to_end(key)
+                return parsed
+
+        parsed = _parse_person(person)
+        with _parsed_person_cache_lock:
+            _parsed_person_cache[key] = parsed
+            if len(_parsed_person_cache) > PARSED_PERSON_CACHE_MAX_SIZE:
+                _parsed_person_cache.popitem(last=False)
+        return parsed
+
+    @contacts_tool
     def list_contacts(max_results: int = 50, page_token: Optional[str] = None) -> Dict[str, Any]:
         """
         List contacts from Google Contacts.
@@ -184,10 +899,6 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         1. List first 50 contacts: list_contacts()
         2. List with pagination: list_contacts(page_token="...")
         """
-        error = _check_contacts_enabled()
-        if error:
-            return error
-
         credentials = get_credentials()
         if not credentials:
             return {"success": False, "error": "Not authenticated. Please use the authenticate tool first."}
@@ -200,16 +911,15 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             request_params = {
                 "resourceName": "people/me",
                 "pageSize": max_results,
-                "personFields": "names,emailAddresses,phoneNumbers,organizations,addresses,biographies,photos"
+                "personFields": FULL_PERSON_FIELDS,
+                "fields": _connections_response_fields(FULL_PERSON_FIELDS)
             }
             if page_token:
                 request_params["pageToken"] = page_token
 
             result = service.people().connections().list(**request_params).execute()
 
-            contacts = []
-            for person in result.get("connections", []):
-                contacts.append(_parse_person(person))
+            contacts = [_parse_listed_person(person) for person in result.get("connections", [])]
 
             return {
                 "success": True,
@@ -223,7 +933,78 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             logger.error(f"Failed to list contacts: {e}")
             return {"success": False, "error": f"Failed to list contacts: {e}"}
 
-    @mcp.tool()
+    @contacts_tool
+    def list_all_contacts(max_total: int = 500, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        List contacts across all pages in a single call.
+
+        Follows page tokens server-side instead of returning one page at a time,
+        and only requests the person fields that are needed.
+
+        Args:
+            max_total (int): Maximum number of contacts to return (default: 500)
+            fields (List[str], optional): People API person fields to fetch
+                (e.g., ["names", "emailAddresses"]). Defaults to all contact fields.
+                Valid fields: names, emailAddresses, phoneNumbers, organizations,
+                addresses, biographies, photos
+
+        Returns:
+            Dict[str, Any]: All contacts fetched, up to max_total
+
+        Example usage:
+        1. All contacts with full details: list_all_contacts()
+        2. Names and emails only: list_all_contacts(fields=["names", "emailAddresses"])
+        """
+        if fields:
+            invalid = [f for f in fields if f not in CONTACT_PERSON_FIELDS]
+            if invalid:
+                return {
+                    "success": False,
+                    "error": f"Invalid fields: {', '.join(invalid)}. "
+                             f"Valid fields: {', '.join(CONTACT_PERSON_FIELDS)}"
+                }
+        else:
+            fields = list(CONTACT_PERSON_FIELDS)
+
+        credentials = get_credentials()
+        if not credentials:
+            return {"success": False, "error": "Not authenticated. Please use the authenticate tool first."}
+
+        try:
+            service = get_people_service(credentials)
+
+            person_fields = ",".join(fields)
+            response_fields = _connections_response_fields(person_fields)
+
+            contacts = []
+            total_people = 0
+            page_token = None
+
+            for result in _iter_connection_pages(
+                service, person_fields, 1000, max_contacts=max_total, fields=response_fields
+            ):
+                total_people = result.get("totalPeople", total_people)
+
+                for person in result.get("connections", []):
+                    contacts.append(_parse_listed_person(person))
+
+                page_token = result.get("nextPageToken")
+
+            contacts = contacts[:max_total]
+
+            return {
+                "success": True,
+                "count": len(contacts),
+                "total_people": total_people,
+                "contacts": contacts,
+                "truncated": bool(page_token)
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to list all contacts: {e}")
+            return {"success": False, "error": f"Failed to list all contacts: {e}"}
+
+    @contacts_tool
     def search_contacts(query: str, max_results: int = 10) -> Dict[str, Any]:
         """
         Search for contacts by name, email, or phone number.
@@ -240,10 +1021,6 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         2. Search by email: search_contacts(query="john@example.com")
         3. Search by company: search_contacts(query="Acme Corp")
         """
-        error = _check_contacts_enabled()
-        if error:
-            return error
-
         credentials = get_credentials()
         if not credentials:
             return {"success": False, "error": "Not authenticated. Please use the authenticate tool first."}
@@ -256,7 +1033,8 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             result = service.people().searchContacts(
                 query=query,
                 pageSize=max_results,
-                readMask="names,emailAddresses,phoneNumbers,organizations,addresses,biographies,photos"
+                readMask=FULL_PERSON_FIELDS,
+                fields=_search_response_fields(FULL_PERSON_FIELDS)
             ).execute()
 
             contacts = []
@@ -275,7 +1053,7 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             logger.error(f"Failed to search contacts: {e}")
             return {"success": False, "error": f"Failed to search contacts: {e}"}
 
-    @mcp.tool()
+    @contacts_tool
     def get_contact(email: Optional[str] = None, resource_name: Optional[str] = None) -> Dict[str, Any]:
         """
         Get detailed information about a specific contact.
@@ -298,10 +1076,6 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         1. By email: get_contact(email="bob@company.com")
         2. By resource name: get_contact(resource_name="people/c123456789")
         """
-        error = _check_contacts_enabled()
-        if error:
-            return error
-
         if not email and not resource_name:
             return {"success": False, "error": "Either email or resource_name must be provided"}
 
@@ -316,7 +1090,8 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             if resource_name:
                 result = service.people().get(
                     resourceName=resource_name,
-                    personFields="names,emailAddresses,phoneNumbers,organizations,addresses,biographies,photos"
+                    personFields=FULL_PERSON_FIELDS,
+                    fields=_person_response_fields(FULL_PERSON_FIELDS)
                 ).execute()
 
                 return {
@@ -324,23 +1099,38 @@ def setup_contact_tools(mcp: FastMCP) -> None:
                     "contact": _parse_person(result)
                 }
 
-            # If email provided, search for it
+            # Serve repeated email lookups from the cache
+            cache_key = (get_credentials_hash(credentials), email.lower())
+            cached = _get_cached_contact(cache_key)
+            if cached is not None:
+                return {
+                    "success": True,
+                    "contact": cached
+                }
+
+            # If email provided, search for it with only the fields needed to
+            # confirm a match, then fetch the full record for the hit alone
             search_result = service.people().searchContacts(
                 query=email,
-                pageSize=5,
-                readMask="names,emailAddresses,phoneNumbers,organizations,addresses,biographies,photos"
+                pageSize=LOOKUP_PAGE_SIZE,
+                readMask=LOOKUP_READ_MASK,
+                fields=_search_response_fields(LOOKUP_READ_MASK)
             ).execute()
 
             # Find exact email match
-            for item in search_result.get("results", []):
-                person = item.get("person", {})
-                emails = person.get("emailAddresses", [])
-                for e in emails:
-                    if e.get("value", "").lower() == email.lower():
-                        return {
-                            "success": True,
-                            "contact": _parse_person(person)
-                        }
+            person = _find_person_by_email(search_result.get("results", []), email)
+            if person:
+                full_person = service.people().get(
+                    resourceName=person["resourceName"],
+                    personFields=FULL_PERSON_FIELDS,
+                    fields=_person_response_fields(FULL_PERSON_FIELDS)
+                ).execute()
+                contact = _parse_person(full_person)
+                _cache_contact(cache_key, contact)
+                return {
+                    "success": True,
+                    "contact": contact
+                }
 
             # No exact match found
             return {
@@ -352,11 +1142,34 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             logger.error(f"Failed to get contact: {e}")
             return {"success": False, "error": f"Failed to get contact: {e}"}
 
+    @mcp.tool()
+    def clear_contact_cache() -> Dict[str, Any]:
+        """
+        Clear cached email lookups used by get_contact, parsed contact records
+        and the synced contact lists used by the contact scans.
+
+        Contacts found by email are cached for five minutes so repeated
+        lookups, including update_contact and delete_contact by email, skip
+        the People API. The cache is cleared automatically when contacts are
+        changed through these tools; use this after editing contacts elsewhere.
+        The synced lists pick up changes on their own; clearing them forces
+        the next scan to list every contact again.
+
+        Returns:
+            Dict[str, Any]: Number of cache entries removed
+        """
+        cleared = _clear_contact_cache() + _clear_connections_sync_cache()
+        return {
+            "success": True,
+            "message": f"Cleared {cleared} cached contact(s)",
+            "cleared": cleared
+        }
+
     # =========================================================================
     # Contact Hygiene Tools
     # =========================================================================
 
-    @mcp.tool()
+    @contacts_tool
     def find_duplicate_contacts(threshold: float = 0.8, max_results: int = 50) -> Dict[str, Any]:
         """
         Find potential duplicate contacts based on email, phone, or name similarity.
@@ -373,11 +1186,13 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         2. Exact phone match (confidence: 1.0)
         3. Similar name + same email domain (confidence: 0.9)
         4. Similar name (confidence: based on similarity ratio)
-        """
-        error = _check_contacts_enabled()
-        if error:
-            return error
 
+        Names are compared case-insensitively with word order, repeated words
+        and punctuation ignored, so "Smith, John" matches "John Smith".
+
+        Contacts linked through any chain of matches are returned as one group,
+        listing every match reason; the group's confidence is its weakest match.
+        """
         credentials = get_credentials()
         if not credentials:
             return {"success": False, "error": "Not authenticated"}
@@ -386,109 +1201,149 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             service = get_people_service(credentials)
 
             # Fetch all contacts
-            all_contacts = []
-            page_token = None
-            while True:
-                request_params = {
-                    "resourceName": "people/me",
-                    "pageSize": 100,
-                    "personFields": "names,emailAddresses,phoneNumbers,organizations"
-                }
-                if page_token:
-                    request_params["pageToken"] = page_token
-
-                result = service.people().connections().list(**request_params).execute()
-                all_contacts.extend(result.get("connections", []))
-
-                page_token = result.get("nextPageToken")
-                if not page_token or len(all_contacts) >= 1000:
-                    break
-
-            # Build indices for matching
-            email_index: Dict[str, List[Dict]] = {}
-            phone_index: Dict[str, List[Dict]] = {}
+            all_contacts = _sync_connections(service, credentials, CORE_PERSON_FIELDS)[:1000]
+
+            # Matches are merged into connected components, so contacts linked
+            # through a third contact are reported as one group.
+            groups = _DisjointSet(len(all_contacts))
+            # (position of a matched contact, match reason, confidence)
+            matches: List[Tuple[int, str, float]] = []
+
+            # Parse and index in one pass: the first contact seen with each
+            # email or normalized phone is recorded, and any later contact
+            # with the same key is grouped with it straight away.
+            first_with_email: Dict[str, int] = {}
+            first_with_phone: Dict[str, int] = {}
             contacts_parsed = []
 
-            for person in all_contacts:
-                parsed = _parse_person(person)
+            for position, person in enumerate(all_contacts):
+                parsed = _parse_listed_person(person)
                 contacts_parsed.append(parsed)
 
-                # Index by email
-                for email_obj in parsed.get("emails", []):
-                    email = email_obj.get("address", "").lower()
+                # Exact email matches
+                for email_obj in parsed["emails"]:
+                    email = email_obj["address"].lower()
                     if email:
-                        if email not in email_index:
-                            email_index[email] = []
-                        email_index[email].append(parsed)
-
-                # Index by normalized phone
-                for phone_obj in parsed.get("phones", []):
-                    phone = _normalize_phone(phone_obj.get("number", ""))
-                    if phone and len(phone) >= 10:
-                        if phone not in phone_index:
-                            phone_index[phone] = []
-                        phone_index[phone].append(parsed)
-
-            # Find duplicates
-            duplicate_groups = []
-            seen_resources = set()
-
-            # Check exact email matches
-            for email, contacts in email_index.items():
-                if len(contacts) > 1:
-                    resources = [c["resource_name"] for c in contacts]
-                    key = tuple(sorted(resources))
-                    if key not in seen_resources:
-                        seen_resources.add(key)
-                        duplicate_groups.append({
-                            "contacts": contacts,
-                            "match_reason": f"Same email: {email}",
-                            "confidence": 1.0
-                        })
-
-            # Check exact phone matches
-            for phone, contacts in phone_index.items():
-                if len(contacts) > 1:
-                    resources = [c["resource_name"] for c in contacts]
-                    key = tuple(sorted(resources))
-                    if key not in seen_resources:
-                        seen_resources.add(key)
-                        duplicate_groups.append({
-                            "contacts": contacts,
-                            "match_reason": f"Same phone: {phone}",
-                            "confidence": 1.0
-                        })
-
-            # Check similar names
-            for i, c1 in enumerate(contacts_parsed):
-                name1 = c1.get("name", "")
-                if not name1:
-                    continue
-
-                for c2 in contacts_parsed[i+1:]:
-                    name2 = c2.get("name", "")
-                    if not name2:
+                        first = first_with_email.setdefault(email, position)
+                        if first != position:
+                            groups.union(first, position)
+                            matches.append((first, f"Same email: {email}", 1.0))
+
+                # Exact phone matches
+                for phone_obj in parsed["phones"]:
+                    phone = _normalize_phone(phone_obj["number"])
+                    if len(phone) >= 10:
+                        first = first_with_phone.setdefault(phone, position)
+                        if first != position:
+                            groups.union(first, position)
+                            matches.append((first, f"Same phone: {phone}", 1.0))
+
+            # Check similar names. SequenceMatcher indexes its second sequence,
+            # so scan column by column: each name is indexed once as seq2 and
+            # compared against earlier names as seq1.
+            # Name keys and email domains are computed once per contact, in
+            # lists parallel to `named` (parsed dicts are shared via the cache).
+            named = []
+            names = []
+            domains = []
+            for position, c in enumerate(contacts_parsed):
+                name_key = _name_sort_key(c.get("name", ""))
+                if name_key:
+                    named.append(position)
+                    names.append(name_key)
+                    domains.append(_extract_domain(c.get("email", "")))
+            # Earlier names are indexed by their blocking characters, and a
+            # name is only compared with names sharing one; this skips exactly
+            # the pairs quick_ratio() would reject (see _name_blocking_tokens).
+            # At a non-positive threshold every pair matches, so nothing is
+            # skipped.
+            blocking = threshold > 0
+            if blocking:
+                rarity = Counter(
+                    (char, k) for name in names
+                    for char, count in Counter(name).items() for k in range(count)
+                )
+            blocks: Dict[Tuple[str, int], List[int]] = defaultdict(list)
+            # Names are compared grouped by length, lengths in the order first
+            # seen; which matches are recorded depends on the comparison order.
+            length_rank: Dict[int, int] = {}
+            compare_order: List[int] = []
+            matcher = SequenceMatcher(None)
+            for j, p2 in enumerate(named):
+                name2 = names[j]
+                lb = len(name2)
+                matcher.set_seq2(name2)
+                # Matches below are unioned into p2's group, so its root stays fixed
+                root2 = groups.find(p2)
+
+                if blocking:
+                    tokens = _name_blocking_tokens(name2, rarity, threshold)
+                    candidates = set().union(*[blocks[token] for token in tokens])
+                else:
+                    candidates = range(j)
+
+                for i in sorted(candidates, key=compare_order.__getitem__):
+                    # ratio() can never exceed 2 * min(la, lb) / (la + lb)
+                    la = len(names[i])
+                    if 2.0 * min(la, lb) / (la + lb) < threshold:
                         continue
 
-                    # Skip if already found as duplicate
-                    key = tuple(sorted([c1["resource_name"], c2["resource_name"]]))
-                    if key in seen_resources:
+                    p1 = named[i]
+
+                    # Skip if already in the same group
+                    if groups.find(p1) == root2:
                         continue
 
-                    similarity = _similarity_ratio(name1, name2)
+                    name1 = names[i]
+                    if name1 == name2:
+                        # Same words, in any order
+                        similarity = 1.0
+                    else:
+                        # quick_ratio() is a cheap upper bound on ratio()
+                        matcher.set_seq1(name1)
+                        if matcher.quick_ratio() < threshold:
+                            continue
+                        similarity = matcher.ratio()
+
                     if similarity >= threshold:
                         # Check if same domain for higher confidence
-                        domain1 = _extract_domain(c1.get("email", ""))
-                        domain2 = _extract_domain(c2.get("email", ""))
-                        same_domain = domain1 and domain1 == domain2
+                        same_domain = domains[i] and domains[i] == domains[j]
 
                         confidence = 0.9 if same_domain else similarity
-                        seen_resources.add(key)
-                        duplicate_groups.append({
-                            "contacts": [c1, c2],
-                            "match_reason": f"Similar name ({similarity:.0%})" + (" + same domain" if same_domain else ""),
-                            "confidence": round(confidence, 2)
-                        })
+                        groups.union(p2, p1)
+                        matches.append((
+                            p1,
+                            f"Similar name ({similarity:.0%})" + (" + same domain" if same_domain else ""),
+                            round(confidence, 2)
+                        ))
+
+                compare_order.append(length_rank.setdefault(lb, len(length_rank)) * len(named) + j)
+                if blocking:
+                    for token in tokens:
+                        blocks[token].append(j)
+
+            # Collect each group's reasons and its weakest match confidence
+            reasons: Dict[int, List[str]] = defaultdict(list)
+            confidences: Dict[int, float] = {}
+            for position, reason, confidence in matches:
+                root = groups.find(position)
+                if reason not in reasons[root]:
+                    reasons[root].append(reason)
+                confidences[root] = min(confidences.get(root, 1.0), confidence)
+
+            members: Dict[int, List[int]] = defaultdict(list)
+            for position in range(len(contacts_parsed)):
+                members[groups.find(position)].append(position)
+
+            duplicate_groups = [
+                {
+                    "contacts": [contacts_parsed[position] for position in positions],
+                    "match_reason": "; ".join(reasons[root]),
+                    "confidence": confidences[root]
+                }
+                for root, positions in members.items()
+                if len(positions) > 1
+            ]
 
             # Sort by confidence and limit
             duplicate_groups.sort(key=lambda x: x["confidence"], reverse=True)
@@ -505,7 +1360,7 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             logger.error(f"Failed to find duplicates: {e}")
             return {"success": False, "error": str(e)}
 
-    @mcp.tool()
+    @contacts_tool
     def find_stale_contacts(months: int = 12, max_results: int = 100) -> Dict[str, Any]:
         """
         Find contacts with no email activity (sent or received) in the specified period.
@@ -517,10 +1372,6 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         Returns:
             Dict[str, Any]: List of stale contacts with last activity date
         """
-        error = _check_contacts_enabled()
-        if error:
-            return error
-
         credentials = get_credentials()
         if not credentials:
             return {"success": False, "error": "Not authenticated"}
@@ -535,58 +1386,41 @@ def setup_contact_tools(mcp: FastMCP) -> None:
 
             # Fetch contacts with email addresses
             contacts_with_email = []
-            page_token = None
-            while True:
-                request_params = {
-                    "resourceName": "people/me",
-                    "pageSize": 100,
-                    "personFields": "names,emailAddresses"
-                }
-                if page_token:
-                    request_params["pageToken"] = page_token
-
-                result = people_service.people().connections().list(**request_params).execute()
-
-                for person in result.get("connections", []):
-                    parsed = _parse_person(person)
-                    if parsed.get("email"):
-                        contacts_with_email.append(parsed)
-
-                page_token = result.get("nextPageToken")
-                if not page_token or len(contacts_with_email) >= 500:
-                    break
+            for person in _sync_connections(people_service, credentials, MIN_PERSON_FIELDS):
+                summary = _summarize_person(person)
+                if summary.get("email"):
+                    contacts_with_email.append(summary)
+                    if len(contacts_with_email) >= 500:
+                        break
 
-            # Check email activity for each contact
+            # Check email activity a batch of contacts at a time
             stale_contacts = []
-            for contact in contacts_with_email:
-                email = contact.get("email", "")
-                if not email:
-                    continue
+            for start in range(0, len(contacts_with_email), GMAIL_BATCH_SIZE):
+                chunk = contacts_with_email[start:start + GMAIL_BATCH_SIZE]
+                activity = _find_recent_activity(
+                    gmail_service, [contact["email"] for contact in chunk], cutoff_str
+                )
+
+                for contact in chunk:
+                    email = contact["email"]
+                    # Contacts whose search failed are treated as active
+                    if activity.get(email, True):
+                        continue
 
-                # Search for recent emails from/to this contact
-                query = f"(from:{email} OR to:{email}) after:{cutoff_str}"
-                try:
-                    search_result = gmail_service.users().messages().list(
-                        userId="me",
-                        q=query,
-                        maxResults=1
-                    ).execute()
+                    # No recent activity - this contact is stale
+                    stale_contacts.append({
+                        "resource_name": contact["resource_name"],
+                        "name": contact.get("name", "Unknown"),
+                        "email": email,
+                        "months_inactive": months,
+                        "last_checked": datetime.now().isoformat()
+                    })
 
-                    if not search_result.get("messages"):
-                        # No recent activity - this contact is stale
-                        stale_contacts.append({
-                            "resource_name": contact["resource_name"],
-                            "name": contact.get("name", "Unknown"),
-                            "email": email,
-                            "months_inactive": months,
-                            "last_checked": datetime.now().isoformat()
-                        })
-
-                        if len(stale_contacts) >= max_results:
-                            break
-                except Exception:
-                    # Skip contacts that cause search errors
-                    continue
+                    if len(stale_contacts) >= max_results:
+                        break
+
+                if len(stale_contacts) >= max_results:
+                    break
 
             return {
                 "success": True,
@@ -600,7 +1434,7 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             logger.error(f"Failed to find stale contacts: {e}")
             return {"success": False, "error": str(e)}
 
-    @mcp.tool()
+    @contacts_tool
     def find_incomplete_contacts(
         require_email: bool = True,
         require_phone: bool = False,
@@ -619,10 +1453,6 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         Returns:
             Dict[str, Any]: List of incomplete contacts with missing fields
         """
-        error = _check_contacts_enabled()
-        if error:
-            return error
-
         credentials = get_credentials()
         if not credentials:
             return {"success": False, "error": "Not authenticated"}
@@ -631,50 +1461,34 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             service = get_people_service(credentials)
 
             incomplete_contacts = []
-            page_token = None
-
-            while len(incomplete_contacts) < max_results:
-                request_params = {
-                    "resourceName": "people/me",
-                    "pageSize": 100,
-                    "personFields": "names,emailAddresses,phoneNumbers,organizations"
-                }
-                if page_token:
-                    request_params["pageToken"] = page_token
-
-                result = service.people().connections().list(**request_params).execute()
 
-                for person in result.get("connections", []):
-                    parsed = _parse_person(person)
-                    missing_fields = []
-
-                    has_email = bool(parsed.get("emails"))
-                    has_phone = bool(parsed.get("phones"))
-                    has_org = bool(parsed.get("organization"))
-
-                    if require_email and not has_email:
-                        missing_fields.append("email")
-                    if require_phone and not has_phone:
-                        missing_fields.append("phone")
-                    if require_organization and not has_org:
-                        missing_fields.append("organization")
-
-                    if missing_fields:
-                        incomplete_contacts.append({
-                            "resource_name": parsed["resource_name"],
-                            "name": parsed.get("name", "Unknown"),
-                            "missing_fields": missing_fields,
-                            "has_email": has_email,
-                            "has_phone": has_phone,
-                            "has_organization": has_org
-                        })
-
-                        if len(incomplete_contacts) >= max_results:
-                            break
-
-                page_token = result.get("nextPageToken")
-                if not page_token:
-                    break
+            for person in _sync_connections(service, credentials, CORE_PERSON_FIELDS):
+                summary = _summarize_person(person)
+                missing_fields = []
+
+                has_email = summary["has_email"]
+                has_phone = summary["has_phone"]
+                has_org = summary["has_organization"]
+
+                if require_email and not has_email:
+                    missing_fields.append("email")
+                if require_phone and not has_phone:
+                    missing_fields.append("phone")
+                if require_organization and not has_org:
+                    missing_fields.append("organization")
+
+                if missing_fields:
+                    incomplete_contacts.append({
+                        "resource_name": summary["resource_name"],
+                        "name": summary.get("name", "Unknown"),
+                        "missing_fields": missing_fields,
+                        "has_email": has_email,
+                        "has_phone": has_phone,
+                        "has_organization": has_org
+                    })
+
+                    if len(incomplete_contacts) >= max_results:
+                        break
 
             return {
                 "success": True,
@@ -691,7 +1505,7 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             logger.error(f"Failed to find incomplete contacts: {e}")
             return {"success": False, "error": str(e)}
 
-    @mcp.tool()
+    @contacts_tool
     def export_contacts(
         file_path: str,
         format: str = "csv",
@@ -708,10 +1522,6 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         Returns:
             Dict[str, Any]: Export results including file path and count
         """
-        error = _check_contacts_enabled()
-        if error:
-            return error
-
         if format != "csv":
             return {"success": False, "error": "Only CSV format is currently supported"}
 
@@ -722,54 +1532,42 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         try:
             service = get_people_service(credentials)
 
-            # Fetch all contacts
-            all_contacts = []
-            page_token = None
-
-            while len(all_contacts) < max_results:
-                request_params = {
-                    "resourceName": "people/me",
-                    "pageSize": min(100, max_results - len(all_contacts)),
-                    "personFields": "names,emailAddresses,phoneNumbers,organizations,addresses,biographies"
-                }
-                if page_token:
-                    request_params["pageToken"] = page_token
-
-                result = service.people().connections().list(**request_params).execute()
-
-                for person in result.get("connections", []):
-                    all_contacts.append(_parse_person(person))
-
-                page_token = result.get("nextPageToken")
-                if not page_token:
-                    break
-
-            # Write to CSV
             fieldnames = ["name", "email", "phone", "organization", "title", "notes"]
 
             # Ensure directory exists
             os.makedirs(os.path.dirname(file_path) if os.path.dirname(file_path) else ".", exist_ok=True)
 
+            # Stream each page to the CSV as it arrives
+            exported = 0
             with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-                writer.writeheader()
-
-                for contact in all_contacts:
-                    row = {
-                        "name": contact.get("name", ""),
-                        "email": contact.get("email", ""),
-                        "phone": contact.get("phone", ""),
-                        "organization": contact.get("organization", ""),
-                        "title": contact.get("title", ""),
-                        "notes": contact.get("notes", "")
-                    }
-                    writer.writerow(row)
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+
+                for result in _iter_connection_pages(
+                    service,
+                    "names,emailAddresses,phoneNumbers,organizations,addresses,biographies",
+                    100,
+                    max_contacts=max_results
+                ):
+                    rows = [
+                        (
+                            contact.get("name", ""),
+                            contact.get("email", ""),
+                            contact.get("phone", ""),
+                            contact.get("organization", ""),
+                            contact.get("title", ""),
+                            contact.get("notes", "")
+                        )
+                        for contact in map(_parse_listed_person, result.get("connections", []))
+                    ]
+                    writer.writerows(rows)
+                    exported += len(rows)
 
             return {
                 "success": True,
                 "file_path": file_path,
                 "format": format,
-                "exported": len(all_contacts)
+                "exported": exported
             }
 
         except Exception as e:
@@ -780,7 +1578,7 @@ def setup_contact_tools(mcp: FastMCP) -> None:
     # Contact CRUD Tools (requires contacts write scope)
     # =========================================================================
 
-    @mcp.tool()
+    @contacts_tool
     def create_contact(
         name: str,
         email: Optional[str] = None,
@@ -805,10 +1603,6 @@ def setup_contact_tools(mcp: FastMCP) -> None:
 
         Note: Requires contacts write scope. User may need to re-authenticate.
         """
-        error = _check_contacts_enabled()
-        if error:
-            return error
-
         credentials = get_credentials()
         if not credentials:
             return {"success": False, "error": "Not authenticated"}
@@ -816,26 +1610,9 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         try:
             service = get_people_service(credentials)
 
-            # Build person object
-            person = {
-                "names": [{"givenName": name.split()[0] if ' ' in name else name,
-                          "familyName": ' '.join(name.split()[1:]) if ' ' in name else ""}]
-            }
-
-            if email:
-                person["emailAddresses"] = [{"value": email}]
-            if phone:
-                person["phoneNumbers"] = [{"value": phone}]
-            if organization or title:
-                person["organizations"] = [{}]
-                if organization:
-                    person["organizations"][0]["name"] = organization
-                if title:
-                    person["organizations"][0]["title"] = title
-            if notes:
-                person["biographies"] = [{"value": notes, "contentType": "TEXT_PLAIN"}]
-
+            person, _ = _build_person_body(name, email, phone, organization, title, notes)
             result = service.people().createContact(body=person).execute()
+            _clear_contact_cache()
 
             return {
                 "success": True,
@@ -844,8 +1621,7 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             }
 
         except Exception as e:
-            error_str = str(e)
-            if "403" in error_str or "scope" in error_str.lower():
+            if isinstance(e, HttpError) and e.resp.status == 403:
                 return {
                     "success": False,
                     "error": "Permission denied. You need to re-authenticate with contacts write scope."
@@ -853,7 +1629,7 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             logger.error(f"Failed to create contact: {e}")
             return {"success": False, "error": str(e)}
 
-    @mcp.tool()
+    @contacts_tool
     def update_contact(
         resource_name: Optional[str] = None,
         email_lookup: Optional[str] = None,
@@ -880,14 +1656,13 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             append_notes (bool): Append to existing notes instead of replacing (default: False)
 
         Returns:
-            Dict[str, Any]: Updated contact details
+            Dict[str, Any]: Updated contact details. If the contact changed
+            between reading and writing it, returns error "conflict" with
+            retry=True and the contact's current_etag; calling again applies
+            the update to the latest version.
 
         Note: Either resource_name or email_lookup must be provided.
         """
-        error = _check_contacts_enabled()
-        if error:
-            return error
-
         if not resource_name and not email_lookup:
             return {"success": False, "error": "Either resource_name or email_lookup must be provided"}
 
@@ -900,59 +1675,27 @@ def setup_contact_tools(mcp: FastMCP) -> None:
 
             # Look up contact if needed
             if email_lookup and not resource_name:
-                search_result = service.people().searchContacts(
-                    query=email_lookup,
-                    pageSize=5,
-                    readMask="names,emailAddresses"
-                ).execute()
-
-                for item in search_result.get("results", []):
-                    person = item.get("person", {})
-                    for e in person.get("emailAddresses", []):
-                        if e.get("value", "").lower() == email_lookup.lower():
-                            resource_name = person.get("resourceName")
-                            break
-                    if resource_name:
-                        break
-
+                resource_name = _lookup_resource_name(service, credentials, email_lookup)
                 if not resource_name:
                     return {"success": False, "error": f"No contact found with email: {email_lookup}"}
 
-            # Get current contact
+            # Build update; notes are added once the existing ones are known
+            update_person, update_fields = _build_person_body(name, email, phone, organization, title)
+
+            if not update_fields and not notes:
+                return {"success": False, "error": "No fields to update"}
+
+            # Get the current etag for optimistic locking, plus the existing
+            # notes only when appending to them
+            read_notes = bool(notes and append_notes)
             current = service.people().get(
                 resourceName=resource_name,
-                personFields="names,emailAddresses,phoneNumbers,organizations,biographies"
+                personFields="biographies" if read_notes else "metadata",
+                fields="etag,biographies" if read_notes else "etag"
             ).execute()
 
-            # Build update
-            update_person = {}
-            update_fields = []
-
-            if name:
-                update_person["names"] = [{
-                    "givenName": name.split()[0] if ' ' in name else name,
-                    "familyName": ' '.join(name.split()[1:]) if ' ' in name else ""
-                }]
-                update_fields.append("names")
-
-            if email:
-                update_person["emailAddresses"] = [{"value": email}]
-                update_fields.append("emailAddresses")
-
-            if phone:
-                update_person["phoneNumbers"] = [{"value": phone}]
-                update_fields.append("phoneNumbers")
-
-            if organization or title:
-                update_person["organizations"] = [{}]
-                if organization:
-                    update_person["organizations"][0]["name"] = organization
-                if title:
-                    update_person["organizations"][0]["title"] = title
-                update_fields.append("organizations")
-
             if notes:
-                if append_notes:
+                if read_notes:
                     existing_notes = ""
                     for bio in current.get("biographies", []):
                         existing_notes = bio.get("value", "")
@@ -961,17 +1704,20 @@ def setup_contact_tools(mcp: FastMCP) -> None:
                 update_person["biographies"] = [{"value": notes, "contentType": "TEXT_PLAIN"}]
                 update_fields.append("biographies")
 
-            if not update_fields:
-                return {"success": False, "error": "No fields to update"}
-
             # Include etag for optimistic locking
             update_person["etag"] = current.get("etag")
 
-            result = service.people().updateContact(
-                resourceName=resource_name,
-                updatePersonFields=",".join(update_fields),
-                body=update_person
-            ).execute()
+            try:
+                result = service.people().updateContact(
+                    resourceName=resource_name,
+                    updatePersonFields=",".join(update_fields),
+                    body=update_person
+                ).execute()
+            except HttpError as e:
+                if _is_etag_conflict(e):
+                    return _etag_conflict_response(service, resource_name)
+                raise
+            _clear_contact_cache()
 
             return {
                 "success": True,
@@ -980,8 +1726,7 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             }
 
         except Exception as e:
-            error_str = str(e)
-            if "403" in error_str or "scope" in error_str.lower():
+            if isinstance(e, HttpError) and e.resp.status == 403:
                 return {
                     "success": False,
                     "error": "Permission denied. You need to re-authenticate with contacts write scope."
@@ -989,7 +1734,7 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             logger.error(f"Failed to update contact: {e}")
             return {"success": False, "error": str(e)}
 
-    @mcp.tool()
+    @contacts_tool
     def delete_contact(
         resource_name: Optional[str] = None,
         email: Optional[str] = None
@@ -1006,10 +1751,6 @@ def setup_contact_tools(mcp: FastMCP) -> None:
 
         Note: Either resource_name or email must be provided.
         """
-        error = _check_contacts_enabled()
-        if error:
-            return error
-
         if not resource_name and not email:
             return {"success": False, "error": "Either resource_name or email must be provided"}
 
@@ -1022,25 +1763,12 @@ def setup_contact_tools(mcp: FastMCP) -> None:
 
             # Look up contact if needed
             if email and not resource_name:
-                search_result = service.people().searchContacts(
-                    query=email,
-                    pageSize=5,
-                    readMask="names,emailAddresses"
-                ).execute()
-
-                for item in search_result.get("results", []):
-                    person = item.get("person", {})
-                    for e in person.get("emailAddresses", []):
-                        if e.get("value", "").lower() == email.lower():
-                            resource_name = person.get("resourceName")
-                            break
-                    if resource_name:
-                        break
-
+                resource_name = _lookup_resource_name(service, credentials, email)
                 if not resource_name:
                     return {"success": False, "error": f"No contact found with email: {email}"}
 
             service.people().deleteContact(resourceName=resource_name).execute()
+            _clear_contact_cache()
 
             return {
                 "success": True,
@@ -1048,8 +1776,7 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             }
 
         except Exception as e:
-            error_str = str(e)
-            if "403" in error_str or "scope" in error_str.lower():
+            if isinstance(e, HttpError) and e.resp.status == 403:
                 return {
                     "success": False,
                     "error": "Permission denied. You need to re-authenticate with contacts write scope."
@@ -1057,7 +1784,7 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             logger.error(f"Failed to delete contact: {e}")
             return {"success": False, "error": str(e)}
 
-    @mcp.tool()
+    @contacts_tool
     def merge_contacts(
         resource_names: List[str],
         primary: Optional[str] = None,
@@ -1067,21 +1794,22 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         Merge multiple contacts into one, combining all unique information.
 
         Args:
-            resource_names (List[str]): List of contact resource names to merge
+            resource_names (List[str]): List of contact resource names to merge (at most 200)
             primary (str, optional): Resource name of contact to keep (default: first in list)
             dry_run (bool): Preview merge without executing (default: True)
 
         Returns:
-            Dict[str, Any]: Merged contact preview or result
+            Dict[str, Any]: Merged contact preview or result. If the primary
+            contact changed while merging, nothing is deleted and error
+            "conflict" is returned with retry=True and its current_etag;
+            calling again merges the latest versions.
 
         Note: Requires contacts write scope for actual merge.
         """
-        error = _check_contacts_enabled()
-        if error:
-            return error
-
         if len(resource_names) < 2:
             return {"success": False, "error": "At least 2 contacts required to merge"}
+        if len(resource_names) > MERGE_MAX_CONTACTS:
+            return {"success": False, "error": f"At most {MERGE_MAX_CONTACTS} contacts can be merged at once"}
 
         credentials = get_credentials()
         if not credentials:
@@ -1090,41 +1818,49 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         try:
             service = get_people_service(credentials)
 
-            # Fetch all contacts to merge
-            contacts_to_merge = []
-            for rn in resource_names:
-                person = service.people().get(
-                    resourceName=rn,
-                    personFields="names,emailAddresses,phoneNumbers,organizations,addresses,biographies,photos"
-                ).execute()
-                contacts_to_merge.append(person)
+            # Fetch all contacts to merge in one request
+            batch_result = service.people().getBatchGet(
+                resourceNames=resource_names,
+                personFields=FULL_PERSON_FIELDS,
+                fields=(
+                    "responses(requestedResourceName,status(message),"
+                    f"person({_person_response_fields(FULL_PERSON_FIELDS)}))"
+                )
+            ).execute()
+            fetched = {}
+            for response in batch_result.get("responses", []):
+                requested = response.get("requestedResourceName")
+                if "person" not in response:
+                    message = (response.get("status") or _EMPTY).get("message", "not found")
+                    raise Exception(f"Failed to fetch {requested}: {message}")
+                fetched[requested] = response["person"]
+            contacts_to_merge = [fetched[rn] for rn in resource_names]
 
             # Determine primary contact
             primary_rn = primary if primary else resource_names[0]
             primary_idx = resource_names.index(primary_rn) if primary_rn in resource_names else 0
 
-            # Combine all unique information
-            merged_emails = []
-            merged_phones = []
+            # Combine all unique information, keeping the first entry for each
+            # normalized value in order
+            email_by_value: Dict[str, Dict[str, Any]] = {}
+            phone_by_value: Dict[str, Dict[str, Any]] = {}
             merged_addresses = []
-            seen_emails = set()
-            seen_phones = set()
 
             for person in contacts_to_merge:
                 for email in person.get("emailAddresses", []):
                     val = email.get("value", "").lower()
-                    if val and val not in seen_emails:
-                        seen_emails.add(val)
-                        merged_emails.append(email)
+                    if val:
+                        email_by_value.setdefault(val, email)
 
                 for phone in person.get("phoneNumbers", []):
                     val = _normalize_phone(phone.get("value", ""))
-                    if val and val not in seen_phones:
-                        seen_phones.add(val)
-                        merged_phones.append(phone)
+                    if val:
+                        phone_by_value.setdefault(val, phone)
+
+                merged_addresses.extend(person.get("addresses", []))
 
-                for addr in person.get("addresses", []):
-                    merged_addresses.append(addr)
+            merged_emails = list(email_by_value.values())
+            merged_phones = list(phone_by_value.values())
 
             # Build merged contact preview
             primary_contact = contacts_to_merge[primary_idx]
@@ -1146,43 +1882,65 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             }
 
             if not dry_run:
+                _clear_contact_cache()
+
                 # Actually perform the merge
                 # Update primary with merged info
                 update_fields = []
                 update_body = {"etag": primary_contact.get("etag")}
 
-                if merged_emails:
+                # Only write fields the other contacts add values to
+                primary_emails = {
+                    e.get("value", "").lower() for e in primary_contact.get("emailAddresses", [])
+                }
+                primary_phones = {
+                    _normalize_phone(p.get("value", "")) for p in primary_contact.get("phoneNumbers", [])
+                }
+                if merged_emails and not email_by_value.keys() <= primary_emails:
                     update_body["emailAddresses"] = merged_emails
                     update_fields.append("emailAddresses")
-                if merged_phones:
+                if merged_phones and not phone_by_value.keys() <= primary_phones:
                     update_body["phoneNumbers"] = merged_phones
                     update_fields.append("phoneNumbers")
 
                 if update_fields:
-                    service.people().updateContact(
-                        resourceName=primary_rn,
-                        updatePersonFields=",".join(update_fields),
-                        body=update_body
-                    ).execute()
+                    try:
+                        service.people().updateContact(
+                            resourceName=primary_rn,
+                            updatePersonFields=",".join(update_fields),
+                            body=update_body
+                        ).execute()
+                    except HttpError as e:
+                        if _is_etag_conflict(e):
+                            return _etag_conflict_response(service, primary_rn)
+                        raise
+
+                # Delete other contacts in one batch request
+                to_delete = result["contacts_to_remove"]
+                delete_failed = set()
+
+                def delete_callback(request_id, response, exception):
+                    if exception is not None:
+                        rn = to_delete[int(request_id)]
+                        delete_failed.add(rn)
+                        logger.warning(f"Failed to delete {rn}: {exception}")
+
+                batch = service.new_batch_http_request(callback=delete_callback)
+                for idx, rn in enumerate(to_delete):
+                    batch.add(service.people().deleteContact(resourceName=rn), request_id=str(idx))
+                try:
+                    batch.execute()
+                except Exception as del_err:
+                    logger.warning(f"Batch delete failed, deleting individually: {del_err}")
+                    delete_failed = _delete_contacts_concurrently(service, credentials, to_delete)
 
-                # Delete other contacts
-                deleted = []
-                for rn in resource_names:
-                    if rn != primary_rn:
-                        try:
-                            service.people().deleteContact(resourceName=rn).execute()
-                            deleted.append(rn)
-                        except Exception as del_err:
-                            logger.warning(f"Failed to delete {rn}: {del_err}")
-
-                result["contacts_deleted"] = deleted
+                result["contacts_deleted"] = [rn for rn in to_delete if rn not in delete_failed]
                 result["message"] = f"Merged {len(resource_names)} contacts into {primary_rn}"
 
             return result
 
         except Exception as e:
-            error_str = str(e)
-            if "403" in error_str or "scope" in error_str.lower():
+            if isinstance(e, HttpError) and e.resp.status == 403:
                 return {
                     "success": False,
                     "error": "Permission denied. You need to re-authenticate with contacts write scope."
@@ -1190,7 +1948,7 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             logger.error(f"Failed to merge contacts: {e}")
             return {"success": False, "error": str(e)}
 
-    @mcp.tool()
+    @contacts_tool
     def enrich_contact_from_email(
         email_id: str,
         contact_email: Optional[str] = None,
@@ -1212,10 +1970,6 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         - Job title and company
         - LinkedIn URL
         """
-        error = _check_contacts_enabled()
-        if error:
-            return error
-
         credentials = get_credentials()
         if not credentials:
             return {"success": False, "error": "Not authenticated"}
@@ -1228,31 +1982,28 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             message = gmail_service.users().messages().get(
                 userId="me",
                 id=email_id,
-                format="full"
+                format="full",
+                fields=ENRICH_MESSAGE_FIELDS
             ).execute()
 
-            # Extract sender email if not specified
-            headers = {h["name"].lower(): h["value"] for h in message.get("payload", {}).get("headers", [])}
-            from_header = headers.get("from", "")
+            # Extract sender email if not specified; only From is needed, so
+            # stop at the first match instead of mapping every header
+            from_header = next(
+                (
+                    h.get("value", "") for h in message.get("payload", _EMPTY).get("headers", ())
+                    if h.get("name", "").lower() == "from"
+                ),
+                ""
+            )
 
             # Parse email from "Name <email@example.com>" format
-            email_match = re.search(r'<([^>]+)>', from_header)
+            email_match = FROM_EMAIL_PATTERN.search(from_header)
             sender_email = email_match.group(1) if email_match else from_header
             target_email = contact_email or sender_email
 
             # Get email body
-            body = ""
-            payload = message.get("payload", {})
-            if "body" in payload and payload["body"].get("data"):
-                import base64
-                body = base64.urlsafe_b64decode(payload["body"]["data"]).decode("utf-8", errors="ignore")
-            else:
-                # Check parts for text/plain
-                for part in payload.get("parts", []):
-                    if part.get("mimeType") == "text/plain":
-                        if "body" in part and part["body"].get("data"):
-                            body = base64.urlsafe_b64decode(part["body"]["data"]).decode("utf-8", errors="ignore")
-                            break
+            data = find_body_data(message.get("payload", {}), plain_only=True)
+            body = b64url_decode(data).decode("utf-8", errors="ignore") if data else ""
 
             # Extract signature info (usually in last ~20 lines)
             lines = body.split('\n')
@@ -1274,17 +2025,12 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             # Find existing contact
             search_result = people_service.people().searchContacts(
                 query=target_email,
-                pageSize=5,
-                readMask="names,emailAddresses,phoneNumbers,organizations"
+                pageSize=LOOKUP_PAGE_SIZE,
+                readMask=CORE_PERSON_FIELDS,
+                fields=_search_response_fields(CORE_PERSON_FIELDS)
             ).execute()
 
-            existing_contact = None
-            for item in search_result.get("results", []):
-                person = item.get("person", {})
-                for e in person.get("emailAddresses", []):
-                    if e.get("value", "").lower() == target_email.lower():
-                        existing_contact = person
-                        break
+            existing_contact = _find_person_by_email(search_result.get("results", []), target_email)
 
             if existing_contact:
                 result["existing_contact"] = _parse_person(existing_contact)
@@ -1315,6 +2061,7 @@ def setup_contact_tools(mcp: FastMCP) -> None:
                         updatePersonFields=",".join(update_fields),
                         body=update_body
                     ).execute()
+                    _clear_contact_cache()
                     result["updated_contact"] = _parse_person(updated)
                     result["fields_updated"] = update_fields
                 else:
@@ -1323,8 +2070,7 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             return result
 
         except Exception as e:
-            error_str = str(e)
-            if "403" in error_str or "scope" in error_str.lower():
+            if isinstance(e, HttpError) and e.resp.status == 403:
                 return {
                     "success": False,
                     "error": "Permission denied for update. Set dry_run=True to preview."
@@ -1336,18 +2082,19 @@ def setup_contact_tools(mcp: FastMCP) -> None:
     # Contact Groups Tools
     # =========================================================================
 
-    @mcp.tool()
-    def list_contact_groups() -> Dict[str, Any]:
+    @contacts_tool
+    def list_contact_groups(max_results: int = 100, page_token: Optional[str] = None) -> Dict[str, Any]:
         """
-        List all contact groups (labels) in the user's account.
+        List contact groups (labels) in the user's account.
+
+        Args:
+            max_results (int): Maximum number of groups to return (default: 100)
+            page_token (str, optional): Token for pagination
 
         Returns:
-            Dict[str, Any]: List of contact groups with member counts
+            Dict[str, Any]: List of contact groups with member counts, and
+            next_page_token when more groups remain
         """
-        error = _check_contacts_enabled()
-        if error:
-            return error
-
         credentials = get_credentials()
         if not credentials:
             return {"success": False, "error": "Not authenticated"}
@@ -1355,31 +2102,46 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         try:
             service = get_people_service(credentials)
 
-            result = service.contactGroups().list(
-                pageSize=100,
-                groupFields="name,memberCount,groupType"
-            ).execute()
+            max_results = max(max_results, 1)
 
             groups = []
-            for group in result.get("contactGroups", []):
-                groups.append({
-                    "resource_name": group.get("resourceName", ""),
-                    "name": group.get("name", ""),
-                    "member_count": group.get("memberCount", 0),
-                    "group_type": group.get("groupType", "")
-                })
+            while True:
+                # Size each page to what is still wanted so the next page
+                # token resumes exactly after the last returned group
+                request_params = {
+                    "pageSize": min(max_results - len(groups), CONTACT_GROUPS_PAGE_SIZE),
+                    "groupFields": "name,memberCount,groupType",
+                    "fields": "contactGroups(resourceName,name,memberCount,groupType),nextPageToken"
+                }
+                if page_token:
+                    request_params["pageToken"] = page_token
+
+                result = service.contactGroups().list(**request_params).execute()
+
+                for group in result.get("contactGroups", []):
+                    groups.append({
+                        "resource_name": group.get("resourceName", ""),
+                        "name": group.get("name", ""),
+                        "member_count": group.get("memberCount", 0),
+                        "group_type": group.get("groupType", "")
+                    })
+
+                page_token = result.get("nextPageToken")
+                if not page_token or len(groups) >= max_results:
+                    break
 
             return {
                 "success": True,
                 "groups": groups,
-                "total": len(groups)
+                "total": len(groups),
+                "next_page_token": page_token
             }
 
         except Exception as e:
             logger.error(f"Failed to list contact groups: {e}")
             return {"success": False, "error": str(e)}
 
-    @mcp.tool()
+    @contacts_tool
     def create_contact_group(name: str) -> Dict[str, Any]:
         """
         Create a new contact group.
@@ -1390,10 +2152,6 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         Returns:
             Dict[str, Any]: Created group details
         """
-        error = _check_contacts_enabled()
-        if error:
-            return error
-
         credentials = get_credentials()
         if not credentials:
             return {"success": False, "error": "Not authenticated"}
@@ -1416,13 +2174,12 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             }
 
         except Exception as e:
-            error_str = str(e)
-            if "403" in error_str or "scope" in error_str.lower():
+            if isinstance(e, HttpError) and e.resp.status == 403:
                 return {"success": False, "error": "Permission denied. Re-authenticate with write scope."}
             logger.error(f"Failed to create contact group: {e}")
             return {"success": False, "error": str(e)}
 
-    @mcp.tool()
+    @contacts_tool
     def add_contacts_to_group(
         group_resource_name: str,
         contact_resource_names: List[str]
@@ -1437,10 +2194,6 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         Returns:
             Dict[str, Any]: Result of the operation
         """
-        error = _check_contacts_enabled()
-        if error:
-            return error
-
         credentials = get_credentials()
         if not credentials:
             return {"success": False, "error": "Not authenticated"}
@@ -1448,26 +2201,27 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         try:
             service = get_people_service(credentials)
 
-            service.contactGroups().members().modify(
-                resourceName=group_resource_name,
-                body={"resourceNamesToAdd": contact_resource_names}
-            ).execute()
+            modified, failed = _modify_group_members(
+                service, group_resource_name, "resourceNamesToAdd", contact_resource_names
+            )
 
-            return {
+            result = {
                 "success": True,
-                "message": f"Added {len(contact_resource_names)} contacts to group",
+                "message": f"Added {len(modified)} contacts to group",
                 "group": group_resource_name,
-                "contacts_added": contact_resource_names
+                "contacts_added": modified
             }
+            if failed:
+                result["contacts_failed"] = failed
+            return result
 
         except Exception as e:
-            error_str = str(e)
-            if "403" in error_str or "scope" in error_str.lower():
+            if isinstance(e, HttpError) and e.resp.status == 403:
                 return {"success": False, "error": "Permission denied. Re-authenticate with write scope."}
             logger.error(f"Failed to add contacts to group: {e}")
             return {"success": False, "error": str(e)}
 
-    @mcp.tool()
+    @contacts_tool
     def remove_contacts_from_group(
         group_resource_name: str,
         contact_resource_names: List[str]
@@ -1482,10 +2236,6 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         Returns:
             Dict[str, Any]: Result of the operation
         """
-        error = _check_contacts_enabled()
-        if error:
-            return error
-
         credentials = get_credentials()
         if not credentials:
             return {"success": False, "error": "Not authenticated"}
@@ -1493,26 +2243,27 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         try:
             service = get_people_service(credentials)
 
-            service.contactGroups().members().modify(
-                resourceName=group_resource_name,
-                body={"resourceNamesToRemove": contact_resource_names}
-            ).execute()
+            modified, failed = _modify_group_members(
+                service, group_resource_name, "resourceNamesToRemove", contact_resource_names
+            )
 
-            return {
+            result = {
                 "success": True,
-                "message": f"Removed {len(contact_resource_names)} contacts from group",
+                "message": f"Removed {len(modified)} contacts from group",
                 "group": group_resource_name,
-                "contacts_removed": contact_resource_names
+                "contacts_removed": modified
             }
+            if failed:
+                result["contacts_failed"] = failed
+            return result
 
         except Exception as e:
-            error_str = str(e)
-            if "403" in error_str or "scope" in error_str.lower():
+            if isinstance(e, HttpError) and e.resp.status == 403:
                 return {"success": False, "error": "Permission denied. Re-authenticate with write scope."}
             logger.error(f"Failed to remove contacts from group: {e}")
             return {"success": False, "error": str(e)}
 
-    @mcp.tool()
+    @contacts_tool
     def delete_contact_group(group_resource_name: str, delete_contacts: bool = False) -> Dict[str, Any]:
         """
         Delete a contact group.
@@ -1524,10 +2275,6 @@ def setup_contact_tools(mcp: FastMCP) -> None:
         Returns:
             Dict[str, Any]: Result of the operation
         """
-        error = _check_contacts_enabled()
-        if error:
-            return error
-
         credentials = get_credentials()
         if not credentials:
             return {"success": False, "error": "Not authenticated"}
@@ -1547,8 +2294,7 @@ def setup_contact_tools(mcp: FastMCP) -> None:
             }
 
         except Exception as e:
-            error_str = str(e)
-            if "403" in error_str or "scope" in error_str.lower():
+            if isinstance(e, HttpError) and e.resp.status == 403:
                 return {"success": False, "error": "Permission denied. Re-authenticate with write scope."}
             logger.error(f"Failed to delete contact group: {e}")
             return {"success": False, "error": str(e)}
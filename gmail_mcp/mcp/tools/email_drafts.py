@@ -5,18 +5,229 @@ Handles draft management: list, get, update, delete.
 """
 
 import base64
+import quopri
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email import policy
+from email.header import Header
+from email.parser import BytesParser
 
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from mcp.server.fastmcp import FastMCP
 
 from gmail_mcp.utils.logger import get_logger
-from gmail_mcp.utils.services import get_gmail_service
+from gmail_mcp.utils.services import get_gmail_service, get_credentials_hash
+from gmail_mcp.utils.draft_cache import get_cached_draft, cache_draft, invalidate_cached_draft
+from gmail_mcp.gmail.helpers import b64url_decode, find_body_data
 from gmail_mcp.auth.oauth import get_credentials
 
 logger = get_logger(__name__)
 
+# Headers shown for each draft by list_drafts
+LIST_DRAFT_HEADERS = ["To", "Subject", "Date"]
+_LIST_DRAFT_HEADER_NAMES = frozenset(name.lower() for name in LIST_DRAFT_HEADERS)
+
+# Shared fallback for missing nested dicts, so lookups don't allocate a new {}
+_EMPTY: Dict[str, Any] = {}
+
+# Headers read by _parse_draft_message, lowercased
+_DRAFT_HEADER_NAMES = frozenset(("to", "cc", "bcc", "subject", "from", "date"))
+
+# Partial-response masks limiting Gmail responses to the fields we read
+DRAFT_LIST_FIELDS = "drafts(id,message/id),resultSizeEstimate,nextPageToken"
+LIST_MESSAGE_FIELDS = "id,snippet,payload/headers"
+DRAFT_FIELDS = "id,message(id,threadId,labelIds,snippet,payload)"
+DRAFT_UPDATE_FIELDS = "id,message(id,threadId,labelIds)"
+
+# Concurrent fetches when the batch endpoint is unavailable
+FETCH_MAX_WORKERS = 16
+
+
+def _get_draft_messages_concurrently(service, credentials, message_ids: List[str]) -> Dict[int, Dict[str, Any]]:
+    """
+    Fetch draft message headers with one request per message, run on a thread pool.
+
+    Used when the batch endpoint rejects a batch. The service's shared http
+    object is not thread-safe, so each request runs on its own connection.
+
+    Returns:
+        Dict[int, Dict[str, Any]]: Messages by index in message_ids; failed
+        fetches are logged and left out
+    """
+    def fetch(message_id: str) -> Optional[Dict[str, Any]]:
+        http = AuthorizedHttp(credentials, http=httplib2.Http())
+        try:
+            return service.users().messages().get(
+                userId="me",
+                id=message_id,
+                format="metadata",
+                metadataHeaders=LIST_DRAFT_HEADERS,
+                fields=LIST_MESSAGE_FIELDS
+            ).execute(http=http)
+        except Exception as e:
+            logger.error(f"Failed to fetch draft message {message_id}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(FETCH_MAX_WORKERS, len(message_ids))) as executor:
+        messages = list(executor.map(fetch, message_ids))
+    return {idx: message for idx, message in enumerate(messages) if message is not None}
+
+
+# MIME headers for messages built by _build_plain_message
+_PLAIN_TEXT_HEADERS = (
+    "MIME-Version: 1.0\r\n"
+    'Content-Type: text/plain; charset="utf-8"\r\n'
+)
+
+# RFC 5322 line limits, excluding the CRLF: lines must not exceed 998 octets
+# and header lines should be folded at 78 characters
+MAX_LINE_OCTETS = 998
+HEADER_FOLD_LENGTH = 78
+
+
+def _format_header(name: str, value: str, linesep: str = "\r\n") -> str:
+    """
+    Format one header line without its line ending, encoding non-ASCII values
+    as RFC 2047 encoded words and folding long lines with linesep.
+
+    Raises:
+        ValueError: If the value contains a line break
+    """
+    if "\r" in value or "\n" in value:
+        raise ValueError(f"{name} header must not contain line breaks")
+    if not value.isascii():
+        value = Header(value, "utf-8", header_name=name).encode(linesep=linesep)
+    elif len(name) + len(value) + 2 > HEADER_FOLD_LENGTH:
+        # Fold long values such as recipient lists at commas and spaces
+        value = Header(value, header_name=name).encode(linesep=linesep)
+    return f"{name}: {value}"
+
+
+def _build_plain_message(headers: Dict[str, str], body: str) -> bytes:
+    """
+    Build a single-part UTF-8 text/plain RFC 5322 message.
+
+    Writes the wire format directly rather than through email.mime and its
+    generator. Empty headers are left out, non-ASCII values are sent as
+    RFC 2047 encoded words and long values are folded. The body is sent
+    8bit unless a line exceeds 998 octets, which 8bit cannot wrap; such
+    bodies are sent quoted-printable.
+
+    Raises:
+        ValueError: If a header value contains a line break
+    """
+    lines = [f"{_format_header(name, value)}\r\n" for name, value in headers.items() if value]
+    text = body.replace("\r\n", "\n").encode("utf-8")
+    if len(text) > MAX_LINE_OCTETS and any(
+        len(line) > MAX_LINE_OCTETS for line in text.split(b"\n")
+    ):
+        encoding, text = "quoted-printable", quopri.encodestring(text)
+    else:
+        encoding = "8bit"
+
+    lines.append(_PLAIN_TEXT_HEADERS)
+    lines.append(f"Content-Transfer-Encoding: {encoding}\r\n\r\n")
+    return "".join(lines).encode("ascii") + text.replace(b"\n", b"\r\n")
+
+
+def _replace_headers(raw: bytes, headers: Dict[str, Optional[str]]) -> bytes:
+    """
+    Replace headers in a raw RFC 5322 message, leaving the body untouched.
+
+    Header lines are spliced as bytes: replaced headers (with their
+    continuation lines) are dropped, new values are appended, and every
+    other header and the body are copied unchanged.
+
+    Args:
+        raw: The message bytes
+        headers: New header values by name; None keeps the current value and
+            an empty string removes the header
+
+    Returns:
+        bytes: The message with the headers replaced
+    """
+    linesep = b"\r\n"
+    head, separator, body = raw.partition(b"\r\n\r\n")
+    if not separator:
+        head, separator, body = raw.partition(b"\n\n")
+        if separator:
+            linesep = b"\n"
+        else:
+            head, separator = raw.rstrip(b"\r\n"), b"\r\n\r\n"
+
+    replaced = {name.lower().encode("ascii") for name, value in headers.items() if value is not None}
+    lines = []
+    skipping = False
+    for line in head.split(linesep):
+        if not line:
+            continue
+        if line[:1] in (b" ", b"\t"):
+            # Continuation of the previous header
+            if not skipping:
+                lines.append(line)
+            continue
+        skipping = line.partition(b":")[0].strip().lower() in replaced
+        if not skipping:
+            lines.append(line)
+
+    for name, value in headers.items():
+        if value:
+            lines.append(_format_header(name, value, linesep.decode("ascii")).encode("ascii"))
+    return linesep.join(lines) + separator + body
+
+
+def _extract_headers(headers: List[Dict[str, str]], wanted: frozenset) -> Dict[str, str]:
+    """
+    Map the wanted headers by lowercased name, skipping all others.
+
+    Like a dict over every header, a repeated header keeps its last value.
+    """
+    found = {}
+    for header in headers:
+        name = header["name"].lower()
+        if name in wanted:
+            found[name] = header["value"]
+    return found
+
+
+def _parse_raw_draft(draft: Dict[str, Any], raw: bytes) -> Dict[str, Any]:
+    """
+    Parse a draft from its raw RFC 5322 message.
+
+    Args:
+        draft: Draft object from Gmail API, used for the IDs and labels
+        raw: The draft's message bytes
+
+    Returns:
+        Parsed draft with the same keys as _parse_draft_message
+    """
+    message = draft.get("message", {})
+    parsed = BytesParser(policy=policy.default).parsebytes(raw)
+
+    body = ""
+    body_part = parsed.get_body(preferencelist=("plain", "html"))
+    if body_part is not None:
+        try:
+            body = body_part.get_content()
+        except (LookupError, UnicodeError) as e:
+            logger.warning(f"Could not decode body of draft {draft.get('id')}: {e}")
+
+    return {
+        "draft_id": draft.get("id"),
+        "message_id": message.get("id"),
+        "thread_id": message.get("threadId"),
+        "to": str(parsed.get("to", "")),
+        "cc": str(parsed.get("cc", "")),
+        "bcc": str(parsed.get("bcc", "")),
+        "subject": str(parsed.get("subject", "(No Subject)")),
+        "from": str(parsed.get("from", "")),
+        "date": str(parsed.get("date", "")),
+        "body": body,
+        "snippet": message.get("snippet", ""),
+        "labels": message.get("labelIds", [])
+    }
+
 
 def _parse_draft_message(draft: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -30,19 +241,10 @@ def _parse_draft_message(draft: Dict[str, Any]) -> Dict[str, Any]:
     """
     message = draft.get("message", {})
     payload = message.get("payload", {})
-    headers = {h["name"].lower(): h["value"] for h in payload.get("headers", [])}
+    headers = _extract_headers(payload.get("headers", ()), _DRAFT_HEADER_NAMES)
 
-    # Extract body
-    body = ""
-    if "parts" in payload:
-        for part in payload["parts"]:
-            if part.get("mimeType") == "text/plain" and "data" in part.get("body", {}):
-                body = base64.urlsafe_b64decode(part["body"]["data"]).decode("utf-8")
-                break
-            elif part.get("mimeType") == "text/html" and "data" in part.get("body", {}) and not body:
-                body = base64.urlsafe_b64decode(part["body"]["data"]).decode("utf-8")
-    elif "body" in payload and "data" in payload.get("body", {}):
-        body = base64.urlsafe_b64decode(payload["body"]["data"]).decode("utf-8")
+    data = find_body_data(payload)
+    body = b64url_decode(data).decode("utf-8") if data else ""
 
     return {
         "draft_id": draft.get("id"),
@@ -93,7 +295,8 @@ def setup_email_draft_tools(mcp: FastMCP) -> None:
             # List drafts
             result = service.users().drafts().list(
                 userId="me",
-                maxResults=max_results
+                maxResults=max_results,
+                fields=DRAFT_LIST_FIELDS
             ).execute()
 
             drafts = result.get("drafts", [])
@@ -106,22 +309,52 @@ def setup_email_draft_tools(mcp: FastMCP) -> None:
                     "message": "No drafts found."
                 }
 
-            # Get basic info for each draft
+            # drafts.list already pairs each draft with its message ID, so
+            # fetch the messages directly in one batch request: unlike
+            # drafts.get, messages.get takes metadataHeaders and returns just
+            # the headers we show, without the draft envelope
+            details: Dict[int, Dict[str, Any]] = {}
+
+            def callback(request_id, response, exception):
+                if exception is not None:
+                    logger.error(f"Failed to fetch draft {drafts[int(request_id)]['id']}: {exception}")
+                else:
+                    details[int(request_id)] = response
+
+            # Each users()/messages() call builds a new discovery resource,
+            # so build it once for the whole batch
+            messages_resource = service.users().messages()
+            batch = service.new_batch_http_request(callback=callback)
+            for idx, draft in enumerate(drafts):
+                batch.add(
+                    messages_resource.get(
+                        userId="me",
+                        id=draft["message"]["id"],
+                        format="metadata",
+                        metadataHeaders=LIST_DRAFT_HEADERS,
+                        fields=LIST_MESSAGE_FIELDS
+                    ),
+                    request_id=str(idx)
+                )
+            try:
+                batch.execute()
+            except Exception as e:
+                logger.warning(f"Batch fetch failed, fetching drafts individually: {e}")
+                details = _get_draft_messages_concurrently(
+                    service, credentials, [draft["message"]["id"] for draft in drafts]
+                )
+
             draft_list = []
-            for draft in drafts:
-                # Fetch draft info - drafts.get doesn't support metadataHeaders
-                # so we use format="full" and parse what we need
-                draft_detail = service.users().drafts().get(
-                    userId="me",
-                    id=draft["id"],
-                    format="full"
-                ).execute()
+            append = draft_list.append
+            for idx, draft in enumerate(drafts):
+                message = details.get(idx)
+                if message is None:
+                    continue
 
-                message = draft_detail.get("message", {})
-                payload = message.get("payload", {})
-                headers = {h["name"].lower(): h["value"] for h in payload.get("headers", [])}
+                payload = message.get("payload") or _EMPTY
+                headers = _extract_headers(payload.get("headers", ()), _LIST_DRAFT_HEADER_NAMES)
 
-                draft_list.append({
+                append({
                     "draft_id": draft["id"],
                     "message_id": message.get("id"),
                     "to": headers.get("to", "(No recipient)"),
@@ -170,15 +403,21 @@ def setup_email_draft_tools(mcp: FastMCP) -> None:
             return {"success": False, "error": "Not authenticated. Please use the authenticate tool first."}
 
         try:
-            service = get_gmail_service(credentials)
+            cache_key = (get_credentials_hash(credentials), draft_id)
+            parsed = get_cached_draft(cache_key)
 
-            draft = service.users().drafts().get(
-                userId="me",
-                id=draft_id,
-                format="full"
-            ).execute()
+            if parsed is None:
+                service = get_gmail_service(credentials)
 
-            parsed = _parse_draft_message(draft)
+                draft = service.users().drafts().get(
+                    userId="me",
+                    id=draft_id,
+                    format="full",
+                    fields=DRAFT_FIELDS
+                ).execute()
+
+                parsed = _parse_draft_message(draft)
+                cache_draft(cache_key, parsed)
 
             return {
                 "success": True,
@@ -224,53 +463,60 @@ def setup_email_draft_tools(mcp: FastMCP) -> None:
         if not credentials:
             return {"success": False, "error": "Not authenticated. Please use the authenticate tool first."}
 
+        invalidate_cached_draft(credentials, draft_id)
+
         try:
             service = get_gmail_service(credentials)
 
-            # Get current draft to preserve unchanged fields
-            current = service.users().drafts().get(
-                userId="me",
-                id=draft_id,
-                format="full"
-            ).execute()
+            if body is None:
+                # Only headers change: splice them into the raw draft so the
+                # body (including HTML and attachments) is kept byte for byte
+                current = service.users().drafts().get(
+                    userId="me",
+                    id=draft_id,
+                    format="raw",
+                    fields="message/raw"
+                ).execute()
 
-            parsed = _parse_draft_message(current)
+                new_raw = _replace_headers(
+                    b64url_decode(current["message"]["raw"]),
+                    {"To": to, "Subject": subject, "Cc": cc, "Bcc": bcc}
+                )
+            else:
+                # The body is replaced, so only the current headers are needed
+                current = service.users().drafts().get(
+                    userId="me",
+                    id=draft_id,
+                    format="metadata",
+                    fields="message/payload/headers"
+                ).execute()
 
-            # Use new values or fall back to current
-            new_to = to if to is not None else parsed["to"]
-            new_subject = subject if subject is not None else parsed["subject"]
-            new_body = body if body is not None else parsed["body"]
-            new_cc = cc if cc is not None else parsed["cc"]
-            new_bcc = bcc if bcc is not None else parsed["bcc"]
+                parsed = _parse_draft_message(current)
 
-            # Build new message
-            message = MIMEMultipart()
-            message["to"] = new_to
-            message["subject"] = new_subject
-            if new_cc:
-                message["cc"] = new_cc
-            if new_bcc:
-                message["bcc"] = new_bcc
+                # Use new values or fall back to current
+                new_to = to if to is not None else parsed["to"]
+                new_subject = subject if subject is not None else parsed["subject"]
+                new_cc = cc if cc is not None else parsed["cc"]
+                new_bcc = bcc if bcc is not None else parsed["bcc"]
 
-            message.attach(MIMEText(new_body, "plain"))
+                new_raw = _build_plain_message(
+                    {"To": new_to, "Subject": new_subject, "Cc": new_cc, "Bcc": new_bcc},
+                    body
+                )
 
-            raw = base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
+            raw = base64.urlsafe_b64encode(new_raw).decode("ascii")
 
             # Update the draft
             updated = service.users().drafts().update(
                 userId="me",
                 id=draft_id,
-                body={"message": {"raw": raw}}
+                body={"message": {"raw": raw}},
+                fields=DRAFT_UPDATE_FIELDS
             ).execute()
 
-            # Fetch the updated draft to return current state
-            refreshed = service.users().drafts().get(
-                userId="me",
-                id=updated["id"],
-                format="full"
-            ).execute()
-
-            parsed_updated = _parse_draft_message(refreshed)
+            # drafts.update returns only IDs and labels, so describe the
+            # draft from the message just sent rather than fetching it again
+            parsed_updated = _parse_raw_draft(updated, new_raw)
 
             return {
                 "success": True,
@@ -304,6 +550,8 @@ def setup_email_draft_tools(mcp: FastMCP) -> None:
         if not credentials:
             return {"success": False, "error": "Not authenticated. Please use the authenticate tool first."}
 
+        invalidate_cached_draft(credentials, draft_id)
+
         try:
             service = get_gmail_service(credentials)
 
@@ -4,7 +4,7 @@ Email Management Tools Module
 Handles email organization: archive, trash, delete, star, read/unread status.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Callable
 
 from mcp.server.fastmcp import FastMCP
 
@@ -15,6 +15,40 @@ from gmail_mcp.auth.oauth import get_credentials
 logger = get_logger(__name__)
 
 
+def _manage_email(email_id: str, request: Callable[[Any], Any], success_message: str, action: str) -> Dict[str, Any]:
+    """
+    Run a single-message Gmail request with the shared auth and error handling.
+
+    Args:
+        email_id: The ID of the email
+        request: Builds the request from the users().messages() resource
+        success_message: Message returned on success
+        action: What the request does, for error messages (e.g. "archive email")
+
+    Returns:
+        Dict[str, Any]: Result of the operation
+    """
+    credentials = get_credentials()
+
+    if not credentials:
+        return {"success": False, "error": "Not authenticated. Please use the authenticate tool first."}
+
+    try:
+        service = get_gmail_service(credentials)
+
+        request(service.users().messages()).execute()
+
+        return {
+            "success": True,
+            "message": success_message,
+            "email_id": email_id
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to {action}: {e}")
+        return {"success": False, "error": f"Failed to {action}: {e}"}
+
+
 def setup_email_manage_tools(mcp: FastMCP) -> None:
     """Set up email management tools on the FastMCP application."""
 
@@ -29,29 +63,12 @@ def setup_email_manage_tools(mcp: FastMCP) -> None:
         Returns:
             Dict[str, Any]: Result of the operation
         """
-        credentials = get_credentials()
-
-        if not credentials:
-            return {"success": False, "error": "Not authenticated. Please use the authenticate tool first."}
-
-        try:
-            service = get_gmail_service(credentials)
-
-            service.users().messages().modify(
-                userId="me",
-                id=email_id,
-                body={"removeLabelIds": ["INBOX"]}
-            ).execute()
-
-            return {
-                "success": True,
-                "message": "Email archived successfully.",
-                "email_id": email_id
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to archive email: {e}")
-            return {"success": False, "error": f"Failed to archive email: {e}"}
+        return _manage_email(
+            email_id,
+            lambda messages: messages.modify(userId="me", id=email_id, body={"removeLabelIds": ["INBOX"]}),
+            "Email archived successfully.",
+            "archive email"
+        )
 
     @mcp.tool()
     def trash_email(email_id: str) -> Dict[str, Any]:
@@ -64,25 +81,12 @@ def setup_email_manage_tools(mcp: FastMCP) -> None:
         Returns:
             Dict[str, Any]: Result of the operation
         """
-        credentials = get_credentials()
-
-        if not credentials:
-            return {"success": False, "error": "Not authenticated. Please use the authenticate tool first."}
-
-        try:
-            service = get_gmail_service(credentials)
-
-            service.users().messages().trash(userId="me", id=email_id).execute()
-
-            return {
-                "success": True,
-                "message": "Email moved to trash.",
-                "email_id": email_id
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to trash email: {e}")
-            return {"success": False, "error": f"Failed to trash email: {e}"}
+        return _manage_email(
+            email_id,
+            lambda messages: messages.trash(userId="me", id=email_id),
+            "Email moved to trash.",
+            "trash email"
+        )
 
     @mcp.tool()
     def delete_email(email_id: str) -> Dict[str, Any]:
@@ -95,25 +99,12 @@ def setup_email_manage_tools(mcp: FastMCP) -> None:
         Returns:
             Dict[str, Any]: Result of the operation
         """
-        credentials = get_credentials()
-
-        if not credentials:
-            return {"success": False, "error": "Not authenticated. Please use the authenticate tool first."}
-
-        try:
-            service = get_gmail_service(credentials)
-
-            service.users().messages().delete(userId="me", id=email_id).execute()
-
-            return {
-                "success": True,
-                "message": "Email permanently deleted.",
-                "email_id": email_id
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to delete email: {e}")
-            return {"success": False, "error": f"Failed to delete email: {e}"}
+        return _manage_email(
+            email_id,
+            lambda messages: messages.delete(userId="me", id=email_id),
+            "Email permanently deleted.",
+            "delete email"
+        )
 
     @mcp.tool()
     def mark_as_read(email_id: str) -> Dict[str, Any]:
@@ -126,29 +117,12 @@ def setup_email_manage_tools(mcp: FastMCP) -> None:
         Returns:
             Dict[str, Any]: Result of the operation
         """
-        credentials = get_credentials()
-
-        if not credentials:
-            return {"success": False, "error": "Not authenticated. Please use the authenticate tool first."}
-
-        try:
-            service = get_gmail_service(credentials)
-
-            service.users().messages().modify(
-                userId="me",
-                id=email_id,
-                body={"removeLabelIds": ["UNREAD"]}
-            ).execute()
-
-            return {
-                "success": True,
-                "message": "Email marked as read.",
-                "email_id": email_id
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to mark as read: {e}")
-            return {"success": False, "error": f"Failed to mark as read: {e}"}
+        return _manage_email(
+            email_id,
+            lambda messages: messages.modify(userId="me", id=email_id, body={"removeLabelIds": ["UNREAD"]}),
+            "Email marked as read.",
+            "mark as read"
+        )
 
     @mcp.tool()
     def mark_as_unread(email_id: str) -> Dict[str, Any]:
@@ -161,29 +135,12 @@ def setup_email_manage_tools(mcp: FastMCP) -> None:
         Returns:
             Dict[str, Any]: Result of the operation
         """
-        credentials = get_credentials()
-
-        if not credentials:
-            return {"success": False, "error": "Not authenticated. Please use the authenticate tool first."}
-
-        try:
-            service = get_gmail_service(credentials)
-
-            service.users().messages().modify(
-                userId="me",
-                id=email_id,
-                body={"addLabelIds": ["UNREAD"]}
-            ).execute()
-
-            return {
-                "success": True,
-                "message": "Email marked as unread.",
-                "email_id": email_id
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to mark as unread: {e}")
-            return {"success": False, "error": f"Failed to mark as unread: {e}"}
+        return _manage_email(
+            email_id,
+            lambda messages: messages.modify(userId="me", id=email_id, body={"addLabelIds": ["UNREAD"]}),
+            "Email marked as unread.",
+            "mark as unread"
+        )
 
     @mcp.tool()
     def star_email(email_id: str) -> Dict[str, Any]:
@@ -196,29 +153,12 @@ def setup_email_manage_tools(mcp: FastMCP) -> None:
         Returns:
             Dict[str, Any]: Result of the operation
         """
-        credentials = get_credentials()
-
-        if not credentials:
-            return {"success": False, "error": "Not authenticated. Please use the authenticate tool first."}
-
-        try:
-            service = get_gmail_service(credentials)
-
-            service.users().messages().modify(
-                userId="me",
-                id=email_id,
-                body={"addLabelIds": ["STARRED"]}
-            ).execute()
-
-            return {
-                "success": True,
-                "message": "Email starred.",
-                "email_id": email_id
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to star email: {e}")
-            return {"success": False, "error": f"Failed to star email: {e}"}
+        return _manage_email(
+            email_id,
+            lambda messages: messages.modify(userId="me", id=email_id, body={"addLabelIds": ["STARRED"]}),
+            "Email starred.",
+            "star email"
+        )
 
     @mcp.tool()
     def unstar_email(email_id: str) -> Dict[str, Any]:
@@ -231,26 +171,9 @@ def setup_email_manage_tools(mcp: FastMCP) -> None:
         Returns:
             Dict[str, Any]: Result of the operation
         """
-        credentials = get_credentials()
-
-        if not credentials:
-            return {"success": False, "error": "Not authenticated. Please use the authenticate tool first."}
-
-        try:
-            service = get_gmail_service(credentials)
-
-            service.users().messages().modify(
-                userId="me",
-                id=email_id,
-                body={"removeLabelIds": ["STARRED"]}
-            ).execute()
-
-            return {
-                "success": True,
-                "message": "Star removed.",
-                "email_id": email_id
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to unstar email: {e}")
-            return {"success": False, "error": f"Failed to unstar email: {e}"}
+        return _manage_email(
+            email_id,
+            lambda messages: messages.modify(userId="me", id=email_id, body={"removeLabelIds": ["STARRED"]}),
+            "Star removed.",
+            "unstar email"
+        )
@@ -4,20 +4,73 @@ Email Read Tools Module
 Handles listing, searching, and retrieving email content.
 """
 
-import base64
-from typing import Dict, Any, Optional
-
+import functools
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from mcp.server.fastmcp import FastMCP
 from googleapiclient.errors import HttpError
 
 from gmail_mcp.utils.logger import get_logger
-from gmail_mcp.utils.services import get_gmail_service
+from gmail_mcp.utils.services import get_gmail_service, get_credentials_hash
 from gmail_mcp.utils.date_parser import parse_natural_date, parse_week_range, DATE_PARSING_HINT
 from gmail_mcp.auth.oauth import get_credentials
-from gmail_mcp.gmail.helpers import extract_email_info
+from gmail_mcp.gmail.helpers import extract_email_info, b64url_decode, find_body_data
 
 logger = get_logger(__name__)
 
+# Headers read by extract_email_info for list and search results
+LIST_EMAIL_HEADERS = ["Subject", "From", "To", "Cc", "Date"]
+
+# Partial-response mask limiting metadata fetches to the fields we read
+LIST_EMAIL_FIELDS = "id,threadId,labelIds,snippet,payload/headers"
+
+# System labels counted by get_email_overview; system label IDs are fixed
+OVERVIEW_LABEL_IDS = ("INBOX", "UNREAD", "SENT", "DRAFT", "SPAM", "TRASH")
+
+# Gmail batch API allows up to 100 requests per batch
+EMAIL_BATCH_SIZE = 100
+
+# Batches sent at once when a fetch spans several; kept low to stay under
+# Gmail's per-user concurrency limit
+BATCH_MAX_WORKERS = 4
+
+# Rate-limited or unavailable messages in a batch are re-requested on their
+# own, with exponential backoff, up to this many times
+EMAIL_BATCH_MAX_RETRIES = 3
+RETRYABLE_STATUSES = frozenset((429, 503))
+
+# Emails returned by get_email, keyed by (credentials hash, email ID). A
+# message's headers and body never change, so entries only leave by LRU
+# eviction; labels do change and are re-read on every hit.
+EMAIL_CACHE_MAX_SIZE = 512
+_email_cache: "OrderedDict[Tuple[int, str], Dict[str, Any]]" = OrderedDict()
+_email_cache_lock = threading.Lock()
+
+
+def _get_cached_email(key: Tuple[int, str]) -> Optional[Dict[str, Any]]:
+    """Return a cached email and mark it most recently used."""
+    with _email_cache_lock:
+        email = _email_cache.get(key)
+        if email is not None:
+            _email_cache.move_to_end(key)
+        return email
+
+
+def _cache_email(key: Tuple[int, str], email: Dict[str, Any]) -> None:
+    """Cache an email, evicting the least recently used entry when full."""
+    with _email_cache_lock:
+        _email_cache[key] = email
+        _email_cache.move_to_end(key)
+        if len(_email_cache) > EMAIL_CACHE_MAX_SIZE:
+            _email_cache.popitem(last=False)
+
 
 def setup_email_read_tools(mcp: FastMCP) -> None:
     """Set up email read tools on the FastMCP application."""
@@ -53,9 +106,28 @@ def setup_email_read_tools(mcp: FastMCP) -> None:
 
         try:
             service = get_gmail_service(credentials)
-            profile = service.users().getProfile(userId="me").execute()
-            # Use label metadata for accurate counts (not paginated)
-            inbox_label = service.users().labels().get(userId="me", id="INBOX").execute()
+
+            # Use label metadata for accurate counts (not paginated), sent in
+            # the same batch request as the profile
+            responses = {}
+            errors = []
+
+            def count_callback(request_id, response, exception):
+                if exception is not None:
+                    errors.append(exception)
+                else:
+                    responses[request_id] = response
+
+            users = service.users()
+            batch = service.new_batch_http_request(callback=count_callback)
+            batch.add(users.getProfile(userId="me"), request_id="profile")
+            batch.add(users.labels().get(userId="me", id="INBOX"), request_id="inbox")
+            batch.execute()
+            if errors:
+                raise errors[0]
+
+            profile = responses["profile"]
+            inbox_label = responses["inbox"]
 
             return {
                 "email": profile.get("emailAddress", "Unknown"),
@@ -113,7 +185,7 @@ def setup_email_read_tools(mcp: FastMCP) -> None:
 
             # Use batch API for efficient fetching
             if messages:
-                emails = _batch_get_emails(service, [m["id"] for m in messages])
+                emails = _batch_get_emails(service, [m["id"] for m in messages], credentials)
 
             return {
                 "emails": emails,
@@ -174,44 +246,26 @@ def setup_email_read_tools(mcp: FastMCP) -> None:
 
         try:
             service = get_gmail_service(credentials)
-            msg = service.users().messages().get(userId="me", id=email_id, format="full").execute()
-
-            headers = {}
-            for header in msg["payload"]["headers"]:
-                headers[header["name"].lower()] = header["value"]
-
-            body = ""
-            if "parts" in msg["payload"]:
-                for part in msg["payload"]["parts"]:
-                    if part["mimeType"] == "text/plain":
-                        body = part["body"]["data"]
-                        break
-            elif "body" in msg["payload"] and "data" in msg["payload"]["body"]:
-                body = msg["payload"]["body"]["data"]
-
-            if body:
-                body = base64.urlsafe_b64decode(body.encode("ASCII")).decode("utf-8")
-
-            thread_id = msg["threadId"]
-            email_link = f"https://mail.google.com/mail/u/0/#inbox/{thread_id}/{email_id}"
-
-            result = {
-                "id": msg["id"],
-                "thread_id": thread_id,
-                "subject": headers.get("subject", "No Subject"),
-                "from": headers.get("from", "Unknown"),
-                "to": headers.get("to", "Unknown"),
-                "cc": headers.get("cc", ""),
-                "date": headers.get("date", "Unknown"),
-                "body": body,
-                "snippet": msg["snippet"],
-                "labels": msg.get("labelIds", []),
-                "email_link": email_link
-            }
+            cache_key = (get_credentials_hash(credentials), email_id)
+            cached = _get_cached_email(cache_key)
+
+            if cached is not None:
+                # Only the labels can have changed since the email was cached
+                current = service.users().messages().get(
+                    userId="me",
+                    id=email_id,
+                    format="minimal",
+                    fields="labelIds"
+                ).execute()
+                result = {**cached, "labels": current.get("labelIds", [])}
+            else:
+                msg = service.users().messages().get(userId="me", id=email_id, format="full").execute()
+                result = _parse_full_email(msg)
+                _cache_email(cache_key, dict(result))
 
             # Optionally include thread context
             if include_thread:
-                thread_data = _get_thread_context(service, thread_id)
+                thread_data = _get_thread_context(service, result["thread_id"])
                 if thread_data:
                     result["thread"] = thread_data
 
@@ -321,7 +375,7 @@ def setup_email_read_tools(mcp: FastMCP) -> None:
 
             # Use batch API for efficient fetching
             if messages:
-                emails = _batch_get_emails(service, [m["id"] for m in messages])
+                emails = _batch_get_emails(service, [m["id"] for m in messages], credentials)
 
             return {
                 "query": query,
@@ -362,23 +416,46 @@ def setup_email_read_tools(mcp: FastMCP) -> None:
 
         try:
             service = get_gmail_service(credentials)
-            profile = service.users().getProfile(userId="me").execute()
-            inbox_result = service.users().messages().list(userId="me", labelIds=["INBOX"], maxResults=5).execute()
-            unread_result = service.users().messages().list(userId="me", labelIds=["UNREAD"], maxResults=5).execute()
-            labels_result = service.users().labels().list(userId="me").execute()
+
+            # The profile, message lists and label counts are independent,
+            # so send them together in one batch request. The counted system
+            # labels have fixed IDs, so labels.list is not needed.
+            responses = {}
+            label_counts = {}
+            errors = []
+
+            def overview_callback(request_id, response, exception):
+                label_id = request_id[len("label:"):] if request_id.startswith("label:") else None
+                if exception is not None:
+                    if label_id:
+                        # A missing count reads as 0 rather than failing the overview
+                        logger.error(f"Failed to get label {label_id}: {exception}")
+                    else:
+                        errors.append(exception)
+                elif label_id:
+                    label_counts[label_id] = response.get("messagesTotal", 0)
+                else:
+                    responses[request_id] = response
+
+            users = service.users()
+            labels_resource = users.labels()
+            batch = service.new_batch_http_request(callback=overview_callback)
+            batch.add(users.getProfile(userId="me"), request_id="profile")
+            batch.add(users.messages().list(userId="me", labelIds=["INBOX"], maxResults=5), request_id="inbox")
+            batch.add(users.messages().list(userId="me", labelIds=["UNREAD"], maxResults=5), request_id="unread")
+            for label_id in OVERVIEW_LABEL_IDS:
+                batch.add(labels_resource.get(userId="me", id=label_id), request_id=f"label:{label_id}")
+            batch.execute()
+            if errors:
+                raise errors[0]
+
+            profile = responses["profile"]
+            inbox_result = responses["inbox"]
+            unread_result = responses["unread"]
 
             recent_emails = []
             if "messages" in inbox_result:
-                recent_emails = _batch_get_emails(service, [m["id"] for m in inbox_result["messages"][:5]])
-
-            label_counts = {}
-            for label in labels_result.get("labels", []):
-                if label["type"] == "system":
-                    label_detail = service.users().labels().get(userId="me", id=label["id"]).execute()
-                    label_counts[label["name"]] = {
-                        "total": label_detail.get("messagesTotal", 0),
-                        "unread": label_detail.get("messagesUnread", 0)
-                    }
+                recent_emails = _batch_get_emails(service, [m["id"] for m in inbox_result["messages"][:5]], credentials)
 
             return {
                 "account": {
@@ -387,12 +464,8 @@ def setup_email_read_tools(mcp: FastMCP) -> None:
                     "total_threads": profile.get("threadsTotal", 0),
                 },
                 "counts": {
-                    "inbox": label_counts.get("INBOX", {}).get("total", 0),
-                    "unread": label_counts.get("UNREAD", {}).get("total", 0),
-                    "sent": label_counts.get("SENT", {}).get("total", 0),
-                    "draft": label_counts.get("DRAFT", {}).get("total", 0),
-                    "spam": label_counts.get("SPAM", {}).get("total", 0),
-                    "trash": label_counts.get("TRASH", {}).get("total", 0),
+                    label_id.lower(): label_counts.get(label_id, 0)
+                    for label_id in OVERVIEW_LABEL_IDS
                 },
                 "recent_emails": recent_emails,
                 "unread_count": len(unread_result.get("messages", [])),
@@ -402,6 +475,42 @@ def setup_email_read_tools(mcp: FastMCP) -> None:
             return {"success": False, "error": f"Failed to get email overview: {e}"}
 
 
+def _parse_full_email(msg: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parse a format=full message into the get_email result.
+
+    Args:
+        msg: Message from messages.get(format="full")
+
+    Returns:
+        Dict[str, Any]: The email details, without thread context
+    """
+    headers = {}
+    for header in msg["payload"]["headers"]:
+        headers[header["name"].lower()] = header["value"]
+
+    data = find_body_data(msg["payload"])
+    body = b64url_decode(data).decode("utf-8", errors="replace") if data else ""
+
+    thread_id = msg["threadId"]
+    email_id = msg["id"]
+    email_link = f"https://mail.google.com/mail/u/0/#inbox/{thread_id}/{email_id}"
+
+    return {
+        "id": email_id,
+        "thread_id": thread_id,
+        "subject": headers.get("subject", "No Subject"),
+        "from": headers.get("from", "Unknown"),
+        "to": headers.get("to", "Unknown"),
+        "cc": headers.get("cc", ""),
+        "date": headers.get("date", "Unknown"),
+        "body": body,
+        "snippet": msg["snippet"],
+        "labels": msg.get("labelIds", []),
+        "email_link": email_link
+    }
+
+
 def _get_thread_context(service, thread_id: str) -> Optional[Dict[str, Any]]:
     """
     Get thread context for an email.
@@ -433,15 +542,8 @@ def _get_thread_context(service, thread_id: str) -> Optional[Dict[str, Any]]:
             headers = {h["name"].lower(): h["value"] for h in msg.get("payload", {}).get("headers", [])}
 
             # Extract body
-            body = ""
-            payload = msg.get("payload", {})
-            if "parts" in payload:
-                for part in payload["parts"]:
-                    if part.get("mimeType") == "text/plain" and "data" in part.get("body", {}):
-                        body = base64.urlsafe_b64decode(part["body"]["data"]).decode("utf-8")
-                        break
-            elif "body" in payload and "data" in payload["body"]:
-                body = base64.urlsafe_b64decode(payload["body"]["data"]).decode("utf-8")
+            data = find_body_data(msg.get("payload", {}))
+            body = b64url_decode(data).decode("utf-8", errors="replace") if data else ""
 
             extracted_messages.append({
                 "id": msg["id"],
@@ -476,42 +578,113 @@ def _get_thread_context(service, thread_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def _batch_get_emails(service, message_ids: list) -> list:
+def _collect_email(emails: list, retry_indexes: list, request_id, response, exception) -> None:
+    """
+    Batch callback for _execute_email_batch, bound to its result list and
+    retry list with functools.partial.
+
+    The request ID is the message's index in the batch, so each result is
+    written to its slot. Rate-limited messages are queued for retry; other
+    failures are logged.
+    """
+    index = int(request_id)
+    if exception is None:
+        emails[index] = extract_email_info(response)
+    elif isinstance(exception, HttpError) and exception.resp.status in RETRYABLE_STATUSES:
+        retry_indexes.append(index)
+    else:
+        logger.error(f"Batch request failed for message {index}: {exception}")
+
+
+def _batch_get_emails(service, message_ids: list, credentials=None) -> list:
     """
     Batch fetch multiple emails efficiently using Gmail's batch API.
 
+    Only the headers shown in listings are requested (format=metadata), so
+    message bodies and attachments are never downloaded. When the IDs span
+    several batches and credentials are given, the batches run concurrently.
+
     Args:
         service: Gmail API service instance
         message_ids: List of message IDs to fetch
+        credentials: Credentials for the per-thread connections used when
+            sending several batches at once
 
     Returns:
-        list: List of email info dictionaries
+        list: List of email info dictionaries, in batch order
     """
     if not message_ids:
         return []
 
-    emails = []
+    chunks = [
+        message_ids[i:i + EMAIL_BATCH_SIZE]
+        for i in range(0, len(message_ids), EMAIL_BATCH_SIZE)
+    ]
 
-    # Gmail batch API allows up to 100 requests per batch
-    batch_size = 100
-    for i in range(0, len(message_ids), batch_size):
-        batch_ids = message_ids[i:i + batch_size]
+    if len(chunks) == 1 or credentials is None:
+        emails = []
+        for chunk in chunks:
+            emails.extend(_execute_email_batch(service, chunk))
+        return emails
 
-        # Create batch request
-        batch = service.new_batch_http_request()
+    # The service's shared http object is not thread-safe, so each batch
+    # is sent on its own connection
+    def fetch(chunk: list) -> list:
+        return _execute_email_batch(service, chunk, AuthorizedHttp(credentials, http=httplib2.Http()))
 
-        def callback(request_id, response, exception):
-            if exception is not None:
-                logger.error(f"Batch request failed for {request_id}: {exception}")
-            else:
-                emails.append(extract_email_info(response))
+    with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(chunks))) as executor:
+        results = list(executor.map(fetch, chunks))
+    return [email for emails in results for email in emails]
+
+
+def _execute_email_batch(service, message_ids: list, http=None) -> list:
+    """
+    Fetch up to EMAIL_BATCH_SIZE emails as metadata in one batch request.
+
+    Messages that fail with a retryable status are re-requested in a
+    smaller follow-up batch after a backoff, without refetching the rest.
 
-        for msg_id in batch_ids:
+    Args:
+        service: Gmail API service instance
+        message_ids: Message IDs for a single batch
+        http: Optional http object to send the batch on
+
+    Returns:
+        list: Email info dictionaries for the messages fetched successfully,
+        in the order of message_ids
+    """
+    emails: List[Optional[Dict[str, Any]]] = [None] * len(message_ids)
+    messages_resource = service.users().messages()
+    pending = range(len(message_ids))
+
+    for attempt in range(EMAIL_BATCH_MAX_RETRIES + 1):
+        if attempt:
+            delay = 2 ** (attempt - 1) + random.random()
+            logger.warning(f"Retrying {len(pending)} rate-limited email fetches in {delay:.1f}s")
+            time.sleep(delay)
+
+        retry_indexes = []
+        callback = functools.partial(_collect_email, emails, retry_indexes)
+
+        batch = service.new_batch_http_request()
+        for index in pending:
             batch.add(
-                service.users().messages().get(userId="me", id=msg_id),
-                callback=callback
+                messages_resource.get(
+                    userId="me",
+                    id=message_ids[index],
+                    format="metadata",
+                    metadataHeaders=LIST_EMAIL_HEADERS,
+                    fields=LIST_EMAIL_FIELDS
+                ),
+                callback=callback,
+                request_id=str(index)
             )
+        batch.execute(http=http)
 
-        batch.execute()
+        if not retry_indexes:
+            break
+        pending = retry_indexes
+    else:
+        logger.error(f"Giving up on {len(pending)} emails after {EMAIL_BATCH_MAX_RETRIES} retries")
 
-    return emails
+    return [email for email in emails if email is not None]
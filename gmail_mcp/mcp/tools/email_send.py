@@ -17,6 +17,7 @@ from gmail_mcp.utils.logger import get_logger
 from gmail_mcp.utils.services import get_gmail_service, get_calendar_service
 from gmail_mcp.utils.date_parser import parse_natural_date
 from gmail_mcp.auth.oauth import get_credentials
+from gmail_mcp.utils.draft_cache import invalidate_cached_draft
 from gmail_mcp.gmail.processor import parse_email_message, extract_entities
 from gmail_mcp.gmail.processor import (
     analyze_thread,
@@ -283,6 +284,7 @@ def setup_email_send_tools(mcp: FastMCP) -> None:
 
         try:
             service = get_gmail_service(credentials)
+            invalidate_cached_draft(credentials, draft_id)
             sent_message = service.users().drafts().send(userId="me", body={"id": draft_id}).execute()
 
             return {
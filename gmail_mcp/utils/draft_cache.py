@@ -0,0 +1,59 @@
+"""
+Draft Cache Module
+
+Caches drafts parsed by get_draft, shared by the tools that change or send drafts.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from google.oauth2.credentials import Credentials
+
+from gmail_mcp.utils.services import get_credentials_hash
+
+# Drafts returned by get_draft, keyed by (credentials hash, draft ID). Drafts
+# only change through update/delete/send, which drop their entry; the short
+# TTL bounds staleness for edits made outside these tools.
+DRAFT_CACHE_MAX_SIZE = 256
+DRAFT_CACHE_TTL_SECONDS = 30
+_draft_cache: "OrderedDict[Tuple[int, str], Tuple[float, Dict[str, Any]]]" = (
+    OrderedDict()
+)
+_draft_cache_lock = threading.Lock()
+
+
+def get_cached_draft(key: Tuple[int, str]) -> Optional[Dict[str, Any]]:
+    """Return a cached parsed draft, marking it recently used; drop it once expired."""
+    with _draft_cache_lock:
+        entry = _draft_cache.get(key)
+        if entry is None:
+            return None
+        cached_at, draft = entry
+        if time.monotonic() - cached_at > DRAFT_CACHE_TTL_SECONDS:
+            del _draft_cache[key]
+            return None
+        _draft_cache.move_to_end(key)
+        return draft
+
+
+def cache_draft(key: Tuple[int, str], draft: Dict[str, Any]) -> None:
+    """Cache a parsed draft, evicting the least recently used entry when full."""
+    with _draft_cache_lock:
+        _draft_cache[key] = (time.monotonic(), draft)
+        _draft_cache.move_to_end(key)
+        if len(_draft_cache) > DRAFT_CACHE_MAX_SIZE:
+            _draft_cache.popitem(last=False)
+
+
+def invalidate_cached_draft(credentials: Credentials, draft_id: str) -> None:
+    """Drop a draft from the get_draft cache after it is changed, sent or deleted."""
+    with _draft_cache_lock:
+        _draft_cache.pop((get_credentials_hash(credentials), draft_id), None)
+
+
+def clear_draft_cache() -> None:
+    """Clear all cached drafts."""
+    with _draft_cache_lock:
+        _draft_cache.clear()
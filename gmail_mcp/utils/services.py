@@ -21,10 +21,15 @@ _cache_lock = threading.Lock()
 _gmail_service: Optional[Resource] = None
 _calendar_service: Optional[Resource] = None
 _people_service: Optional[Resource] = None
-_credentials_hash: Optional[int] = None
 
+# Credentials each cached service was built with, tracked per service so that
+# rebuilding one service for new credentials doesn't mark the others current
+_gmail_credentials_hash: Optional[int] = None
+_calendar_credentials_hash: Optional[int] = None
+_people_credentials_hash: Optional[int] = None
 
-def _get_credentials_hash(credentials: Credentials) -> int:
+
+def get_credentials_hash(credentials: Credentials) -> int:
     """
     Get a hash of the credentials token for cache invalidation.
 
@@ -50,14 +55,14 @@ def get_gmail_service(credentials: Credentials) -> Resource:
     Returns:
         Resource: The Gmail API service instance.
     """
-    global _gmail_service, _credentials_hash
+    global _gmail_service, _gmail_credentials_hash
 
     with _cache_lock:
-        cred_hash = _get_credentials_hash(credentials)
-        if _gmail_service is None or _credentials_hash != cred_hash:
+        cred_hash = get_credentials_hash(credentials)
+        if _gmail_service is None or _gmail_credentials_hash != cred_hash:
             logger.debug("Creating new Gmail service instance")
             _gmail_service = build("gmail", "v1", credentials=credentials)
-            _credentials_hash = cred_hash
+            _gmail_credentials_hash = cred_hash
 
         return _gmail_service
 
@@ -75,14 +80,14 @@ def get_calendar_service(credentials: Credentials) -> Resource:
     Returns:
         Resource: The Calendar API service instance.
     """
-    global _calendar_service, _credentials_hash
+    global _calendar_service, _calendar_credentials_hash
 
     with _cache_lock:
-        cred_hash = _get_credentials_hash(credentials)
-        if _calendar_service is None or _credentials_hash != cred_hash:
+        cred_hash = get_credentials_hash(credentials)
+        if _calendar_service is None or _calendar_credentials_hash != cred_hash:
             logger.debug("Creating new Calendar service instance")
             _calendar_service = build("calendar", "v3", credentials=credentials)
-            _credentials_hash = cred_hash
+            _calendar_credentials_hash = cred_hash
 
         return _calendar_service
 
@@ -100,14 +105,14 @@ def get_people_service(credentials: Credentials) -> Resource:
     Returns:
         Resource: The People API service instance.
     """
-    global _people_service, _credentials_hash
+    global _people_service, _people_credentials_hash
 
     with _cache_lock:
-        cred_hash = _get_credentials_hash(credentials)
-        if _people_service is None or _credentials_hash != cred_hash:
+        cred_hash = get_credentials_hash(credentials)
+        if _people_service is None or _people_credentials_hash != cred_hash:
             logger.debug("Creating new People service instance")
             _people_service = build("people", "v1", credentials=credentials)
-            _credentials_hash = cred_hash
+            _people_credentials_hash = cred_hash
 
         return _people_service
 
@@ -118,11 +123,14 @@ def clear_service_cache() -> None:
 
     This should be called when logging out or when credentials are invalidated.
     """
-    global _gmail_service, _calendar_service, _people_service, _credentials_hash
+    global _gmail_service, _calendar_service, _people_service
+    global _gmail_credentials_hash, _calendar_credentials_hash, _people_credentials_hash
 
     with _cache_lock:
         _gmail_service = None
         _calendar_service = None
         _people_service = None
-        _credentials_hash = None
+        _gmail_credentials_hash = None
+        _calendar_credentials_hash = None
+        _people_credentials_hash = None
         logger.debug("Cleared service cache")
@@ -8,3 +8,4 @@ def get_gmail_service(credentials: Credentials) -> Resource: ...
 def get_calendar_service(credentials: Credentials) -> Resource: ...
 def get_people_service(credentials: Credentials) -> Resource: ...
 def clear_service_cache() -> None: ...
+def get_credentials_hash(credentials: Credentials) -> int: ...
@@ -93,6 +93,15 @@ def clear_service_cache_fixture():
     clear_service_cache()
 
 
+@pytest.fixture(autouse=True)
+def clear_email_cache_fixture(set_test_encryption_key):
+    """Clear the get_email cache before each test to prevent test pollution."""
+    from gmail_mcp.mcp.tools.email_read import _email_cache
+    _email_cache.clear()
+    yield
+    _email_cache.clear()
+
+
 @pytest.fixture
 def mock_credentials():
     """Fixture providing mock credentials."""
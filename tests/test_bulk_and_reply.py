@@ -217,6 +217,75 @@ class TestBulkLabel:
         assert "Not authenticated" in result["error"]
 
 
+class TestSetLabels:
+    """Tests for the ID-based batchModify tools."""
+
+    def _get_tool(self, name):
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+
+        for tool in mcp._tool_manager._tools.values():
+            if tool.name == name:
+                return tool.fn
+        return None
+
+    @patch("gmail_mcp.mcp.tools.bulk.get_credentials")
+    @patch("gmail_mcp.mcp.tools.bulk.get_gmail_service")
+    def test_set_labels_single_batch_modify(self, mock_get_service, mock_get_credentials):
+        """Test that adds and removes go out in one batchModify call."""
+        mock_get_credentials.return_value = Mock()
+        service = MagicMock()
+        mock_get_service.return_value = service
+
+        set_labels = self._get_tool("set_labels")
+        assert set_labels is not None
+
+        result = set_labels(email_ids=["msg001", "msg002"], add=["STARRED"], remove=["UNREAD"])
+
+        assert result["success"] is True
+        assert result["modified"] == 2
+        service.users().messages().batchModify.assert_called_once_with(
+            userId="me",
+            body={"ids": ["msg001", "msg002"], "addLabelIds": ["STARRED"], "removeLabelIds": ["UNREAD"]}
+        )
+        service.users().messages().modify.assert_not_called()
+
+    @patch("gmail_mcp.mcp.tools.bulk.get_credentials")
+    @patch("gmail_mcp.mcp.tools.bulk.get_gmail_service")
+    def test_set_labels_requires_a_label(self, mock_get_service, mock_get_credentials):
+        """Test set_labels without labels to add or remove."""
+        mock_get_credentials.return_value = Mock()
+
+        set_labels = self._get_tool("set_labels")
+        result = set_labels(email_ids=["msg001"])
+
+        assert result["success"] is False
+        mock_get_service.assert_not_called()
+
+    @patch("gmail_mcp.mcp.tools.bulk.get_credentials")
+    @patch("gmail_mcp.mcp.tools.bulk.get_gmail_service")
+    def test_mark_many_as_read(self, mock_get_service, mock_get_credentials):
+        """Test marking several emails as read in one call."""
+        mock_get_credentials.return_value = Mock()
+        service = MagicMock()
+        mock_get_service.return_value = service
+
+        mark_many_as_read = self._get_tool("mark_many_as_read")
+        assert mark_many_as_read is not None
+
+        result = mark_many_as_read(email_ids=["msg001", "msg002", "msg003"])
+
+        assert result["success"] is True
+        assert result["marked"] == 3
+        service.users().messages().batchModify.assert_called_once_with(
+            userId="me",
+            body={"ids": ["msg001", "msg002", "msg003"], "removeLabelIds": ["UNREAD"]}
+        )
+
+
 class TestBulkTrash:
     """Tests for bulk_trash tool."""
 
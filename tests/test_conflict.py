@@ -9,6 +9,15 @@ from datetime import datetime, timedelta, UTC
 from unittest.mock import Mock, patch, MagicMock
 
 
+@pytest.fixture(autouse=True)
+def clear_freebusy_cache_fixture():
+    """Clear cached freebusy responses before each test to prevent test pollution."""
+    from gmail_mcp.mcp.tools.conflict import clear_freebusy_cache
+    clear_freebusy_cache()
+    yield
+    clear_freebusy_cache()
+
+
 SAMPLE_CALENDARS = {
     "items": [
         {
@@ -493,6 +502,134 @@ class TestCheckAttendeeAvailability:
 
         assert result["success"] is True
 
+    @patch("gmail_mcp.mcp.tools.conflict.get_user_timezone")
+    @patch("gmail_mcp.mcp.tools.conflict.get_credentials")
+    @patch("gmail_mcp.mcp.tools.conflict.get_calendar_service")
+    def test_check_availability_ignores_busy_outside_working_hours(
+        self, mock_get_service, mock_get_credentials, mock_get_timezone
+    ):
+        """Test busy periods outside working hours don't stretch slots past day end."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_credentials.return_value = Mock()
+        mock_get_timezone.return_value = "UTC"
+
+        mock_service = MagicMock()
+        mock_service.freebusy().query().execute.return_value = {
+            "calendars": {
+                "alice@example.com": {
+                    "busy": [
+                        {"start": "2024-01-16T11:00:00Z", "end": "2024-01-16T12:00:00Z"},
+                        {"start": "2024-01-16T20:00:00Z", "end": "2024-01-16T21:00:00Z"},
+                    ]
+                }
+            }
+        }
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        check_attendee_availability = mcp._tool_manager._tools["check_attendee_availability"].fn
+
+        result = check_attendee_availability(
+            attendees=["alice@example.com"],
+            start_date="2024-01-16",
+            end_date="2024-01-16",
+            duration_minutes=60
+        )
+
+        assert result["success"] is True
+        slots = [(s["start"], s["end"]) for s in result["common_free_slots"]]
+        assert slots == [
+            ("2024-01-16T09:00:00+00:00", "2024-01-16T11:00:00+00:00"),
+            ("2024-01-16T12:00:00+00:00", "2024-01-16T17:00:00+00:00"),
+        ]
+
+    @patch("gmail_mcp.mcp.tools.conflict.get_credentials")
+    @patch("gmail_mcp.mcp.tools.conflict.get_calendar_service")
+    def test_check_availability_batches_large_attendee_lists(self, mock_get_service, mock_get_credentials):
+        """Test attendees are de-duplicated and split across freebusy's calendar limit."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from gmail_mcp.mcp.tools.conflict import FREEBUSY_MAX_CALENDARS
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_credentials.return_value = Mock()
+
+        mock_service = MagicMock()
+        mock_query = mock_service.freebusy().query
+        mock_query.reset_mock()
+        mock_query.return_value.execute.return_value = {"calendars": {}}
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        check_attendee_availability = mcp._tool_manager._tools["check_attendee_availability"].fn
+
+        attendees = [f"user{i}@example.com" for i in range(FREEBUSY_MAX_CALENDARS + 10)]
+        result = check_attendee_availability(
+            attendees=attendees + attendees[:5],
+            start_date="2024-01-15",
+            end_date="2024-01-19"
+        )
+
+        assert result["success"] is True
+        batches = [c.kwargs["body"]["items"] for c in mock_query.call_args_list]
+        assert [len(b) for b in batches] == [FREEBUSY_MAX_CALENDARS, 10]
+        assert [item["id"] for b in batches for item in b] == attendees
+
+    @patch("gmail_mcp.mcp.tools.conflict.get_user_timezone")
+    @patch("gmail_mcp.mcp.tools.conflict.get_credentials")
+    @patch("gmail_mcp.mcp.tools.conflict.get_calendar_service")
+    def test_check_availability_reuses_hour_aligned_query(
+        self, mock_get_service, mock_get_credentials, mock_get_timezone
+    ):
+        """Test freebusy is queried on whole hours, cached, and trimmed to the requested range."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_credentials.return_value = Mock()
+        mock_get_timezone.return_value = "UTC"
+
+        mock_service = MagicMock()
+        mock_query = mock_service.freebusy().query
+        mock_query.reset_mock()
+        mock_query.return_value.execute.return_value = {
+            "calendars": {
+                "alice@example.com": {
+                    "busy": [
+                        {"start": "2024-01-16T10:00:00Z", "end": "2024-01-16T11:00:00Z"},
+                        {"start": "2024-01-17T00:00:00Z", "end": "2024-01-17T00:30:00Z"},
+                    ]
+                }
+            }
+        }
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        check_attendee_availability = mcp._tool_manager._tools["check_attendee_availability"].fn
+
+        first = check_attendee_availability(
+            attendees=["alice@example.com"], start_date="2024-01-16", end_date="2024-01-16"
+        )
+        second = check_attendee_availability(
+            attendees=["alice@example.com"], start_date="2024-01-16", end_date="2024-01-16",
+            duration_minutes=30
+        )
+
+        assert first["success"] is True and second["success"] is True
+        assert mock_query.call_count == 1
+        body = mock_query.call_args.kwargs["body"]
+        assert body["timeMin"] == "2024-01-16T00:00:00+00:00"
+        assert body["timeMax"] == "2024-01-17T00:00:00+00:00"
+
+        # The period inside the widened hour but after the requested end is dropped
+        busy = first["individual_availability"]["alice@example.com"]
+        assert busy["busy_times"] == [
+            {"start": "2024-01-16T10:00:00Z", "end": "2024-01-16T11:00:00Z"}
+        ]
+
     @patch("gmail_mcp.mcp.tools.conflict.get_credentials")
     def test_check_availability_not_authenticated(self, mock_get_credentials):
         """Test check_attendee_availability when not authenticated."""
@@ -545,3 +682,16 @@ class TestCheckAttendeeAvailability:
 
         assert result["success"] is False
         assert "At least one attendee" in result["error"]
+
+
+class TestFormatDisplayTime:
+    """Tests for _format_display_time helper."""
+
+    def test_matches_strftime(self):
+        """Test output matches strftime("%I:%M %p") for every hour."""
+        from gmail_mcp.mcp.tools.conflict import _format_display_time
+
+        for hour in range(24):
+            for minute in (0, 5, 59):
+                dt = datetime(2024, 1, 15, hour, minute)
+                assert _format_display_time(dt) == dt.strftime("%I:%M %p")
@@ -8,6 +8,17 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 
 
+@pytest.fixture(autouse=True)
+def clear_contact_cache_fixture():
+    """Clear the contact lookup cache before each test to prevent test pollution."""
+    from gmail_mcp.mcp.tools.contacts import _clear_contact_cache, _clear_connections_sync_cache
+    _clear_contact_cache()
+    _clear_connections_sync_cache()
+    yield
+    _clear_contact_cache()
+    _clear_connections_sync_cache()
+
+
 # Sample People API response data
 SAMPLE_PERSON = {
     "resourceName": "people/c123456789",
@@ -209,6 +220,22 @@ class TestListContacts:
         assert result["success"] is False
         assert "not enabled" in result["error"]
 
+    @patch("gmail_mcp.mcp.tools.contacts.get_config")
+    def test_disabled_tools_keep_signature(self, mock_get_config):
+        """Test that tools registered while disabled expose the same parameters."""
+        from gmail_mcp.mcp.tools.contacts import setup_contact_tools
+        from mcp.server.fastmcp import FastMCP
+
+        tools = {}
+        for enabled in (True, False):
+            mock_get_config.return_value = {"contacts_api_enabled": enabled}
+            mcp = FastMCP(name="Test")
+            setup_contact_tools(mcp)
+            tools[enabled] = mcp._tool_manager._tools
+
+        assert tools[True].keys() == tools[False].keys()
+        assert tools[False]["list_contacts"].parameters == tools[True]["list_contacts"].parameters
+
     @patch("gmail_mcp.mcp.tools.contacts.get_config")
     @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
     @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
@@ -243,6 +270,57 @@ class TestListContacts:
         assert result["success"] is True
         assert result["next_page_token"] == "token123"
 
+    @patch("gmail_mcp.mcp.tools.contacts.get_config")
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_list_contacts_requests_partial_response(self, mock_get_service, mock_get_credentials, mock_get_config):
+        """Test list_contacts trims the response to the parsed person fields."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_config.return_value = {"contacts_api_enabled": True}
+        mock_get_credentials.return_value = Mock()
+        mock_service = create_mock_people_service()
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        mcp._tool_manager._tools["list_contacts"].fn()
+
+        fields = mock_service.people().connections().list.call_args.kwargs["fields"]
+        assert fields.startswith("connections(resourceName,etag,names,emailAddresses,")
+        assert fields.endswith("),nextPageToken,totalPeople")
+
+    @patch("gmail_mcp.mcp.tools.contacts.get_config")
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_list_contacts_reuses_parse_for_unchanged_etag(self, mock_get_service, mock_get_credentials, mock_get_config):
+        """Test that a contact is parsed again only when its etag changes."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_config.return_value = {"contacts_api_enabled": True}
+        mock_get_credentials.return_value = Mock()
+        mock_service = MagicMock()
+        mock_get_service.return_value = mock_service
+        changed = {**SAMPLE_PERSON, "etag": "changed", "names": [{"displayName": "John Q. Smith"}]}
+        mock_service.people().connections().list().execute.side_effect = [
+            {"connections": [SAMPLE_PERSON]},
+            {"connections": [SAMPLE_PERSON]},
+            {"connections": [changed]},
+        ]
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        list_contacts = mcp._tool_manager._tools["list_contacts"].fn
+
+        first = list_contacts()["contacts"][0]
+        second = list_contacts()["contacts"][0]
+        third = list_contacts()["contacts"][0]
+
+        assert second is first
+        assert third["name"] == "John Q. Smith"
+
 
 class TestSearchContacts:
     """Tests for search_contacts tool."""
@@ -393,6 +471,154 @@ class TestGetContact:
         assert result["success"] is True
         assert result["contact"]["name"] == "John Smith"
 
+    @patch("gmail_mcp.mcp.tools.contacts.get_config")
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_get_contact_by_email_fetches_full_record_for_match(
+        self, mock_get_service, mock_get_credentials, mock_get_config
+    ):
+        """Test email lookup searches with a minimal mask and fetches only the match."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_config.return_value = {"contacts_api_enabled": True}
+        mock_get_credentials.return_value = Mock()
+        mock_service = create_mock_people_service()
+        mock_service.people().searchContacts = MagicMock(
+            wraps=mock_service.people().searchContacts
+        )
+        mock_service.people().get = MagicMock(wraps=mock_service.people().get)
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        get_contact = mcp._tool_manager._tools["get_contact"].fn
+
+        result = get_contact(email="john.smith@example.com")
+
+        assert result["contact"]["organization"] == "Acme Corp"
+        assert mock_service.people().searchContacts.call_args.kwargs["readMask"] == "emailAddresses"
+        assert mock_service.people().get.call_args.kwargs["resourceName"] == "people/c123456789"
+        assert mock_service.people().searchContacts.call_args.kwargs["fields"] == (
+            "results(person(resourceName,etag,emailAddresses))"
+        )
+        assert mock_service.people().get.call_args.kwargs["fields"].startswith("resourceName,etag,names,")
+
+    @patch("gmail_mcp.mcp.tools.contacts.get_config")
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_get_contact_by_email_cached(self, mock_get_service, mock_get_credentials, mock_get_config):
+        """Test repeated email lookups are served from the cache until cleared."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_config.return_value = {"contacts_api_enabled": True}
+        mock_get_credentials.return_value = Mock()
+        mock_service = create_mock_people_service()
+        mock_service.people().searchContacts = MagicMock(
+            wraps=mock_service.people().searchContacts
+        )
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        tools = mcp._tool_manager._tools
+        get_contact = tools["get_contact"].fn
+
+        first = get_contact(email="john.smith@example.com")
+        second = get_contact(email="John.Smith@Example.com")
+
+        assert first["contact"] == second["contact"]
+        assert mock_service.people().searchContacts.call_count == 1
+
+        cleared = tools["clear_contact_cache"].fn()
+        assert cleared["cleared"] == 1
+
+        get_contact(email="john.smith@example.com")
+        assert mock_service.people().searchContacts.call_count == 2
+
+    @patch("gmail_mcp.mcp.tools.contacts.time.monotonic")
+    @patch("gmail_mcp.mcp.tools.contacts.get_config")
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_get_contact_cache_expires(self, mock_get_service, mock_get_credentials, mock_get_config, mock_monotonic):
+        """Test cached email lookups are refreshed after the TTL."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from gmail_mcp.mcp.tools.contacts import CONTACT_CACHE_TTL_SECONDS
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_config.return_value = {"contacts_api_enabled": True}
+        mock_get_credentials.return_value = Mock()
+        mock_service = create_mock_people_service()
+        mock_service.people().searchContacts = MagicMock(
+            wraps=mock_service.people().searchContacts
+        )
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        get_contact = mcp._tool_manager._tools["get_contact"].fn
+
+        mock_monotonic.return_value = 1000.0
+        get_contact(email="john.smith@example.com")
+        mock_monotonic.return_value = 1000.0 + CONTACT_CACHE_TTL_SECONDS
+        get_contact(email="john.smith@example.com")
+        assert mock_service.people().searchContacts.call_count == 1
+
+        mock_monotonic.return_value = 1001.0 + CONTACT_CACHE_TTL_SECONDS
+        get_contact(email="john.smith@example.com")
+        assert mock_service.people().searchContacts.call_count == 2
+
+    @patch("gmail_mcp.mcp.tools.contacts.get_config")
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_delete_contact_reuses_cached_lookup(self, mock_get_service, mock_get_credentials, mock_get_config):
+        """Test a contact resolved by get_contact is deleted by email without searching again."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_config.return_value = {"contacts_api_enabled": True}
+        mock_get_credentials.return_value = Mock()
+        mock_service = create_mock_people_service()
+        mock_service.people().searchContacts = MagicMock(
+            wraps=mock_service.people().searchContacts
+        )
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        tools = mcp._tool_manager._tools
+
+        tools["get_contact"].fn(email="john.smith@example.com")
+        result = tools["delete_contact"].fn(email="John.Smith@example.com")
+
+        assert result["success"] is True
+        assert mock_service.people().searchContacts.call_count == 1
+        assert mock_service.people().deleteContact.call_args.kwargs["resourceName"] == "people/c123456789"
+
+    @patch("gmail_mcp.mcp.tools.contacts.get_config")
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_delete_contact_lookup_reads_emails_only(self, mock_get_service, mock_get_credentials, mock_get_config):
+        """Test resolving a contact by email requests only email addresses."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_config.return_value = {"contacts_api_enabled": True}
+        mock_get_credentials.return_value = Mock()
+        mock_service = create_mock_people_service()
+        mock_service.people().searchContacts = MagicMock(
+            wraps=mock_service.people().searchContacts
+        )
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        result = mcp._tool_manager._tools["delete_contact"].fn(email="john.smith@example.com")
+
+        assert result["success"] is True
+        assert mock_service.people().searchContacts.call_args.kwargs["readMask"] == "emailAddresses"
+
     @patch("gmail_mcp.mcp.tools.contacts.get_config")
     @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
     @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
@@ -493,3 +719,297 @@ class TestParsePerson:
         }
         # This is tested via list_contacts with various person data
         pass  # Covered by other tests
+
+
+class TestParseTypedValues:
+    """Tests for _parse_typed_values helper function."""
+
+    def test_primary_value_selected(self):
+        """Test the value marked primary becomes the top-level value."""
+        from gmail_mcp.mcp.tools.contacts import _parse_typed_values
+
+        parsed, primary = _parse_typed_values(SAMPLE_PERSON["emailAddresses"][::-1], "address")
+
+        assert primary == "john.smith@example.com"
+        assert [e["address"] for e in parsed] == ["john@personal.com", "john.smith@example.com"]
+        assert parsed[1]["primary"] is True
+
+    def test_falls_back_to_first_value(self):
+        """Test the first value is used when none is marked primary or metadata is missing."""
+        from gmail_mcp.mcp.tools.contacts import _parse_typed_values
+
+        parsed, primary = _parse_typed_values(
+            [{"value": "555-0100"}, {"value": "555-0199", "type": "work"}],
+            "number"
+        )
+
+        assert primary == "555-0100"
+        assert parsed[0] == {"number": "555-0100", "type": "other", "primary": False}
+
+
+class TestFindPersonByEmail:
+    """Tests for _find_person_by_email helper function."""
+
+    def test_returns_first_exact_match(self):
+        """Test the first person with a case-insensitive exact email match is returned."""
+        from gmail_mcp.mcp.tools.contacts import _find_person_by_email
+
+        results = [{"person": SAMPLE_PERSON_2}, {"person": SAMPLE_PERSON}, {}]
+
+        assert _find_person_by_email(results, "JOHN@personal.com") is SAMPLE_PERSON
+
+    def test_partial_match_ignored(self):
+        """Test search hits without an exact email match return None."""
+        from gmail_mcp.mcp.tools.contacts import _find_person_by_email
+
+        assert _find_person_by_email([{"person": SAMPLE_PERSON}], "john@example.com") is None
+
+
+class TestIterConnectionPages:
+    """Tests for _iter_connection_pages helper function."""
+
+    def test_follows_page_tokens(self):
+        """Test that every page is yielded in order with its page token."""
+        from gmail_mcp.mcp.tools.contacts import _iter_connection_pages
+
+        mock_service = MagicMock()
+        mock_list = mock_service.people().connections().list
+        mock_list.return_value.execute.side_effect = [
+            {"connections": [SAMPLE_PERSON], "nextPageToken": "p2"},
+            {"connections": [SAMPLE_PERSON_2]},
+        ]
+
+        pages = list(_iter_connection_pages(mock_service, "names", 100))
+
+        assert [p["connections"] for p in pages] == [[SAMPLE_PERSON], [SAMPLE_PERSON_2]]
+        assert "pageToken" not in mock_list.call_args_list[-2].kwargs
+        assert mock_list.call_args_list[-1].kwargs["pageToken"] == "p2"
+
+    def test_stops_at_max_contacts(self):
+        """Test that page sizes shrink to the remaining budget and fetching stops there."""
+        from gmail_mcp.mcp.tools.contacts import _iter_connection_pages
+
+        mock_service = MagicMock()
+        mock_list = mock_service.people().connections().list
+        mock_list.return_value.execute.side_effect = [
+            {"connections": [SAMPLE_PERSON, SAMPLE_PERSON_2], "nextPageToken": "p2"},
+            {"connections": [SAMPLE_PERSON], "nextPageToken": "p3"},
+        ]
+
+        pages = list(_iter_connection_pages(mock_service, "names", 2, max_contacts=3))
+
+        assert len(pages) == 2
+        assert mock_list.call_args_list[-1].kwargs["pageSize"] == 1
+        assert mock_list.return_value.execute.call_count == 2
+
+
+class TestSyncConnections:
+    """Tests for _sync_connections helper function."""
+
+    def test_applies_changes_since_last_sync(self):
+        """Test that later calls pass the sync token and apply additions, changes and deletions."""
+        from gmail_mcp.mcp.tools.contacts import _sync_connections
+
+        mock_service = MagicMock()
+        mock_list = mock_service.people().connections().list
+        person_3 = {"resourceName": "people/c3", "names": [{"displayName": "New Contact"}]}
+        changed = dict(SAMPLE_PERSON, etag="changed")
+        mock_list.return_value.execute.side_effect = [
+            {"connections": [SAMPLE_PERSON, SAMPLE_PERSON_2], "nextSyncToken": "s1"},
+            {
+                "connections": [
+                    changed,
+                    {"resourceName": SAMPLE_PERSON_2["resourceName"], "metadata": {"deleted": True}},
+                    person_3
+                ],
+                "nextSyncToken": "s2"
+            },
+        ]
+
+        credentials = Mock(token="access", refresh_token="refresh")
+        first = _sync_connections(mock_service, credentials, "names")
+        second = _sync_connections(mock_service, credentials, "names")
+
+        assert first == [SAMPLE_PERSON, SAMPLE_PERSON_2]
+        assert second == [changed, person_3]
+        assert mock_list.call_args_list[-2].kwargs["requestSyncToken"] is True
+        assert mock_list.call_args_list[-1].kwargs["syncToken"] == "s1"
+        assert mock_list.call_args_list[-1].kwargs["requestSyncToken"] is True
+
+    def test_expired_token_lists_everything(self):
+        """Test that an expired sync token falls back to a full listing."""
+        from googleapiclient.errors import HttpError
+        from gmail_mcp.mcp.tools.contacts import _sync_connections
+
+        mock_service = MagicMock()
+        mock_list = mock_service.people().connections().list
+        mock_list.return_value.execute.side_effect = [
+            {"connections": [SAMPLE_PERSON], "nextSyncToken": "s1"},
+            HttpError(
+                Mock(status=400),
+                b'{"error": {"code": 400, "status": "FAILED_PRECONDITION", '
+                b'"details": [{"reason": "EXPIRED_SYNC_TOKEN"}]}}'
+            ),
+            {"connections": [SAMPLE_PERSON_2], "nextSyncToken": "s2"},
+        ]
+
+        credentials = Mock(token="access", refresh_token="refresh")
+        _sync_connections(mock_service, credentials, "names")
+        result = _sync_connections(mock_service, credentials, "names")
+
+        assert result == [SAMPLE_PERSON_2]
+        assert mock_list.call_args_list[-1].kwargs["requestSyncToken"] is True
+
+    def test_other_bad_request_is_raised(self):
+        """Test that a 400 unrelated to the sync token is not treated as expiry."""
+        from googleapiclient.errors import HttpError
+        from gmail_mcp.mcp.tools.contacts import _sync_connections
+
+        mock_service = MagicMock()
+        mock_list = mock_service.people().connections().list
+        mock_list.return_value.execute.side_effect = [
+            {"connections": [SAMPLE_PERSON], "nextSyncToken": "s1"},
+            HttpError(Mock(status=400), b'{"error": {"code": 400, "status": "INVALID_ARGUMENT"}}'),
+        ]
+
+        credentials = Mock(token="access", refresh_token="refresh")
+        _sync_connections(mock_service, credentials, "names")
+
+        with pytest.raises(HttpError):
+            _sync_connections(mock_service, credentials, "names")
+
+    def test_accounts_without_refresh_token_are_kept_apart(self):
+        """Test that credentials without a refresh token do not share a synced list."""
+        from gmail_mcp.mcp.tools.contacts import _sync_connections
+
+        mock_service = MagicMock()
+        mock_list = mock_service.people().connections().list
+        mock_list.return_value.execute.side_effect = [
+            {"connections": [SAMPLE_PERSON], "nextSyncToken": "s1"},
+            {"connections": [SAMPLE_PERSON_2], "nextSyncToken": "s2"},
+        ]
+
+        first_account = Mock(token="a", refresh_token=None)
+        second_account = Mock(token="b", refresh_token=None)
+        first = _sync_connections(mock_service, first_account, "names")
+        second = _sync_connections(mock_service, second_account, "names")
+
+        assert first == [SAMPLE_PERSON]
+        assert second == [SAMPLE_PERSON_2]
+        assert "syncToken" not in mock_list.call_args_list[-1].kwargs
+
+
+class TestNormalizePhone:
+    """Tests for _normalize_phone helper function."""
+
+    def test_strips_formatting(self):
+        """Test that punctuation, spaces and letters are removed."""
+        from gmail_mcp.mcp.tools.contacts import _normalize_phone
+
+        assert _normalize_phone("+1 (555) 123-4567 ext. 8") == "155512345678"
+
+    def test_keeps_non_ascii_digits(self):
+        """Test that Unicode decimal digits are kept, matching the regex \\d class."""
+        from gmail_mcp.mcp.tools.contacts import _normalize_phone
+
+        assert _normalize_phone("٠١٢-345²") == "٠١٢345"
+
+    def test_results_are_cached(self):
+        """Test that repeated numbers are served from the cache."""
+        from gmail_mcp.mcp.tools.contacts import _normalize_phone
+
+        _normalize_phone.cache_clear()
+        _normalize_phone("555-0100")
+        _normalize_phone("555-0100")
+
+        assert _normalize_phone.cache_info().hits == 1
+
+
+class TestSplitName:
+    """Tests for _split_name helper function."""
+
+    def test_splits_at_first_word(self):
+        """Test that the first word is the given name and the rest the family name."""
+        from gmail_mcp.mcp.tools.contacts import _split_name
+
+        assert _split_name("Mary Ann  van Dyke") == ("Mary", "Ann van Dyke")
+        assert _split_name("Cher") == ("Cher", "")
+        assert _split_name(" ") == ("", "")
+
+
+class TestBuildPersonBody:
+    """Tests for _build_person_body helper function."""
+
+    def test_sets_only_given_fields(self):
+        """Test that the body holds only the given values and lists their fields in order."""
+        from gmail_mcp.mcp.tools.contacts import _build_person_body
+
+        body, fields = _build_person_body(name="Jane Doe", phone="555-0100", title="CTO")
+
+        assert fields == ["names", "phoneNumbers", "organizations"]
+        assert body["names"] == [{"givenName": "Jane", "familyName": "Doe"}]
+        assert body["organizations"] == [{"title": "CTO"}]
+        assert "emailAddresses" not in body
+
+    def test_empty(self):
+        """Test that no values produce an empty body."""
+        from gmail_mcp.mcp.tools.contacts import _build_person_body
+
+        assert _build_person_body() == ({}, [])
+
+
+class TestDisjointSet:
+    """Tests for _DisjointSet helper class."""
+
+    def test_union_merges_into_first_root(self):
+        """Test that unions are transitive and keep the first argument's root."""
+        from gmail_mcp.mcp.tools.contacts import _DisjointSet
+
+        groups = _DisjointSet(4)
+        groups.union(0, 1)
+        groups.union(2, 1)
+
+        assert groups.find(0) == groups.find(1) == groups.find(2) == 2
+        assert groups.find(3) == 3
+
+
+class TestSummarizePerson:
+    """Tests for _summarize_person helper function."""
+
+    def test_matches_parsed_identity_and_flags(self):
+        """Test name, primary email and presence flags."""
+        from gmail_mcp.mcp.tools.contacts import _summarize_person
+
+        summary = _summarize_person(SAMPLE_PERSON)
+
+        assert summary == {
+            "resource_name": "people/c123456789",
+            "name": "John Smith",
+            "email": "john.smith@example.com",
+            "has_email": True,
+            "has_phone": True,
+            "has_organization": True,
+        }
+
+    def test_missing_fields(self):
+        """Test a person with no names, emails, phones or organizations."""
+        from gmail_mcp.mcp.tools.contacts import _summarize_person
+
+        summary = _summarize_person({"resourceName": "people/c1", "organizations": [{"title": "CEO"}]})
+
+        assert "name" not in summary
+        assert "email" not in summary
+        assert summary["has_email"] is False
+        assert summary["has_organization"] is False
+
+
+class TestNameSortKey:
+    """Tests for _name_sort_key helper function."""
+
+    def test_ignores_order_case_punctuation_and_repeats(self):
+        """Test that reordered, repeated and punctuated names share a key."""
+        from gmail_mcp.mcp.tools.contacts import _name_sort_key
+
+        assert _name_sort_key("Smith, John") == "john smith"
+        assert _name_sort_key("JOHN  john-Smith") == "john smith"
+        assert _name_sort_key("...") == ""
@@ -23,6 +23,78 @@ def mock_config():
     return config
 
 
+class FakeBatch:
+    """Stand-in for a Gmail BatchHttpRequest that answers searches by address.
+
+    Requests are the keyword arguments passed to messages().list().
+    """
+
+    def __init__(self, callback, responses):
+        self.callback = callback
+        self.responses = responses
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            email = request["q"].split("from:")[1].split(" ")[0]
+            if email in self.responses:
+                self.callback(request_id, self.responses[email], None)
+            else:
+                self.callback(request_id, None, Exception("search failed"))
+
+
+class TestListAllContacts:
+    """Tests for list_all_contacts tool."""
+
+    @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_list_all_contacts_follows_pages(self, mock_people, mock_creds):
+        """Test that pages are followed and only requested fields are fetched."""
+        mock_creds.return_value = Mock()
+        mock_service = MagicMock()
+        mock_people.return_value = mock_service
+
+        mock_list = mock_service.people().connections().list
+        mock_list.return_value.execute.side_effect = [
+            {
+                "connections": [{"resourceName": "people/c1", "names": [{"displayName": "One"}]}],
+                "nextPageToken": "page2",
+                "totalPeople": 2,
+            },
+            {
+                "connections": [{"resourceName": "people/c2", "names": [{"displayName": "Two"}]}],
+                "totalPeople": 2,
+            },
+        ]
+
+        list_all_contacts = get_tool("list_all_contacts")
+        result = list_all_contacts(fields=["names", "emailAddresses"])
+
+        assert result["success"] is True
+        assert [c["name"] for c in result["contacts"]] == ["One", "Two"]
+        assert result["truncated"] is False
+
+        last_call = mock_list.call_args_list[-1].kwargs
+        assert last_call["pageToken"] == "page2"
+        assert last_call["personFields"] == "names,emailAddresses"
+        assert last_call["fields"] == (
+            "connections(resourceName,etag,names,emailAddresses),nextPageToken,totalPeople"
+        )
+
+    @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
+    def test_list_all_contacts_invalid_field(self):
+        """Test that unknown person fields are rejected before any API call."""
+        list_all_contacts = get_tool("list_all_contacts")
+        result = list_all_contacts(fields=["names", "birthdays"])
+
+        assert result["success"] is False
+        assert "birthdays" in result["error"]
+
+
 class TestFindDuplicateContacts:
     """Tests for find_duplicate_contacts tool."""
 
@@ -57,6 +129,125 @@ class TestFindDuplicateContacts:
         assert result["success"] is True
         assert len(result["duplicate_groups"]) >= 1
 
+    @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_find_duplicates_similar_names(self, mock_people, mock_creds):
+        """Test name similarity matching across names of different lengths."""
+        mock_creds.return_value = Mock()
+        mock_service = MagicMock()
+        mock_people.return_value = mock_service
+
+        mock_service.people().connections().list().execute.return_value = {
+            "connections": [
+                {"resourceName": "people/c1", "names": [{"displayName": "Jonathan Smith"}]},
+                {"resourceName": "people/c2", "names": [{"displayName": "Al"}]},
+                {"resourceName": "people/c3", "names": [{"displayName": "Jonathon Smith"}]},
+                {"resourceName": "people/c4", "names": [{"displayName": "Alexandria Smithson"}]},
+            ]
+        }
+
+        find_duplicate_contacts = get_tool("find_duplicate_contacts")
+        result = find_duplicate_contacts(threshold=0.8)
+
+        assert result["success"] is True
+        assert len(result["duplicate_groups"]) == 1
+        group = result["duplicate_groups"][0]
+        assert [c["resource_name"] for c in group["contacts"]] == ["people/c1", "people/c3"]
+        assert group["match_reason"] == "Similar name (93%)"
+
+    @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_find_duplicates_ignores_name_word_order(self, mock_people, mock_creds):
+        """Test that reordered names with punctuation still match."""
+        mock_creds.return_value = Mock()
+        mock_service = MagicMock()
+        mock_people.return_value = mock_service
+
+        mock_service.people().connections().list().execute.return_value = {
+            "connections": [
+                {"resourceName": "people/c1", "names": [{"displayName": "John Smith"}]},
+                {"resourceName": "people/c2", "names": [{"displayName": "Smith, John"}]},
+            ]
+        }
+
+        find_duplicate_contacts = get_tool("find_duplicate_contacts")
+        result = find_duplicate_contacts(threshold=0.95)
+
+        assert result["total_groups"] == 1
+        assert result["duplicate_groups"][0]["match_reason"] == "Similar name (100%)"
+
+    @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_find_duplicates_blocking_keeps_near_matches(self, mock_people, mock_creds):
+        """Test that names differing only in rare letters still match, and unrelated names don't."""
+        mock_creds.return_value = Mock()
+        mock_service = MagicMock()
+        mock_people.return_value = mock_service
+
+        mock_service.people().connections().list().execute.return_value = {
+            "connections": [
+                {"resourceName": "people/c1", "names": [{"displayName": "Katherine Zeta"}]},
+                {"resourceName": "people/c2", "names": [{"displayName": "Bob Lee"}]},
+                {"resourceName": "people/c3", "names": [{"displayName": "Catherine Zeta"}]},
+            ]
+        }
+
+        find_duplicate_contacts = get_tool("find_duplicate_contacts")
+        result = find_duplicate_contacts(threshold=0.9)
+
+        assert result["total_groups"] == 1
+        group = result["duplicate_groups"][0]
+        assert [c["resource_name"] for c in group["contacts"]] == ["people/c1", "people/c3"]
+        assert group["match_reason"] == "Similar name (93%)"
+
+    @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_find_duplicates_groups_transitive_matches(self, mock_people, mock_creds):
+        """Test that contacts linked through a shared contact form one group."""
+        mock_creds.return_value = Mock()
+        mock_service = MagicMock()
+        mock_people.return_value = mock_service
+
+        mock_service.people().connections().list().execute.return_value = {
+            "connections": [
+                {
+                    "resourceName": "people/c1",
+                    "names": [{"displayName": "Alice Able"}],
+                    "emailAddresses": [{"value": "alice@example.com"}],
+                },
+                {
+                    "resourceName": "people/c2",
+                    "names": [{"displayName": "Bob Baker"}],
+                    "emailAddresses": [{"value": "ALICE@example.com"}],
+                    "phoneNumbers": [{"value": "(555) 123-4567"}],
+                },
+                {
+                    "resourceName": "people/c3",
+                    "names": [{"displayName": "Carol Cook"}],
+                    "phoneNumbers": [{"value": "555.123.4567"}],
+                },
+                {
+                    "resourceName": "people/c4",
+                    "names": [{"displayName": "Dave Dunn"}],
+                },
+            ]
+        }
+
+        find_duplicate_contacts = get_tool("find_duplicate_contacts")
+        result = find_duplicate_contacts(threshold=0.9)
+
+        assert result["total_groups"] == 1
+        group = result["duplicate_groups"][0]
+        assert [c["resource_name"] for c in group["contacts"]] == [
+            "people/c1", "people/c2", "people/c3"
+        ]
+        assert group["match_reason"] == "Same email: alice@example.com; Same phone: 5551234567"
+        assert group["confidence"] == 1.0
+
     @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
     def test_find_duplicates_not_authenticated(self, mock_creds):
         """Test that unauthenticated request returns error."""
@@ -97,15 +288,65 @@ class TestFindStaleContacts:
         # No recent email activity
         mock_gmail_service = MagicMock()
         mock_gmail.return_value = mock_gmail_service
-        mock_gmail_service.users().messages().list().execute.return_value = {
-            "messages": []
-        }
+        mock_gmail_service.users().messages().list.side_effect = lambda **kwargs: kwargs
+        mock_gmail_service.new_batch_http_request.side_effect = (
+            lambda callback: FakeBatch(callback, {"old@example.com": {"messages": []}})
+        )
 
         find_stale_contacts = get_tool("find_stale_contacts")
         result = find_stale_contacts(months=12, max_results=100)
 
         assert result["success"] is True
         assert "stale_contacts" in result
+        assert [c["email"] for c in result["stale_contacts"]] == ["old@example.com"]
+
+    @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    @patch("gmail_mcp.mcp.tools.contacts.get_gmail_service")
+    def test_find_stale_contacts_batches_searches(self, mock_gmail, mock_people, mock_creds):
+        """Test that activity searches are batched and failed searches are skipped."""
+        mock_creds.return_value = Mock()
+        mock_service = MagicMock()
+        mock_people.return_value = mock_service
+
+        mock_service.people().connections().list().execute.return_value = {
+            "connections": [
+                {
+                    "resourceName": f"people/c{i}",
+                    "names": [{"displayName": f"Contact {i}"}],
+                    "emailAddresses": [{"value": f"c{i}@example.com"}],
+                }
+                for i in range(150)
+            ]
+        }
+
+        # c0 is active, c1's search fails, everyone else is stale
+        responses = {f"c{i}@example.com": {"messages": []} for i in range(150)}
+        responses["c0@example.com"] = {"messages": [{"id": "m1"}]}
+        del responses["c1@example.com"]
+
+        batches = []
+
+        def new_batch(callback):
+            batches.append(FakeBatch(callback, responses))
+            return batches[-1]
+
+        mock_gmail_service = MagicMock()
+        mock_gmail.return_value = mock_gmail_service
+        mock_gmail_service.users().messages().list.side_effect = lambda **kwargs: kwargs
+        mock_gmail_service.new_batch_http_request.side_effect = new_batch
+
+        find_stale_contacts = get_tool("find_stale_contacts")
+        result = find_stale_contacts(months=12, max_results=500)
+
+        assert result["success"] is True
+        assert [len(b.requests) for b in batches] == [100, 50]
+        assert result["total_stale"] == 148
+        stale_emails = [c["email"] for c in result["stale_contacts"]]
+        assert "c0@example.com" not in stale_emails
+        assert "c1@example.com" not in stale_emails
+        assert stale_emails[0] == "c2@example.com"
 
     @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
     def test_find_stale_not_authenticated(self, mock_creds):
@@ -191,6 +432,11 @@ class TestExportContacts:
         content = output_file.read_text()
         assert "Test User" in content
         assert "test@example.com" in content
+        assert content.splitlines() == [
+            "name,email,phone,organization,title,notes",
+            "Test User,test@example.com,555-1234,,,",
+        ]
+        assert result["exported"] == 1
 
     @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
     def test_export_contacts_not_authenticated(self, mock_creds):
@@ -258,6 +504,59 @@ class TestContactCRUD:
         )
 
         assert result["success"] is True
+        get_kwargs = mock_service.people().get.call_args.kwargs
+        assert get_kwargs["personFields"] == "metadata"
+        assert get_kwargs["fields"] == "etag"
+        assert mock_service.people().updateContact.call_args.kwargs["body"]["etag"] == "abc123"
+
+    @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_update_contact_appends_notes(self, mock_people, mock_creds):
+        """Test that existing notes are fetched and kept when appending."""
+        mock_creds.return_value = Mock()
+        mock_service = MagicMock()
+        mock_people.return_value = mock_service
+
+        mock_service.people().get().execute.return_value = {
+            "etag": "abc123",
+            "biographies": [{"value": "Met at conference"}],
+        }
+        mock_service.people().updateContact().execute.return_value = {"resourceName": "people/c123"}
+
+        update_contact = get_tool("update_contact")
+        result = update_contact(resource_name="people/c123", notes="Follow up", append_notes=True)
+
+        assert result["success"] is True
+        assert mock_service.people().get.call_args.kwargs["personFields"] == "biographies"
+        body = mock_service.people().updateContact.call_args.kwargs["body"]
+        assert body["biographies"][0]["value"] == "Met at conference\n\nFollow up"
+
+    @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_update_contact_etag_conflict(self, mock_people, mock_creds):
+        """Test that a stale etag is reported as a retryable conflict with the current etag."""
+        from googleapiclient.errors import HttpError
+
+        mock_creds.return_value = Mock()
+        mock_service = MagicMock()
+        mock_people.return_value = mock_service
+
+        mock_service.people().get().execute.side_effect = [{"etag": "old"}, {"etag": "new"}]
+        mock_service.people().updateContact().execute.side_effect = HttpError(
+            Mock(status=400),
+            b'{"error": {"code": 400, "message": "Request person.etag is different than the '
+            b'current person.etag.", "status": "FAILED_PRECONDITION"}}'
+        )
+
+        update_contact = get_tool("update_contact")
+        result = update_contact(resource_name="people/c123", name="New Name")
+
+        assert result["success"] is False
+        assert result["error"] == "conflict"
+        assert result["retry"] is True
+        assert result["current_etag"] == "new"
 
     @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
     @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
@@ -275,6 +574,26 @@ class TestContactCRUD:
 
         assert result["success"] is True
 
+    @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_delete_contact_permission_denied(self, mock_people, mock_creds):
+        """Test that only an HTTP 403 is reported as a scope problem."""
+        from googleapiclient.errors import HttpError
+
+        mock_creds.return_value = Mock()
+        mock_service = MagicMock()
+        mock_people.return_value = mock_service
+        delete_contact = get_tool("delete_contact")
+
+        mock_service.people().deleteContact().execute.side_effect = HttpError(Mock(status=403), b"forbidden")
+        result = delete_contact(resource_name="people/c123")
+        assert result["error"].startswith("Permission denied")
+
+        mock_service.people().deleteContact().execute.side_effect = Exception("people/c403 not found")
+        result = delete_contact(resource_name="people/c403")
+        assert result["error"] == "people/c403 not found"
+
     @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
     def test_create_contact_not_authenticated(self, mock_creds):
         """Test unauthenticated request."""
@@ -311,6 +630,35 @@ class TestContactGroups:
         assert result["success"] is True
         assert len(result["groups"]) == 2
 
+    @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_list_contact_groups_paginates(self, mock_people, mock_creds):
+        """Test that pages are followed until max_results and the resume token is returned."""
+        mock_creds.return_value = Mock()
+        mock_service = MagicMock()
+        mock_people.return_value = mock_service
+
+        mock_service.contactGroups().list().execute.side_effect = [
+            {"contactGroups": [{"resourceName": "contactGroups/1"}, {"resourceName": "contactGroups/2"}],
+             "nextPageToken": "page2"},
+            {"contactGroups": [{"resourceName": "contactGroups/3"}], "nextPageToken": "page3"},
+        ]
+        mock_service.contactGroups().list.reset_mock()
+
+        list_contact_groups = get_tool("list_contact_groups")
+        result = list_contact_groups(max_results=3)
+
+        assert [g["resource_name"] for g in result["groups"]] == [
+            "contactGroups/1", "contactGroups/2", "contactGroups/3"
+        ]
+        assert result["next_page_token"] == "page3"
+        calls = mock_service.contactGroups().list.call_args_list
+        assert calls[0].kwargs["pageSize"] == 3
+        assert "pageToken" not in calls[0].kwargs
+        assert calls[1].kwargs["pageSize"] == 1
+        assert calls[1].kwargs["pageToken"] == "page2"
+
     @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
     @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
     @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
@@ -331,6 +679,36 @@ class TestContactGroups:
         assert result["success"] is True
         assert result["group"]["name"] == "New Group"
 
+    @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_add_contacts_to_group_chunks_large_lists(self, mock_people, mock_creds):
+        """Test that large member lists are split into batched chunks and partial failures reported."""
+        mock_creds.return_value = Mock()
+        mock_service = MagicMock()
+        mock_people.return_value = mock_service
+        mock_service.contactGroups().members().modify.side_effect = lambda resourceName, body: body
+
+        batch = MagicMock()
+
+        def new_batch(callback):
+            batch.execute.side_effect = lambda: [
+                callback(c.kwargs["request_id"], {}, Exception("quota") if c.kwargs["request_id"] == "1" else None)
+                for c in batch.add.call_args_list
+            ]
+            return batch
+
+        mock_service.new_batch_http_request.side_effect = new_batch
+
+        contacts = [f"people/c{i}" for i in range(1500)]
+        add_contacts_to_group = get_tool("add_contacts_to_group")
+        result = add_contacts_to_group(group_resource_name="contactGroups/1", contact_resource_names=contacts)
+
+        assert result["success"] is True
+        assert [len(c.args[0]["resourceNamesToAdd"]) for c in batch.add.call_args_list] == [1000, 500]
+        assert result["contacts_added"] == contacts[:1000]
+        assert result["contacts_failed"] == contacts[1000:]
+
     @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
     def test_list_groups_not_authenticated(self, mock_creds):
         """Test unauthenticated request."""
@@ -342,6 +720,34 @@ class TestContactGroups:
         assert result["success"] is False
 
 
+MERGE_RESPONSES = {
+    "responses": [
+        {
+            "requestedResourceName": "people/c2",
+            "person": {
+                "resourceName": "people/c2",
+                "etag": "etag2",
+                "names": [{"displayName": "Johnny D"}],
+                "phoneNumbers": [{"value": "555-1234"}],
+            },
+        },
+        {
+            "requestedResourceName": "people/c1",
+            "person": {
+                "resourceName": "people/c1",
+                "etag": "etag1",
+                "names": [{"displayName": "John Doe"}],
+                "emailAddresses": [{"value": "john@example.com"}],
+            },
+        },
+        {
+            "requestedResourceName": "people/c3",
+            "person": {"resourceName": "people/c3", "etag": "etag3"},
+        },
+    ]
+}
+
+
 class TestMergeContacts:
     """Tests for merge_contacts tool."""
 
@@ -355,25 +761,7 @@ class TestMergeContacts:
         mock_people.return_value = mock_service
 
         # Mock getting contacts to merge
-        def get_side_effect(resourceName, personFields):
-            mock_response = MagicMock()
-            if 'c1' in resourceName:
-                mock_response.execute.return_value = {
-                    "resourceName": "people/c1",
-                    "etag": "etag1",
-                    "names": [{"displayName": "John Doe"}],
-                    "emailAddresses": [{"value": "john@example.com"}],
-                }
-            else:
-                mock_response.execute.return_value = {
-                    "resourceName": "people/c2",
-                    "etag": "etag2",
-                    "names": [{"displayName": "Johnny D"}],
-                    "phoneNumbers": [{"value": "555-1234"}],
-                }
-            return mock_response
-
-        mock_service.people().get.side_effect = get_side_effect
+        mock_service.people().getBatchGet.return_value.execute.return_value = MERGE_RESPONSES
 
         merge_contacts = get_tool("merge_contacts")
         result = merge_contacts(
@@ -385,6 +773,113 @@ class TestMergeContacts:
         assert result["dry_run"] is True
         assert "merged_preview" in result
 
+    @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_merge_contacts_batches_requests(self, mock_people, mock_creds):
+        """Test that contacts are fetched in one request and deleted in one batch."""
+        mock_creds.return_value = Mock()
+        mock_service = MagicMock()
+        mock_people.return_value = mock_service
+        mock_service.people().getBatchGet.return_value.execute.return_value = MERGE_RESPONSES
+        mock_service.people().deleteContact.side_effect = lambda resourceName: resourceName
+
+        batches = []
+
+        def new_batch(callback):
+            batch = MagicMock()
+            batch.execute.side_effect = lambda: [
+                callback(c.kwargs["request_id"], {}, Exception("gone") if c.args[0] == "people/c3" else None)
+                for c in batch.add.call_args_list
+            ]
+            batches.append(batch)
+            return batch
+
+        mock_service.new_batch_http_request.side_effect = new_batch
+
+        merge_contacts = get_tool("merge_contacts")
+        result = merge_contacts(
+            resource_names=["people/c1", "people/c2", "people/c3"],
+            dry_run=False
+        )
+
+        assert result["success"] is True
+        assert result["merged_preview"]["email"] == "john@example.com"
+        assert result["contacts_deleted"] == ["people/c2"]
+        assert mock_service.people().getBatchGet.call_args.kwargs["resourceNames"] == [
+            "people/c1", "people/c2", "people/c3"
+        ]
+        assert len(batches) == 1
+        assert batches[0].execute.call_count == 1
+        # The primary already has every email, so only phones are written
+        update_kwargs = mock_service.people().updateContact.call_args.kwargs
+        assert update_kwargs["updatePersonFields"] == "phoneNumbers"
+
+    @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_merge_contacts_skips_noop_update(self, mock_people, mock_creds):
+        """Test that the primary is not rewritten when it already holds every value."""
+        mock_creds.return_value = Mock()
+        mock_service = MagicMock()
+        mock_people.return_value = mock_service
+        mock_service.people().getBatchGet.return_value.execute.return_value = {
+            "responses": [
+                {
+                    "requestedResourceName": "people/c1",
+                    "person": {
+                        "resourceName": "people/c1",
+                        "emailAddresses": [{"value": "John@example.com"}],
+                        "phoneNumbers": [{"value": "(555) 123-4567"}],
+                    },
+                },
+                {
+                    "requestedResourceName": "people/c2",
+                    "person": {
+                        "resourceName": "people/c2",
+                        "emailAddresses": [{"value": "john@example.com"}],
+                        "phoneNumbers": [{"value": "555.123.4567"}],
+                    },
+                },
+            ]
+        }
+
+        merge_contacts = get_tool("merge_contacts")
+        result = merge_contacts(resource_names=["people/c1", "people/c2"], dry_run=False)
+
+        assert result["success"] is True
+        mock_service.people().updateContact.assert_not_called()
+
+    @patch("gmail_mcp.mcp.tools.contacts.AuthorizedHttp")
+    @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    def test_merge_contacts_deletes_individually_when_batch_fails(self, mock_people, mock_creds, mock_http):
+        """Test that deletes fall back to concurrent single requests when the batch fails."""
+        mock_creds.return_value = Mock()
+        mock_service = MagicMock()
+        mock_people.return_value = mock_service
+        mock_service.people().getBatchGet.return_value.execute.return_value = MERGE_RESPONSES
+        mock_service.new_batch_http_request.return_value.execute.side_effect = Exception("batch unavailable")
+
+        def delete_request(resourceName):
+            request = Mock()
+            if resourceName == "people/c3":
+                request.execute.side_effect = Exception("gone")
+            return request
+
+        mock_service.people().deleteContact.side_effect = delete_request
+
+        merge_contacts = get_tool("merge_contacts")
+        result = merge_contacts(
+            resource_names=["people/c1", "people/c2", "people/c3"],
+            dry_run=False
+        )
+
+        assert result["success"] is True
+        assert result["contacts_deleted"] == ["people/c2"]
+        assert mock_http.call_count == 2
+
     @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
     def test_merge_contacts_not_authenticated(self, mock_creds):
         """Test unauthenticated request."""
@@ -394,3 +889,108 @@ class TestMergeContacts:
         result = merge_contacts(resource_names=["people/c1", "people/c2"])
 
         assert result["success"] is False
+
+
+class TestEnrichContactFromEmail:
+    """Tests for enrich_contact_from_email tool."""
+
+    @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    @patch("gmail_mcp.mcp.tools.contacts.get_gmail_service")
+    def test_enrich_reads_multipart_body(self, mock_gmail, mock_people, mock_creds):
+        """Test that the signature is read from the text/plain part of a multipart message."""
+        import base64
+
+        mock_creds.return_value = Mock()
+        mock_gmail_service = MagicMock()
+        mock_gmail.return_value = mock_gmail_service
+        mock_people_service = MagicMock()
+        mock_people.return_value = mock_people_service
+
+        body = base64.urlsafe_b64encode(b"Thanks,\nJane Doe\nVP Sales at Acme Corp").decode()
+        mock_gmail_service.users().messages().get().execute.return_value = {
+            "payload": {
+                "headers": [{"name": "From", "value": "Jane Doe <jane@acme.com>"}],
+                "parts": [
+                    {"mimeType": "text/html", "body": {"data": ""}},
+                    {"mimeType": "text/plain", "body": {"data": body}},
+                ],
+            }
+        }
+        mock_people_service.people().searchContacts().execute.return_value = {"results": []}
+
+        enrich_contact_from_email = get_tool("enrich_contact_from_email")
+        result = enrich_contact_from_email(email_id="msg1")
+
+        assert result["success"] is True
+        assert result["target_email"] == "jane@acme.com"
+        assert result["extracted_info"]["title"] == "VP Sales"
+        assert result["extracted_info"]["company"] == "Acme Corp"
+
+    @patch("gmail_mcp.mcp.tools.contacts.get_config", mock_config)
+    @patch("gmail_mcp.mcp.tools.contacts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.contacts.get_people_service")
+    @patch("gmail_mcp.mcp.tools.contacts.get_gmail_service")
+    def test_enrich_reads_nested_body(self, mock_gmail, mock_people, mock_creds):
+        """Test that a text/plain part nested in multipart/alternative is found."""
+        import base64
+
+        mock_creds.return_value = Mock()
+        mock_gmail_service = MagicMock()
+        mock_gmail.return_value = mock_gmail_service
+        mock_people_service = MagicMock()
+        mock_people.return_value = mock_people_service
+
+        body = base64.urlsafe_b64encode(b"Best,\nJane\nPhone: 555-123-4567").decode()
+        mock_gmail_service.users().messages().get().execute.return_value = {
+            "payload": {
+                "mimeType": "multipart/mixed",
+                "headers": [{"name": "From", "value": "jane@acme.com"}],
+                "parts": [
+                    {
+                        "mimeType": "multipart/alternative",
+                        "parts": [
+                            {"mimeType": "text/plain", "body": {"data": body}},
+                            {"mimeType": "text/html", "body": {"data": body}},
+                        ],
+                    },
+                    {"mimeType": "application/pdf", "body": {"attachmentId": "a1"}},
+                ],
+            }
+        }
+        mock_people_service.people().searchContacts().execute.return_value = {"results": []}
+
+        enrich_contact_from_email = get_tool("enrich_contact_from_email")
+        result = enrich_contact_from_email(email_id="msg1")
+
+        assert result["success"] is True
+        assert result["extracted_info"]["phone"] == "555-123-4567"
+        fields = mock_gmail_service.users().messages().get.call_args.kwargs["fields"]
+        assert fields.startswith("payload(headers(name,value),mimeType,body/data,parts(")
+
+
+class TestParseSignature:
+    """Tests for the _parse_signature helper."""
+
+    def test_extracts_phone_title_and_linkedin(self):
+        """Test a typical signature block."""
+        from gmail_mcp.mcp.tools.contacts import _parse_signature
+
+        result = _parse_signature(
+            "Jane Doe\nVP Sales at Acme Corp\nPhone: 555-123-4567\nlinkedin.com/in/janedoe"
+        )
+
+        assert result["title"] == "VP Sales"
+        assert result["company"] == "Acme Corp"
+        assert result["phone"] == "555-123-4567"
+        assert result["linkedin"] == "https://linkedin.com/in/janedoe"
+
+    def test_later_title_pattern_takes_precedence(self):
+        """Test that a "Title | Company" line wins over a "Title at Company" line."""
+        from gmail_mcp.mcp.tools.contacts import _parse_signature
+
+        result = _parse_signature("CTO at Initech\nEngineer | Globex")
+
+        assert result["title"] == "Engineer"
+        assert result["company"] == "Globex"
@@ -9,6 +9,34 @@ from unittest.mock import Mock, patch, MagicMock
 import base64
 
 
+@pytest.fixture(autouse=True)
+def clear_draft_cache_fixture():
+    """Clear the get_draft cache before each test to prevent test pollution."""
+    from gmail_mcp.utils.draft_cache import clear_draft_cache
+    clear_draft_cache()
+    yield
+    clear_draft_cache()
+
+
+class FakeBatch:
+    """Stand-in for a BatchHttpRequest that runs each added request on execute."""
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, callback=None, request_id=None):
+        self.requests.append((request, callback or self.callback, request_id))
+
+    def execute(self):
+        for index, (request, callback, request_id) in enumerate(self.requests):
+            try:
+                response, exception = request.execute(), None
+            except Exception as e:
+                response, exception = None, e
+            callback(request_id if request_id is not None else str(index), response, exception)
+
+
 def create_mock_gmail_service():
     """Create a mock Gmail API service for draft operations."""
     service = MagicMock()
@@ -61,6 +89,21 @@ def create_mock_gmail_service():
                     "snippet": "This is the draft body...",
                 },
             }
+        elif format_type == "raw":
+            result.execute.return_value = {
+                "id": draft_id,
+                "message": {
+                    "id": "msg001",
+                    "threadId": "thread001",
+                    "raw": base64.urlsafe_b64encode(
+                        b"To: recipient@example.com\r\n"
+                        b"Subject: Test Draft Subject\r\n"
+                        b"Content-Type: text/plain; charset=\"utf-8\"\r\n"
+                        b"\r\n"
+                        b"This is the draft body content.\r\n"
+                    ).decode(),
+                },
+            }
         else:  # full format
             result.execute.return_value = {
                 "id": draft_id,
@@ -69,6 +112,25 @@ def create_mock_gmail_service():
         return result
 
     service.users().drafts().get = mock_get_draft
+    # Mock messages().get() for the metadata fetched by list_drafts
+    def mock_get_message(*args, **kwargs):
+        result = MagicMock()
+        result.execute.return_value = {
+            "id": kwargs.get("id", "msg001"),
+            "threadId": "thread001",
+            "payload": {
+                "headers": [
+                    {"name": "To", "value": "recipient@example.com"},
+                    {"name": "Subject", "value": "Test Draft Subject"},
+                    {"name": "Date", "value": "Mon, 20 Jan 2026 10:00:00 -0800"},
+                ],
+            },
+            "snippet": "This is the draft body...",
+        }
+        return result
+
+    service.users().messages().get = mock_get_message
+    service.new_batch_http_request.side_effect = FakeBatch
 
     # Mock drafts().update()
     def mock_update_draft(*args, **kwargs):
@@ -125,6 +187,42 @@ class TestListDrafts:
         assert result["drafts"][0]["draft_id"] == "draft001"
         assert result["drafts"][0]["subject"] == "Test Draft Subject"
 
+    @patch("gmail_mcp.mcp.tools.email_drafts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.email_drafts.get_gmail_service")
+    def test_list_drafts_batches_message_fetches(self, mock_get_service, mock_get_credentials):
+        """Test that draft messages are fetched in one batch and failed fetches are skipped."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_credentials.return_value = Mock()
+        mock_service = create_mock_gmail_service()
+        get_message = mock_service.users().messages().get
+
+        def get_or_fail(*args, **kwargs):
+            if kwargs["id"] == "msg001":
+                request = MagicMock()
+                request.execute.side_effect = Exception("not found")
+                return request
+            return get_message(*args, **kwargs)
+
+        mock_service.users().messages().get = MagicMock(side_effect=get_or_fail)
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        list_drafts = mcp._tool_manager._tools["list_drafts"].fn
+
+        result = list_drafts()
+
+        assert result["success"] is True
+        assert [d["draft_id"] for d in result["drafts"]] == ["draft002"]
+        assert result["drafts"][0]["message_id"] == "msg002"
+        assert mock_service.new_batch_http_request.call_count == 1
+        calls = mock_service.users().messages().get.call_args_list
+        assert [c.kwargs["id"] for c in calls] == ["msg001", "msg002"]
+        assert all(c.kwargs["metadataHeaders"] == ["To", "Subject", "Date"] for c in calls)
+        assert all(c.kwargs["fields"] == "id,snippet,payload/headers" for c in calls)
+
     @patch("gmail_mcp.mcp.tools.email_drafts.get_credentials")
     def test_list_drafts_not_authenticated(self, mock_get_credentials):
         """Test list_drafts when not authenticated."""
@@ -176,6 +274,32 @@ class TestListDrafts:
         assert len(result["drafts"]) == 0
         assert "No drafts found" in result["message"]
 
+    @patch("gmail_mcp.mcp.tools.email_drafts.AuthorizedHttp")
+    @patch("gmail_mcp.mcp.tools.email_drafts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.email_drafts.get_gmail_service")
+    def test_list_drafts_fetches_individually_when_batch_fails(
+        self, mock_get_service, mock_get_credentials, mock_http
+    ):
+        """Test that draft messages are fetched concurrently when the batch request fails."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_credentials.return_value = Mock()
+        mock_service = create_mock_gmail_service()
+        mock_service.new_batch_http_request.side_effect = None
+        mock_service.new_batch_http_request.return_value.execute.side_effect = Exception("batch unavailable")
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        list_drafts = mcp._tool_manager._tools["list_drafts"].fn
+
+        result = list_drafts()
+
+        assert result["success"] is True
+        assert [d["draft_id"] for d in result["drafts"]] == ["draft001", "draft002"]
+        assert mock_http.call_count == 2
+
 
 class TestGetDraft:
     """Tests for get_draft tool."""
@@ -210,6 +334,35 @@ class TestGetDraft:
         assert result["to"] == "recipient@example.com"
         assert "This is the draft body content" in result["body"]
 
+    @patch("gmail_mcp.mcp.tools.email_drafts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.email_drafts.get_gmail_service")
+    def test_get_draft_cached_until_updated(self, mock_get_service, mock_get_credentials):
+        """Test that repeated get_draft calls are served from cache and update_draft invalidates it."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_credentials.return_value = Mock()
+        service = create_mock_gmail_service()
+        service.users().drafts().get = MagicMock(wraps=service.users().drafts().get)
+        mock_get_service.return_value = service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        tools = {tool.name: tool.fn for tool in mcp._tool_manager._tools.values()}
+
+        first = tools["get_draft"](draft_id="draft001")
+        second = tools["get_draft"](draft_id="draft001")
+
+        assert first == second
+        full_gets = [c for c in service.users().drafts().get.call_args_list if c.kwargs.get("format") == "full"]
+        assert len(full_gets) == 1
+
+        tools["update_draft"](draft_id="draft001", subject="Changed")
+        tools["get_draft"](draft_id="draft001")
+
+        full_gets = [c for c in service.users().drafts().get.call_args_list if c.kwargs.get("format") == "full"]
+        assert len(full_gets) == 2
+
     @patch("gmail_mcp.mcp.tools.email_drafts.get_credentials")
     def test_get_draft_not_authenticated(self, mock_get_credentials):
         """Test get_draft when not authenticated."""
@@ -338,6 +491,60 @@ class TestUpdateDraft:
         assert result["success"] is False
         assert "Not authenticated" in result["error"]
 
+    @patch("gmail_mcp.mcp.tools.email_drafts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.email_drafts.get_gmail_service")
+    def test_update_draft_headers_keeps_raw_body(self, mock_get_service, mock_get_credentials):
+        """Test that a header-only update splices headers into the raw draft."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_credentials.return_value = Mock()
+        mock_service = create_mock_gmail_service()
+        mock_service.users().drafts().update = MagicMock(wraps=mock_service.users().drafts().update)
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        update_draft = mcp._tool_manager._tools["update_draft"].fn
+
+        result = update_draft(draft_id="draft001", subject="Updated Subject", cc="cc@example.com")
+
+        assert result["success"] is True
+        raw = mock_service.users().drafts().update.call_args.kwargs["body"]["message"]["raw"]
+        sent = base64.urlsafe_b64decode(raw)
+        assert b"Subject: Updated Subject" in sent
+        assert b"Test Draft Subject" not in sent
+        assert b"Cc: cc@example.com" in sent
+        assert b"To: recipient@example.com" in sent
+        assert sent.endswith(b"\r\n\r\nThis is the draft body content.\r\n")
+        assert b"multipart" not in sent
+
+    @patch("gmail_mcp.mcp.tools.email_drafts.get_credentials")
+    @patch("gmail_mcp.mcp.tools.email_drafts.get_gmail_service")
+    def test_update_draft_returns_sent_content(self, mock_get_service, mock_get_credentials):
+        """Test that the updated draft is described from the sent message without refetching it."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_credentials.return_value = Mock()
+        mock_service = create_mock_gmail_service()
+        mock_service.users().drafts().get = MagicMock(wraps=mock_service.users().drafts().get)
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        update_draft = mcp._tool_manager._tools["update_draft"].fn
+
+        result = update_draft(draft_id="draft001", subject="Réunion", body="New body content here")
+
+        assert result["success"] is True
+        assert result["draft_id"] == "draft001"
+        assert result["message_id"] == "msg001"
+        assert result["to"] == "recipient@example.com"
+        assert result["subject"] == "Réunion"
+        assert result["body"] == "New body content here"
+        assert mock_service.users().drafts().get.call_count == 1
+
 
 class TestDeleteDraft:
     """Tests for delete_draft tool."""
@@ -391,3 +598,137 @@ class TestDeleteDraft:
 
         assert result["success"] is False
         assert "Not authenticated" in result["error"]
+
+
+class TestExtractHeaders:
+    """Tests for _extract_headers helper function."""
+
+    def test_keeps_only_wanted_headers(self):
+        """Test that unwanted headers are skipped and a repeated header keeps its last value."""
+        from gmail_mcp.mcp.tools.email_drafts import _extract_headers
+
+        headers = [
+            {"name": "Received", "value": "by mx.example.com"},
+            {"name": "Subject", "value": "First"},
+            {"name": "TO", "value": "a@example.com"},
+            {"name": "subject", "value": "Second"},
+        ]
+
+        assert _extract_headers(headers, frozenset(("to", "subject"))) == {
+            "subject": "Second",
+            "to": "a@example.com",
+        }
+
+
+class TestBuildPlainMessage:
+    """Tests for _build_plain_message helper function."""
+
+    def test_short_body_is_8bit(self):
+        """Test that a body with short lines is sent 8bit with CRLF line endings."""
+        from gmail_mcp.mcp.tools.email_drafts import _build_plain_message
+
+        message = _build_plain_message({"To": "a@example.com", "Cc": ""}, "Hé\nyo")
+
+        head, _, body = message.partition(b"\r\n\r\n")
+        assert b"Content-Transfer-Encoding: 8bit" in head
+        assert b"Cc:" not in head
+        assert body == "Hé\r\nyo".encode("utf-8")
+
+    def test_long_line_is_quoted_printable(self):
+        """Test that a line over 998 octets switches the body to quoted-printable."""
+        import quopri
+
+        from gmail_mcp.mcp.tools.email_drafts import _build_plain_message
+
+        text = "word " * 300 + "café\nsecond line"
+        message = _build_plain_message({"To": "a@example.com"}, text)
+
+        head, _, body = message.partition(b"\r\n\r\n")
+        assert b"Content-Transfer-Encoding: quoted-printable" in head
+        assert max(len(line) for line in body.split(b"\r\n")) <= 76
+        assert quopri.decodestring(body.replace(b"\r\n", b"\n")).decode("utf-8") == text
+
+    def test_long_header_is_folded(self):
+        """Test that a long ASCII recipient list is folded onto continuation lines."""
+        from gmail_mcp.mcp.tools.email_drafts import _build_plain_message
+
+        to = ", ".join(f"person{i}@example.com" for i in range(12))
+        message = _build_plain_message({"To": to}, "Hi")
+
+        head = message.partition(b"\r\n\r\n")[0]
+        assert all(len(line) <= 78 for line in head.split(b"\r\n"))
+        assert head.replace(b"\r\n ", b" ").startswith(f"To: {to}\r\n".encode("ascii"))
+
+
+class TestParseDraftMessage:
+    """Tests for _parse_draft_message helper function."""
+
+    @staticmethod
+    def _part(mime_type, text):
+        return {"mimeType": mime_type, "body": {"data": base64.urlsafe_b64encode(text.encode()).decode()}}
+
+    def test_prefers_plain_after_html(self):
+        """Test that a later text/plain part wins over an earlier text/html part."""
+        from gmail_mcp.mcp.tools.email_drafts import _parse_draft_message
+
+        draft = {"id": "d1", "message": {"payload": {"parts": [
+            self._part("text/html", "<p>Hi</p>"),
+            self._part("text/plain", "Hi"),
+        ]}}}
+
+        assert _parse_draft_message(draft)["body"] == "Hi"
+
+    def test_finds_body_in_nested_parts(self):
+        """Test that bodies inside nested multipart/alternative parts are found."""
+        from gmail_mcp.mcp.tools.email_drafts import _parse_draft_message
+
+        draft = {"id": "d1", "message": {"payload": {"mimeType": "multipart/mixed", "parts": [
+            {"mimeType": "multipart/alternative", "body": {"size": 0}, "parts": [
+                self._part("text/html", "<p>Nested</p>"),
+            ]},
+            {"mimeType": "application/pdf", "filename": "a.pdf", "body": {"attachmentId": "att1"}},
+        ]}}}
+
+        assert _parse_draft_message(draft)["body"] == "<p>Nested</p>"
+
+
+class TestReplaceHeaders:
+    """Tests for _replace_headers helper function."""
+
+    def test_drops_folded_header_and_keeps_others(self):
+        """Test that a replaced header's continuation lines go with it and other bytes are kept."""
+        from gmail_mcp.mcp.tools.email_drafts import _replace_headers
+
+        raw = (
+            b"To: r@example.com\r\n"
+            b"Subject: Old\r\n"
+            b" folded\r\n"
+            b"X-Custom:  kept   as is\r\n"
+            b"\r\n"
+            b"body\r\n"
+        )
+
+        result = _replace_headers(raw, {"To": None, "Subject": "New", "Bcc": ""})
+
+        assert result == (
+            b"To: r@example.com\r\n"
+            b"X-Custom:  kept   as is\r\n"
+            b"Subject: New\r\n"
+            b"\r\n"
+            b"body\r\n"
+        )
+
+    def test_encodes_non_ascii_value(self):
+        """Test that non-ASCII values are written as encoded words."""
+        from gmail_mcp.mcp.tools.email_drafts import _replace_headers
+
+        result = _replace_headers(b"Subject: Old\r\n\r\nbody", {"Subject": "Résumé"})
+
+        assert result == b"Subject: =?utf-8?b?UsOpc3Vtw6k=?=\r\n\r\nbody"
+
+    def test_rejects_line_breaks(self):
+        """Test that header values with line breaks are refused."""
+        from gmail_mcp.mcp.tools.email_drafts import _replace_headers
+
+        with pytest.raises(ValueError):
+            _replace_headers(b"Subject: Old\r\n\r\nbody", {"Subject": "New\r\nBcc: x@example.com"})
@@ -2,8 +2,10 @@
 Tests for gmail/helpers.py
 """
 
+import base64
+
 import pytest
-from gmail_mcp.gmail.helpers import extract_email_info, extract_headers
+from gmail_mcp.gmail.helpers import extract_email_info, extract_headers, b64url_decode, find_body_data
 
 
 class TestExtractHeaders:
@@ -158,3 +160,50 @@ class TestExtractEmailInfo:
 
         info = extract_email_info(msg)
         assert info["email_link"] == "https://mail.google.com/mail/u/0/#inbox/thread789def"
+
+
+class TestB64UrlDecode:
+    """Tests for b64url_decode function."""
+
+    def test_matches_urlsafe_b64decode(self):
+        """Test that padded and unpadded base64url data decode like the stdlib."""
+        raw = "Draft body ~~~ with ??? url-unsafe bytes é".encode("utf-8")
+        encoded = base64.urlsafe_b64encode(raw).decode()
+
+        assert "-" in encoded or "_" in encoded
+        assert b64url_decode(encoded) == raw
+        assert b64url_decode(encoded.rstrip("=")) == raw
+
+
+class TestFindBodyData:
+    """Tests for find_body_data function."""
+
+    def test_single_part_payload(self):
+        """Test that a single-part payload returns its own body data."""
+        assert find_body_data({"body": {"data": "abc"}}) == "abc"
+
+    def test_prefers_plain_over_html(self):
+        """Test that a nested text/plain part wins over an earlier text/html part."""
+        payload = {
+            "parts": [
+                {"mimeType": "text/html", "body": {"data": "html"}},
+                {"mimeType": "multipart/alternative", "parts": [
+                    {"mimeType": "text/plain", "body": {"data": "plain"}},
+                ]},
+            ]
+        }
+        assert find_body_data(payload) == "plain"
+
+    def test_falls_back_to_html(self):
+        """Test that text/html is used when there is no text/plain part."""
+        payload = {"parts": [{"mimeType": "text/html", "body": {"data": "html"}}]}
+        assert find_body_data(payload) == "html"
+
+    def test_plain_only_skips_html(self):
+        """Test that plain_only ignores text/html parts."""
+        payload = {"parts": [{"mimeType": "text/html", "body": {"data": "html"}}]}
+        assert find_body_data(payload, plain_only=True) is None
+
+    def test_no_body(self):
+        """Test that a payload without text parts returns None."""
+        assert find_body_data({"parts": [{"mimeType": "image/png", "body": {}}]}) is None
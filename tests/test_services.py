@@ -16,7 +16,7 @@ class TestGetGmailService:
 
         # Reset cache
         services_module._gmail_service = None
-        services_module._credentials_hash = None
+        services_module._gmail_credentials_hash = None
 
         mock_service = MagicMock()
         mock_build.return_value = mock_service
@@ -37,7 +37,7 @@ class TestGetGmailService:
 
         # Reset cache
         services_module._gmail_service = None
-        services_module._credentials_hash = None
+        services_module._gmail_credentials_hash = None
 
         mock_service = MagicMock()
         mock_build.return_value = mock_service
@@ -63,7 +63,7 @@ class TestGetGmailService:
 
         # Reset cache
         services_module._gmail_service = None
-        services_module._credentials_hash = None
+        services_module._gmail_credentials_hash = None
 
         mock_service1 = MagicMock()
         mock_service2 = MagicMock()
@@ -99,7 +99,7 @@ class TestGetCalendarService:
 
         # Reset cache
         services_module._calendar_service = None
-        services_module._credentials_hash = None
+        services_module._calendar_credentials_hash = None
 
         mock_service = MagicMock()
         mock_build.return_value = mock_service
@@ -120,7 +120,7 @@ class TestGetCalendarService:
 
         # Reset cache
         services_module._calendar_service = None
-        services_module._credentials_hash = None
+        services_module._calendar_credentials_hash = None
 
         mock_service = MagicMock()
         mock_build.return_value = mock_service
@@ -139,6 +139,49 @@ class TestGetCalendarService:
         assert result1 is result2
 
 
+class TestGetPeopleService:
+    """Tests for get_people_service function."""
+
+    @patch("gmail_mcp.utils.services.build")
+    def test_returns_cached_people_service(self, mock_build):
+        """Test that the People service is built once and reused."""
+        import gmail_mcp.utils.services as services_module
+
+        mock_build.side_effect = lambda *args, **kwargs: MagicMock()
+
+        mock_creds = MagicMock()
+        mock_creds.token = "access_token"
+        mock_creds.refresh_token = "refresh_token"
+
+        result1 = services_module.get_people_service(mock_creds)
+        result2 = services_module.get_people_service(mock_creds)
+
+        mock_build.assert_called_once_with("people", "v1", credentials=mock_creds)
+        assert result1 is result2
+
+    @patch("gmail_mcp.utils.services.build")
+    def test_rebuilt_when_other_service_switches_credentials(self, mock_build):
+        """Test that another service rebuilding for new credentials doesn't leave People stale."""
+        import gmail_mcp.utils.services as services_module
+
+        mock_build.side_effect = lambda *args, **kwargs: MagicMock()
+
+        mock_creds1 = MagicMock()
+        mock_creds1.token = "token_1"
+        mock_creds1.refresh_token = "refresh_1"
+
+        mock_creds2 = MagicMock()
+        mock_creds2.token = "token_2"
+        mock_creds2.refresh_token = "refresh_2"
+
+        people1 = services_module.get_people_service(mock_creds1)
+        services_module.get_gmail_service(mock_creds2)
+        people2 = services_module.get_people_service(mock_creds2)
+
+        assert people2 is not people1
+        assert mock_build.call_args.kwargs["credentials"] is mock_creds2
+
+
 class TestClearServiceCache:
     """Tests for clear_service_cache function."""
 
@@ -149,7 +192,10 @@ class TestClearServiceCache:
         # Set some cache values
         services_module._gmail_service = MagicMock()
         services_module._calendar_service = MagicMock()
-        services_module._credentials_hash = 12345
+        services_module._people_service = MagicMock()
+        services_module._gmail_credentials_hash = 12345
+        services_module._calendar_credentials_hash = 12345
+        services_module._people_credentials_hash = 12345
 
         # Clear cache
         services_module.clear_service_cache()
@@ -157,7 +203,10 @@ class TestClearServiceCache:
         # All should be None
         assert services_module._gmail_service is None
         assert services_module._calendar_service is None
-        assert services_module._credentials_hash is None
+        assert services_module._people_service is None
+        assert services_module._gmail_credentials_hash is None
+        assert services_module._calendar_credentials_hash is None
+        assert services_module._people_credentials_hash is None
 
     @patch("gmail_mcp.utils.services.build")
     def test_new_service_created_after_clear(self, mock_build):
@@ -174,7 +223,7 @@ class TestClearServiceCache:
 
         # Reset and first call
         services_module._gmail_service = None
-        services_module._credentials_hash = None
+        services_module._gmail_credentials_hash = None
         result1 = services_module.get_gmail_service(mock_creds)
 
         # Clear cache
@@ -193,20 +242,20 @@ class TestCredentialsHash:
 
     def test_same_credentials_same_hash(self):
         """Test that same credentials produce same hash."""
-        from gmail_mcp.utils.services import _get_credentials_hash
+        from gmail_mcp.utils.services import get_credentials_hash
 
         mock_creds = MagicMock()
         mock_creds.token = "token_abc"
         mock_creds.refresh_token = "refresh_xyz"
 
-        hash1 = _get_credentials_hash(mock_creds)
-        hash2 = _get_credentials_hash(mock_creds)
+        hash1 = get_credentials_hash(mock_creds)
+        hash2 = get_credentials_hash(mock_creds)
 
         assert hash1 == hash2
 
     def test_different_tokens_different_hash(self):
         """Test that different tokens produce different hash."""
-        from gmail_mcp.utils.services import _get_credentials_hash
+        from gmail_mcp.utils.services import get_credentials_hash
 
         mock_creds1 = MagicMock()
         mock_creds1.token = "token_1"
@@ -216,7 +265,7 @@ class TestCredentialsHash:
         mock_creds2.token = "token_2"
         mock_creds2.refresh_token = "refresh_2"
 
-        hash1 = _get_credentials_hash(mock_creds1)
-        hash2 = _get_credentials_hash(mock_creds2)
+        hash1 = get_credentials_hash(mock_creds1)
+        hash2 = get_credentials_hash(mock_creds2)
 
         assert hash1 != hash2
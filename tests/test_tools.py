@@ -85,7 +85,7 @@ def create_mock_gmail_service():
     }
 
     # Mock users().messages().get() for single gets
-    def mock_get_message(userId, id, format=None):
+    def mock_get_message(userId, id, format=None, **kwargs):
         mock = MagicMock()
         if id == "msg001":
             mock.execute.return_value = SAMPLE_MESSAGE
@@ -103,22 +103,21 @@ def create_mock_gmail_service():
         batch._requests = []
         batch._callback = callback
 
-        def add_request(request, callback=None):
-            batch._requests.append((request, callback))
-
-        def execute_batch():
-            # Simulate batch execution by calling callbacks
-            for i, (request, cb) in enumerate(batch._requests):
-                # Get the message ID from the request
-                msg_id = f"msg00{i+1}"
-                if msg_id == "msg001":
-                    response = SAMPLE_MESSAGE
-                elif msg_id == "msg002":
-                    response = SAMPLE_MESSAGE_2
-                else:
-                    response = SAMPLE_MESSAGE
+        def add_request(request, callback=None, request_id=None):
+            if request_id is None:
+                request_id = str(len(batch._requests))
+            batch._requests.append((request, callback, request_id))
+
+        def execute_batch(http=None):
+            # Simulate batch execution by running each request and calling its callback
+            for request, cb, request_id in batch._requests:
+                try:
+                    response, exception = request.execute(), None
+                except Exception as e:
+                    response, exception = None, e
+                cb = cb or callback
                 if cb:
-                    cb(str(i), response, None)
+                    cb(request_id, response, exception)
 
         batch.add = add_request
         batch.execute = execute_batch
@@ -262,6 +261,53 @@ class TestSearchEmails:
         assert "Not authenticated" in result["error"]
 
 
+class TestGetEmailCount:
+    """Tests for get_email_count tool."""
+
+    @patch("gmail_mcp.mcp.tools.email_read.get_credentials")
+    @patch("gmail_mcp.mcp.tools.email_read.get_gmail_service")
+    def test_get_email_count_success(self, mock_get_service, mock_get_credentials):
+        """Test that counts come from the profile and INBOX label in one batch."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_credentials.return_value = Mock()
+        mock_service = create_mock_gmail_service()
+        mock_service.users().messages().list.reset_mock()
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        get_email_count = mcp._tool_manager._tools["get_email_count"].fn
+
+        result = get_email_count()
+
+        assert result == {
+            "email": "user@example.com",
+            "total_messages": 1000,
+            "inbox_messages": 50,
+            "inbox_unread": 10,
+        }
+        mock_service.users().messages().list.assert_not_called()
+
+    @patch("gmail_mcp.mcp.tools.email_read.get_credentials")
+    def test_get_email_count_not_authenticated(self, mock_get_credentials):
+        """Test get_email_count when not authenticated."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_credentials.return_value = None
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        get_email_count = mcp._tool_manager._tools["get_email_count"].fn
+
+        result = get_email_count()
+
+        assert result["success"] is False
+        assert "Not authenticated" in result["error"]
+
+
 class TestGetEmail:
     """Tests for get_email tool."""
 
@@ -296,6 +342,98 @@ class TestGetEmail:
         assert result["from"] == "sender@example.com"
         assert "email_link" in result
 
+    @patch("gmail_mcp.mcp.tools.email_read.get_credentials")
+    @patch("gmail_mcp.mcp.tools.email_read.get_gmail_service")
+    def test_get_email_cached_refreshes_labels(self, mock_get_service, mock_get_credentials):
+        """Test that a repeated get_email reuses the cached content and only re-reads labels."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_credentials.return_value = Mock()
+        mock_service = create_mock_gmail_service()
+        get_message = mock_service.users().messages().get
+
+        def get_or_labels(userId, id, format=None, **kwargs):
+            if format == "minimal":
+                request = MagicMock()
+                request.execute.return_value = {"labelIds": ["INBOX"]}
+                return request
+            return get_message(userId=userId, id=id, format=format, **kwargs)
+
+        mock_service.users().messages().get = MagicMock(side_effect=get_or_labels)
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        get_email = mcp._tool_manager._tools["get_email"].fn
+
+        first = get_email(email_id="msg001")
+        second = get_email(email_id="msg001")
+
+        formats = [c.kwargs.get("format") for c in mock_service.users().messages().get.call_args_list]
+        assert formats == ["full", "minimal"]
+        assert first["labels"] == ["INBOX", "UNREAD"]
+        assert second["labels"] == ["INBOX"]
+        assert second["body"] == first["body"]
+
+    @patch("gmail_mcp.mcp.tools.email_read.get_credentials")
+    @patch("gmail_mcp.mcp.tools.email_read.get_gmail_service")
+    def test_get_email_decodes_unpadded_non_utf8_body(self, mock_get_service, mock_get_credentials):
+        """Test that unpadded base64url bodies decode and invalid UTF-8 is replaced."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_credentials.return_value = Mock()
+        mock_service = create_mock_gmail_service()
+        message = {
+            **SAMPLE_MESSAGE,
+            "payload": {**SAMPLE_MESSAGE["payload"], "body": {"data": "Y2Fm6Q"}},  # b"caf\xe9", unpadded
+        }
+        mock_service.users().messages().get = lambda **kwargs: Mock(execute=Mock(return_value=message))
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        get_email = mcp._tool_manager._tools["get_email"].fn
+
+        result = get_email(email_id="msg001")
+
+        assert result["body"] == "caf\ufffd"
+
+    @patch("gmail_mcp.mcp.tools.email_read.get_credentials")
+    @patch("gmail_mcp.mcp.tools.email_read.get_gmail_service")
+    def test_get_email_nested_multipart_body(self, mock_get_service, mock_get_credentials):
+        """Test that the text/plain body is found inside nested multipart parts."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_credentials.return_value = Mock()
+        mock_service = create_mock_gmail_service()
+        message = {
+            **SAMPLE_MESSAGE,
+            "payload": {
+                "headers": SAMPLE_MESSAGE["payload"]["headers"],
+                "mimeType": "multipart/mixed",
+                "parts": [
+                    {"mimeType": "multipart/alternative", "body": {"size": 0}, "parts": [
+                        {"mimeType": "text/html", "body": {"data": "PHA-SGk8L3A-"}},  # "<p>Hi</p>"
+                        {"mimeType": "text/plain", "body": {"data": "SGk="}},  # "Hi"
+                    ]},
+                    {"mimeType": "text/plain", "filename": "notes.txt", "body": {"attachmentId": "att1"}},
+                ],
+            },
+        }
+        mock_service.users().messages().get = lambda **kwargs: Mock(execute=Mock(return_value=message))
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        get_email = mcp._tool_manager._tools["get_email"].fn
+
+        result = get_email(email_id="msg001")
+
+        assert result["body"] == "Hi"
+
     @patch("gmail_mcp.mcp.tools.email_read.get_credentials")
     def test_get_email_not_authenticated(self, mock_get_credentials):
         """Test get_email when not authenticated."""
@@ -319,6 +457,116 @@ class TestGetEmail:
         assert "Not authenticated" in result["error"]
 
 
+class TestBatchGetEmails:
+    """Tests for _batch_get_emails helper function."""
+
+    def test_requests_metadata_only(self):
+        """Test that messages are fetched as metadata with the listed headers."""
+        from gmail_mcp.mcp.tools.email_read import _batch_get_emails, LIST_EMAIL_HEADERS
+
+        service = create_mock_gmail_service()
+        service.users().messages().get = MagicMock(wraps=service.users().messages().get)
+
+        emails = _batch_get_emails(service, ["msg001", "msg002"])
+
+        assert [email["id"] for email in emails] == ["msg001", "msg002"]
+        assert emails[0]["subject"] == "Test Email"
+        for call in service.users().messages().get.call_args_list:
+            assert call.kwargs["format"] == "metadata"
+            assert call.kwargs["metadataHeaders"] == LIST_EMAIL_HEADERS
+            assert "payload/headers" in call.kwargs["fields"]
+
+    @patch("gmail_mcp.mcp.tools.email_read.AuthorizedHttp")
+    def test_multiple_batches_keep_order(self, mock_authorized_http):
+        """Test that IDs spanning several batches are fetched concurrently and returned in order."""
+        from gmail_mcp.mcp.tools.email_read import _batch_get_emails
+
+        service = create_mock_gmail_service()
+
+        def get_message(userId, id, **kwargs):
+            request = MagicMock()
+            request.execute.return_value = {"id": id, "threadId": f"thread-{id}"}
+            return request
+
+        service.users().messages().get = get_message
+        batch_sizes = []
+        create_batch = service.new_batch_http_request
+
+        def new_batch(callback=None):
+            batch = create_batch(callback=callback)
+            execute = batch.execute
+
+            def execute_and_record(http=None):
+                batch_sizes.append(len(batch._requests))
+                assert http is mock_authorized_http.return_value
+                execute(http=http)
+
+            batch.execute = execute_and_record
+            return batch
+
+        service.new_batch_http_request = new_batch
+        message_ids = [f"msg{i:03d}" for i in range(250)]
+
+        emails = _batch_get_emails(service, message_ids, credentials=Mock())
+
+        assert [email["id"] for email in emails] == message_ids
+        assert sorted(batch_sizes) == [50, 100, 100]
+
+    @patch("gmail_mcp.mcp.tools.email_read.time.sleep")
+    def test_rate_limited_messages_are_retried(self, mock_sleep):
+        """Test that only rate-limited messages are re-requested, keeping the original order."""
+        from googleapiclient.errors import HttpError
+        from gmail_mcp.mcp.tools.email_read import _batch_get_emails
+
+        service = create_mock_gmail_service()
+        requested = []
+
+        def get_message(userId, id, **kwargs):
+            requested.append(id)
+            request = MagicMock()
+            if id == "msg001" and requested.count(id) == 1:
+                request.execute.side_effect = HttpError(Mock(status=429), b"rateLimitExceeded")
+            elif id == "msg003":
+                request.execute.side_effect = HttpError(Mock(status=404), b"notFound")
+            else:
+                request.execute.return_value = {"id": id, "threadId": f"thread-{id}"}
+            return request
+
+        service.users().messages().get = get_message
+
+        emails = _batch_get_emails(service, ["msg001", "msg002", "msg003"])
+
+        assert [email["id"] for email in emails] == ["msg001", "msg002"]
+        assert requested == ["msg001", "msg002", "msg003", "msg001"]
+        mock_sleep.assert_called_once()
+
+    def test_duplicate_ids_each_get_a_slot(self):
+        """Test that a repeated message ID does not clash with itself in the batch."""
+        from gmail_mcp.mcp.tools.email_read import _batch_get_emails
+
+        service = create_mock_gmail_service()
+        request_ids = []
+        create_batch = service.new_batch_http_request
+
+        def new_batch(callback=None):
+            batch = create_batch(callback=callback)
+            add = batch.add
+
+            def add_and_record(request, callback=None, request_id=None):
+                request_ids.append(request_id)
+                add(request, callback=callback, request_id=request_id)
+
+            batch.add = add_and_record
+            return batch
+
+        service.new_batch_http_request = new_batch
+
+        emails = _batch_get_emails(service, ["msg002", "msg001", "msg002"])
+
+        assert [email["id"] for email in emails] == ["msg002", "msg001", "msg002"]
+        assert request_ids == ["0", "1", "2"]
+
+
 class TestGetEmailOverview:
     """Tests for get_email_overview tool."""
 
@@ -345,6 +593,7 @@ class TestGetEmailOverview:
 
         assert get_email_overview is not None
 
+        mock_service.users().labels().list.reset_mock()
         result = get_email_overview()
 
         assert "error" not in result
@@ -356,6 +605,33 @@ class TestGetEmailOverview:
         assert result["account"]["email"] == "user@example.com"
         assert result["account"]["total_messages"] == 1000
 
+        # Label counts come from labels.get requests for the six counted labels
+        assert result["counts"] == {
+            "inbox": 50, "unread": 50, "sent": 50, "draft": 50, "spam": 50, "trash": 50,
+        }
+        mock_service.users().labels().list.assert_not_called()
+
+    @patch("gmail_mcp.mcp.tools.email_read.get_credentials")
+    @patch("gmail_mcp.mcp.tools.email_read.get_gmail_service")
+    def test_get_email_overview_batch_error(self, mock_get_service, mock_get_credentials):
+        """Test that a failed request in the overview batch is reported as an error."""
+        from gmail_mcp.mcp.tools import setup_tools
+        from mcp.server.fastmcp import FastMCP
+
+        mock_get_credentials.return_value = Mock()
+        mock_service = create_mock_gmail_service()
+        mock_service.users().getProfile().execute.side_effect = Exception("profile unavailable")
+        mock_get_service.return_value = mock_service
+
+        mcp = FastMCP(name="Test")
+        setup_tools(mcp)
+        get_email_overview = mcp._tool_manager._tools["get_email_overview"].fn
+
+        result = get_email_overview()
+
+        assert result["success"] is False
+        assert "profile unavailable" in result["error"]
+
     @patch("gmail_mcp.mcp.tools.email_read.get_credentials")
     def test_get_email_overview_not_authenticated(self, mock_get_credentials):
         """Test get_email_overview when not authenticated."""